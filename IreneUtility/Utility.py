@@ -66,7 +66,11 @@ class Utility:
         self.cache = u_local_cache.Cache(*util_args)  # instance for loaded cache
         self.temp_patrons_loaded = False
         self.running_loop = None  # current asyncio running loop
-        # self.thread_pool = None  # ThreadPoolExecutor for operations that block the event loop.
+        # shared executors for operations that block the event loop. They are created on first use.
+        self.thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None  # blocking I/O
+        self.process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None  # CPU-bound work
+        self.thread_pool_queue = 0  # amount of functions waiting on or running in the thread pool
+        self.process_pool_queue = 0  # amount of functions waiting on or running in the process pool
         self.keys: models.Keys = keys  # access to keys file
         self.spotify_client: Optional[spotify.SpotifyClient] = None if not self.keys else self.__create_spotify_client()
 
@@ -110,6 +114,10 @@ class Utility:
         self.u_unscramblegame = util.u_unscramblegame.UnScrambleGame(*util_args)
         self.u_vlive = util.u_vlive.Vlive(*util_args)
         self.u_music = util.u_music.Music(*util_args)
+        self.u_counters = util.u_counters.Counters(*util_args)
+        self.u_notifications = util.u_notifications.Notifications(*util_args)
+        self.u_router = util.u_router.Router(*util_args)
+        self.u_game_results = util.u_gameresults.GameResults(*util_args)
 
         # ensure that any models needed methods from this instance can do so without circular import problems.
         models.base_util.ex = self
@@ -264,11 +272,8 @@ class Utility:
         if not server_id and not interaction:
             server_id = await Utility.get_server_id(ctx)
             interaction = ctx.command.name
-        interactions = await self.u_miscellaneous.get_disabled_server_interactions(server_id)
-        if not interactions:
-            return True
-        interaction_list = interactions.split(',')
-        if interaction in interaction_list:
+        interactions = self.cache.disabled_interactions.get(server_id)
+        if interactions and interaction in interactions:
             # normally we would alert the user that the command is disabled, but discord.py uses this function.
             return False
         return True
@@ -461,30 +466,35 @@ class Utility:
         await ctx.send(msg)
 
     @staticmethod
-    async def replace(text: str, inputs_to_change: list) -> str:
+    def get_replacements(inputs_to_change: list) -> dict:
         """
-        Replace custom text from language packs for several keywords at once.
-        :param text: The text that requires replacing.
+        Convert the keywords to replace into a dict for rendering message templates.
         :param inputs_to_change: A list of lists with the 0th index as the keyword to replace, and the 1st index
         as the content.
-        :return: string with proper input.
+        :return: {keyword: content}
         """
         # convert the input to a list of lists if it is not already.
         if not isinstance(inputs_to_change[0], list):
             inputs_to_change = [[inputs_to_change[0], inputs_to_change[1]]]
 
-        # custom input is always surrounded by curly braces {} unless mentioning a user.
-        for input_list in inputs_to_change:
-            await asyncio.sleep(0)  # bare yield to not block main thread
+        replacements = {}
+        for keyword, custom_input in inputs_to_change:
             # make sure braces do not already exist in the input
-            keyword = input_list[0]
-            custom_input = str(input_list[1])
+            keyword = keyword.replace("{", "").replace("}", "")
+            replacements.setdefault(keyword, str(custom_input))
+        return replacements
 
-            keyword = keyword.replace("{", "")
-            keyword = keyword.replace("}", "")
-            text = text.replace("{" + keyword + "}", custom_input)
-
-        return text
+    @staticmethod
+    async def replace(text: str, inputs_to_change: list) -> str:
+        """
+        Replace custom text from language packs for several keywords at once.
+        :param text: The text that requires replacing.
+        :param inputs_to_change: A list of lists with the 0th index as the keyword to replace, and the 1st index
+        as the content.
+        :return: string with proper input.
+        """
+        # custom input is always surrounded by curly braces {} unless mentioning a user.
+        return models.MessageTemplate.from_text(text).render(Utility.get_replacements(inputs_to_change))
 
     async def get_msg(self, user, module, keyword, inputs_to_change: list = None) -> str:
         """Get a msg from a user's language.
@@ -504,11 +514,13 @@ class Utility:
         if not isinstance(user, self.u_objects.User):
             user = await self.get_user(user)
 
-        msg = self.cache.languages[user.language][module][keyword]
+        template = self.cache.language_templates.get((user.language, module, keyword))
+        if not template:
+            template = models.MessageTemplate.from_text(self.cache.languages[user.language][module][keyword])
 
         if inputs_to_change:
-            msg = await self.replace(msg, inputs_to_change)
-        return msg
+            return template.render(self.get_replacements(inputs_to_change))
+        return template.text
 
     def get_unique_command(self, cog_name, command_name, language="en-us") -> models.Command:
         """
@@ -526,8 +538,81 @@ class Utility:
             if command.command_name == command_name:
                 return command
 
+    def get_thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Get the shared thread pool. The amount of workers is set by keys.thread_pool_workers."""
+        if not self.thread_pool:
+            max_workers = self.keys.thread_pool_workers if self.keys else None
+            self.thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        return self.thread_pool
+
+    def get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Get the shared process pool. The amount of workers is set by keys.process_pool_workers."""
+        if not self.process_pool:
+            max_workers = self.keys.process_pool_workers if self.keys else None
+            self.process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        return self.process_pool
+
+    def shutdown_executors(self, wait=True):
+        """Shut down the shared thread and process pools. They are recreated if they are needed again.
+
+        :param wait: Whether to wait for the functions that are already running to finish.
+        """
+        for pool in [self.thread_pool, self.process_pool]:
+            if pool:
+                pool.shutdown(wait=wait)
+        self.thread_pool = None
+        self.process_pool = None
+
+    async def shutdown(self, wait=True):
+        """Write everything that is waiting to be written to the DB and shut down the shared pools.
+
+        This should be awaited before the client is closed. Otherwise the pending counters and game results since
+        the last flush are lost.
+
+        :param wait: Whether to wait for the functions that are already running in the pools to finish.
+        """
+        if self.u_counters.flush_counters.is_running():
+            # the loop also flushes after it stops, the flush lock makes the second flush wait and do nothing.
+            self.u_counters.flush_counters.cancel()
+        await self.u_counters.flush()
+        await self.u_game_results.shutdown()
+        self.shutdown_executors(wait=wait)
+
+    async def __run_in_pool(self, process, funcs, args, kwargs) -> list:
+        """Run blocking functions concurrently in the shared thread pool or process pool.
+
+        :param process: Whether to run the functions in the process pool.
+        :param funcs: The function or list of [function, args, kwargs] to run.
+        :param args: The args to pass into a single function.
+        :param kwargs: The keyword args to pass into a single function.
+        :returns: List of results in the same order as the functions.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self.get_process_pool() if process else self.get_thread_pool()
+
+        async def run(callable_function, func_args, func_kwargs):
+            if process:
+                self.process_pool_queue += 1
+            else:
+                self.thread_pool_queue += 1
+            try:
+                return await loop.run_in_executor(pool, functools.partial(callable_function, *func_args,
+                                                                          **func_kwargs))
+            finally:
+                if process:
+                    self.process_pool_queue -= 1
+                else:
+                    self.thread_pool_queue -= 1
+
+        if not isinstance(funcs, list):
+            funcs = [[funcs, args, kwargs]]
+
+        results = await asyncio.gather(*[run(*func) for func in funcs if callable(func[0])])
+        log.useless(f'{"Process" if process else "Thread"} Pool -> {funcs}', method=self.run_blocking_code)
+        return list(results)
+
     async def run_blocking_code(self, funcs, *args, **kwargs) -> list:
-        """Run blocking code safely in a new thread.
+        """Run blocking code safely in the shared thread pool.
 
         DO NOT pass in an asynchronous function. If an asynchronous function has blocking code, the event loop will
         also block. There were several attempts made to make it compatible with asynchronous functions, but it was a
@@ -538,35 +623,37 @@ class Utility:
             with the 0th index as the callable function,
             the 1st index as the args for that function,
             and the 2nd index as the kwargs for that function.
+            A list of functions is run concurrently.
         :param args: The args to pass into the blocking function.
         :param kwargs: The keyword args to pass into the blocking function.
-        :returns: List of results in no particular order. Make sure the output can be managed with no specific order.
+        :returns: List of results in the same order as the functions.
         """
-        loop = asyncio.get_running_loop()
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as pool:
-                results = []  # a list of results
-                if not isinstance(funcs, list):
-                    funcs = [[funcs, args, kwargs]]
-
-                for func in funcs:
-                    callable_function = func[0]
-                    func_args = func[1]
-                    func_kwargs = func[2]
-                    if callable(callable_function):
-                        results.append(await loop.run_in_executor(pool, functools.partial(callable_function,
-                                                                                          *func_args, **func_kwargs)))
-
-                log.useless(f'Custom Thread Pool -> {func}', method=self.run_blocking_code)
-
-                return results
-
+            return await self.__run_in_pool(False, funcs, args, kwargs)
         except AttributeError as e:
             log.console(f"{e} (AttributeError)", method=self.run_blocking_code, event_loop=self.client.loop)
         except Exception as e:
             log.console(f"{e} (Exception)", method=self.run_blocking_code, event_loop=self.client.loop)
         return []
 
+    async def run_cpu_bound_code(self, funcs, *args, **kwargs) -> list:
+        """Run CPU-bound code (ex: image compositing) in the shared process pool.
+
+        The functions, args, and results must be picklable, so the functions must be defined at the module level
+        and must not rely on Utility.
+
+        :param funcs: The function that needs to be called or a list of functions in the same format as
+            run_blocking_code. A list of functions is run concurrently.
+        :param args: The args to pass into the function.
+        :param kwargs: The keyword args to pass into the function.
+        :returns: List of results in the same order as the functions.
+        """
+        try:
+            return await self.__run_in_pool(True, funcs, args, kwargs)
+        except Exception as e:
+            log.console(f"{e} (Exception)", method=self.run_cpu_bound_code, event_loop=self.client.loop)
+        return []
+
     async def download_image(self, link, file_loc):
         """Download an image.
 
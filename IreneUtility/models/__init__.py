@@ -31,6 +31,12 @@ from .gachavalue import GachaValues
 from .keys import Keys
 from .image import Image
 from .command import Command
+from .phrasematcher import PhraseMatcher
+from .fuzzyindex import FuzzyIndex
+from .idolindex import IdolIndex
+from .weightedsampler import WeightedSampler
+from .messagetemplate import MessageTemplate
+from .feature import ChannelFeature, GuildFeature
 from .playingcard import PlayingCard
 from .guessinggame import GuessingGame
 from .unscramblegame import UnScrambleGame
@@ -64,8 +64,7 @@ class BiasGame(Game_Base):
 
     async def generate_brackets(self):
         """Generates the brackets and the idols going against each other"""
-        idol_selection = self.ex.cache.gender_selection.get(self.gender)
-        idol_selection = [idol for idol in idol_selection if idol.thumbnail]
+        idol_selection = self.ex.u_group_members.get_idol_index().get_pool(self.gender, thumbnail=True)
         self.original_idols_in_game = random.sample(idol_selection, 2 * self.bracket_size)
 
         even_idols = self.original_idols_in_game[::2]
@@ -97,8 +96,8 @@ Remaining Idols: {self.number_of_idols_left}
 {first_idol_group} ({first_idol.stage_name}) **VS** {second_idol_group} ({second_idol.stage_name})
                         """
             display_name = f"{first_idol.stage_name} VS {second_idol.stage_name}.png"
-            file_location = await self.ex.u_bias_game.create_bias_game_image(first_idol.id, second_idol.id)
-            image_file = discord.File(fp=file_location, filename=display_name)
+            image_bytes = await self.ex.u_bias_game.create_bias_game_image(first_idol.id, second_idol.id)
+            image_file = discord.File(fp=image_bytes, filename=display_name)
             msg = await self.channel.send(msg_body, file=image_file)
             await msg.add_reaction(self.ex.keys.previous_emoji)  # left arrow by default
             await msg.add_reaction(self.ex.keys.next_emoji)  # right arrow by default
@@ -121,25 +120,15 @@ Remaining Idols: {self.number_of_idols_left}
 
     async def print_winner(self):
         msg_body = f"> The winner is {self.bracket_winner.stage_name}."
-        file_location = await self.ex.u_bias_game.create_bias_game_bracket(
+        image_bytes = await self.ex.u_bias_game.create_bias_game_bracket(
             self.all_brackets_together, self.host_id, self.bracket_winner)
 
-        image_file = discord.File(fp=file_location, filename=f"{self.host_id}.png")
+        image_file = discord.File(fp=image_bytes, filename=f"{self.host_id}.png")
         await self.channel.send(msg_body, file=image_file)
 
     async def update_user_wins(self):
         if self.bracket_winner:
-            wins = self.ex.first_result(await self.ex.conn.fetchrow(
-                "SELECT wins FROM biasgame.winners WHERE userid = $1 AND idolid = $2",
-                self.host_id, self.bracket_winner.id))
-            if wins:
-                await self.ex.conn.execute(
-                    "UPDATE biasgame.winners SET wins = $1 WHERE userid = $2 AND idolid = $3",
-                    wins + 1, self.host_id, self.bracket_winner.id)
-            else:
-                await self.ex.conn.execute(
-                    "INSERT INTO biasgame.winners(idolid, userid, wins) VALUES ($1, $2, $3)",
-                    self.bracket_winner.id, self.host_id, 1)
+            await self.ex.u_game_results.add_bias_game_win(self.host_id, self.bracket_winner.id)
 
     async def process_game(self):
         """Process bias guessing game by sending messages and new questions until the game should end."""
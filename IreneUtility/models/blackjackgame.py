@@ -18,7 +18,7 @@ class BlackJackGame(Game_Base):
         """
         super().__init__(*args)
         self.first_player: User = first_player
-        self.second_player: Optional[User] = None
+        self._second_player: Optional[User] = None
 
         self.first_player.in_currency_game = True  # set first person to be in a game.
 
@@ -41,6 +41,34 @@ class BlackJackGame(Game_Base):
 
         self.bust_value = 21
 
+        self.ex.u_blackjack.add_game(self)
+
+    @property
+    def second_player(self) -> Optional[User]:
+        return self._second_player
+
+    @second_player.setter
+    def second_player(self, second_player: Optional[User]):
+        """Set the second player and index them so that u_blackjack.find_game can find them."""
+        if self._second_player and self.ex.cache.blackjack_players.get(self._second_player.id) is self:
+            self.ex.cache.blackjack_players.pop(self._second_player.id)
+        self._second_player = second_player
+        if second_player and not self.force_ended:
+            self.ex.cache.blackjack_players[second_player.id] = self
+
+    def add_second_player(self, second_player: User, second_player_ctx, second_player_bet: int):
+        """
+        Let a second player join the game.
+
+        :param second_player: The Utility User object of the second player.
+        :param second_player_ctx: Context of the second player.
+        :param second_player_bet: Amount the second player bet.
+        """
+        self.second_player = second_player
+        self.second_player_ctx = second_player_ctx
+        self.second_player_bet = second_player_bet
+        self.second_player.in_currency_game = True
+
     async def check_message(self):
         """Check incoming messages in the text channel and determines if the player wants to hit or stand."""
         if self.force_ended:
@@ -52,9 +80,7 @@ class BlackJackGame(Game_Base):
 
         def check_player_response(message):
             """Checks if it is a player's response and filters."""
-            if message.channel != self.channel:
-                return False
-            elif message.content.lower() in stop_phrases:
+            if message.content.lower() in stop_phrases:
                 return True
             elif message.content.lower() in hit_phrases or message.content.lower() in stand_phrases:
                 return True
@@ -62,7 +88,7 @@ class BlackJackGame(Game_Base):
                 return False
 
         try:
-            msg = await self.ex.client.wait_for('message', check=check_player_response, timeout=60)
+            msg = await self.ex.u_router.wait_for_message(self.channel.id, check_player_response, timeout=60)
             await msg.add_reaction(self.ex.keys.check_emoji)
             if msg.content.lower() in stop_phrases:
                 await self.end_game()
@@ -94,11 +120,7 @@ class BlackJackGame(Game_Base):
         if self.force_ended:
             await self.channel.send(await self.ex.get_msg(self.host_id, 'biasgame', 'force_closed'))
         self.force_ended = True
-        try:
-            self.ex.cache.blackjack_games.remove(self)
-        except Exception as e:
-            log.useless(f"{e} (Exception) - Could not find the BlackJack Game to remove from cache.",
-                        method=BlackJackGame.end_game)
+        self.ex.u_blackjack.remove_game(self)
         return True
 
     async def hit(self, first_player=True):
@@ -156,11 +178,11 @@ class BlackJackGame(Game_Base):
         return self.first_player_stand if first_player else self.second_player_stand
 
     async def choose_random_card(self) -> PlayingCard:
-        """Chooses a random card that is available in the deck."""
+        """Chooses a random card that is available in the deck. The card is rendered if it was never used before."""
         random_card_id = random.choice(self.deck)
 
         # choose a custom playing card from the card id
-        random_card = random.choice(self.ex.cache.playing_cards[random_card_id])
+        random_card = await self.ex.u_blackjack.get_random_card(random_card_id)
 
         # remove card if from deck so it is never accessed again
         self.deck.remove(random_card_id)
@@ -0,0 +1,21 @@
+from enum import IntFlag
+
+
+class ChannelFeature(IntFlag):
+    """Features a text channel has that need to be checked when a message is sent in it."""
+    NONE = 0
+    TEMP_CHANNEL = 1  # messages are deleted after a delay.
+    LOGGED = 2  # messages are logged.
+    SELF_ASSIGN_ROLES = 4  # messages are used to assign roles.
+    RESTRICTED_PHOTOS = 8  # idol photos are restricted or only sent here.
+    GAMES_DISABLED = 16  # games can not be played.
+
+
+class GuildFeature(IntFlag):
+    """Features a guild has that need to be checked when a message is sent in it."""
+    NONE = 0
+    LOGGED = 1  # the guild is being logged.
+    SELF_ASSIGN_ROLES = 2  # the guild has self-assignable roles.
+    CUSTOM_COMMANDS = 4  # the guild has custom commands.
+    USER_NOTIFICATIONS = 8  # users are notified of phrases said in the guild.
+    PHOTO_CHANNEL = 16  # idol photos must be sent to a specific channel.
@@ -0,0 +1,126 @@
+from collections import Counter
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+
+class FuzzyIndex:
+    """A typo tolerant name index.
+
+    Candidates are found by the trigrams they share with the search and then ranked by their Levenshtein distance,
+    so only a small amount of names are ever compared directly.
+    """
+    def __init__(self):
+        self.names: List[str] = []
+        self.entries: List[List[Tuple[object, Optional[int]]]] = []  # [[(value, server_id)]] in the order of names
+        self._name_positions: Dict[str, int] = {}  # {name: position in self.names}
+        self._trigram_counts: List[int] = []  # amount of trigrams of every name in the order of names
+        self._trigrams: Dict[str, List[int]] = {}  # {trigram: [name positions]}
+        self._lengths: Dict[int, List[int]] = {}  # {length of name: [name positions]}
+
+    def __len__(self):
+        return len(self.names)
+
+    @staticmethod
+    def get_trigrams(name: str) -> set:
+        """Get the trigrams of a name. The name is padded so that short names still have trigrams.
+
+        :param name: Lowercased name.
+        :returns: (set) The trigrams of the name.
+        """
+        padded = f"  {name} "
+        return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+    @staticmethod
+    def get_distance(first: str, second: str, max_distance: Optional[int] = None) -> int:
+        """Get the Levenshtein distance between two strings.
+
+        :param first: The first string.
+        :param second: The second string.
+        :param max_distance: Stop early and return max_distance + 1 once the distance is known to be larger.
+        :returns: (int) The amount of insertions, deletions, and substitutions needed.
+        """
+        if len(first) < len(second):
+            first, second = second, first
+        if max_distance is not None and len(first) - len(second) > max_distance:
+            return max_distance + 1
+
+        previous_row = list(range(len(second) + 1))
+        for first_index, first_char in enumerate(first, 1):
+            current_row = [first_index]
+            for second_index, second_char in enumerate(second, 1):
+                current_row.append(min(previous_row[second_index] + 1,
+                                       current_row[second_index - 1] + 1,
+                                       previous_row[second_index - 1] + (first_char != second_char)))
+            if max_distance is not None and min(current_row) > max_distance:
+                return max_distance + 1
+            previous_row = current_row
+        return previous_row[-1]
+
+    def add(self, name: str, value, server_id: Optional[int] = None):
+        """Add a name to the index.
+
+        :param name: The name to be found by.
+        :param value: The value to return when the name is a candidate.
+        :param server_id: The server id if the name should only be found in a single server.
+        """
+        if not name:
+            return
+        name = name.lower()
+        position = self._name_positions.get(name)
+        if position is None:
+            position = self._name_positions[name] = len(self.names)
+            self.names.append(name)
+            self.entries.append([])
+            trigrams = self.get_trigrams(name)
+            self._trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self._trigrams.setdefault(trigram, []).append(position)
+            self._lengths.setdefault(len(name), []).append(position)
+        self.entries[position].append((value, server_id))
+
+    def search(self, name: str, limit: int = 5, server_id: Optional[int] = None,
+               max_distance: Optional[int] = None) -> List[Tuple[object, int]]:
+        """Search for the values with names closest to a name.
+
+        :param name: The name to search for.
+        :param limit: The max amount of values to return.
+        :param server_id: The server id to also search the server names of.
+        :param max_distance: The max Levenshtein distance of a candidate.
+            Defaults to a fourth of the length of the name (between 1 and 3).
+        :returns: (List[Tuple[object, int]]) [(value, distance)] ranked from closest to furthest.
+        """
+        name = name.lower()
+        if max_distance is None:
+            max_distance = min(3, max(1, len(name) // 4))
+
+        trigrams = self.get_trigrams(name)
+        shared = Counter(chain.from_iterable(self._trigrams.get(trigram, ()) for trigram in trigrams))
+        if len(trigrams) <= 3 * max_distance:
+            # a short name can be close enough to names it does not share a trigram with,
+            # so every name of a similar length is a candidate.
+            for length in range(len(name) - max_distance, len(name) + max_distance + 1):
+                for position in self._lengths.get(length, ()):
+                    shared[position] += 0
+
+        best: Dict[int, Tuple[object, int]] = {}  # {id of the value: (value, distance)}
+        for position, amount in shared.most_common():
+            # every edit removes at most three trigrams, so names sharing less trigrams can not be close enough.
+            # candidates are ordered by the trigrams they share, so none of the remaining ones can be either.
+            if amount < len(trigrams) - 3 * max_distance:
+                break
+            if amount < self._trigram_counts[position] - 3 * max_distance:
+                continue
+            distance = self.get_distance(name, self.names[position], max_distance)
+            if distance > max_distance:
+                continue
+            for value, value_server_id in self.entries[position]:
+                if value_server_id is not None and value_server_id != server_id:
+                    continue
+                current = best.get(id(value))
+                if not current or current[1] > distance:
+                    best[id(value)] = (value, distance)
+            if len(best) >= limit:
+                # only candidates closer than the current results are useful from now on.
+                max_distance = sorted(value_distance[1] for value_distance in best.values())[limit - 1]
+
+        return sorted(best.values(), key=lambda value_distance: value_distance[1])[:limit]
@@ -1,5 +1,7 @@
 import discord
 
+from typing import Optional
+
 from . import Game as Game_Base
 import asyncio
 import random
@@ -31,6 +33,7 @@ class GuessingGame(Game_Base):
         self.idol = None
         self.group_names = None
         self.correct_answers = []
+        self.correct_answer_set = set()  # the same answers for checking messages.
         self.timeout = timeout
         self.max_rounds = max_rounds
         self.force_ended = False
@@ -52,6 +55,11 @@ class GuessingGame(Game_Base):
         self.results_posted = False
         self.api_issues = 0
 
+        # the idol of the next round and the task fetching its photo while the current round is played.
+        self.prefetch_idol = None
+        self.prefetch_task: Optional[asyncio.Task] = None
+        self.prefetch_attempts = 3
+
     async def credit_user(self, user_id):
         """Increment a user's score"""
         score = self.players.get(user_id)
@@ -68,21 +76,19 @@ class GuessingGame(Game_Base):
 
         def check_correct_answer(message):
             """Check if the user has the correct answer."""
-            if message.channel != self.channel:
-                return False
             msg_lower = message.content.lower()
-            if msg_lower in self.correct_answers:
+            if msg_lower in self.correct_answer_set:
                 return True
             if message.author.id == self.host_id:
                 return msg_lower in self.ex.cache.gg_msg_phrases
         try:
-            msg = await self.ex.client.wait_for('message', check=check_correct_answer, timeout=self.timeout)
+            msg = await self.ex.u_router.wait_for_message(self.channel.id, check_correct_answer, timeout=self.timeout)
             await msg.add_reaction(self.ex.keys.check_emoji)
             message_lower = msg.content.lower()
             if message_lower in self.ex.cache.skip_phrases:
                 await self.print_answer(question_skipped=True)
                 return
-            elif message_lower in self.correct_answers:
+            elif message_lower in self.correct_answer_set:
                 await self.credit_user(msg.author.id)
             elif message_lower in self.ex.cache.stop_phrases or self.force_ended:
                 self.force_ended = True
@@ -128,10 +134,12 @@ class GuessingGame(Game_Base):
                         
                     """
 
-                # Create random idol selection
-                if not self.idol_set:
-                    raise LookupError(f"No valid idols for the group {self.gender} and {self.difficulty}.")
-                self.idol = random.choice(self.idol_set)
+                # Use the idol of the prefetched photo or create a random idol selection.
+                self.idol, image_data = self.get_prefetched_image()
+                if not self.idol:
+                    if not self.idol_set:
+                        raise LookupError(f"No valid idols for the group {self.gender} and {self.difficulty}.")
+                    self.idol = random.choice(self.idol_set)
 
                 # Create acceptable answers
                 await self.create_acceptable_answers()
@@ -164,7 +172,7 @@ class GuessingGame(Game_Base):
                 try:
                     self.idol_post_msg, self.photo_link = await self.ex.u_group_members.idol_post(
                         self.channel, self.idol, user_id=self.host_id, guessing_game=True, scores=self.players,
-                        msg_timeout=self.timeout + 5)
+                        msg_timeout=self.timeout + 5, image_data=image_data)
                 except discord.Forbidden:
                     # end the game if unable to post in the channel.
                     log.console(f"Ending GG in {self.channel.id} since we cannot send a message to the channel.",
@@ -181,6 +189,61 @@ class GuessingGame(Game_Base):
                 log.console(f"{e} (Exception) - {self.channel.id}", method=self.create_new_question)
                 continue
 
+        # fetch the photo of the next round while this round is being played.
+        self.start_prefetch()
+
+    async def prefetch_image(self, idol):
+        """Fetch a photo of an idol for the next round. Failed requests are retried after a delay.
+
+        :param idol: (IreneUtility Idol object) The idol of the next round.
+        :returns: (dict) The response of fetch_idol_image or None if every attempt failed.
+        """
+        for attempt in range(1, self.prefetch_attempts + 1):
+            try:
+                image_data = await self.ex.u_group_members.fetch_idol_image(idol, guessing_game=True)
+                if image_data['status'] in [200, 301]:
+                    return image_data
+                log.useless(f"Prefetch for {idol.id} returned {image_data['status']} (attempt {attempt}).",
+                            method=self.prefetch_image)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.useless(f"{e} (Exception) - Prefetch for {idol.id} failed (attempt {attempt}).",
+                            method=self.prefetch_image)
+            await asyncio.sleep(attempt)
+
+    def start_prefetch(self):
+        """Choose the idol of the next round and start fetching its photo in the background."""
+        self.cancel_prefetch()
+        if self.force_ended or not self.idol_set or self.rounds + 1 >= self.max_rounds:
+            return
+        self.prefetch_idol = random.choice(self.idol_set)
+        self.prefetch_task = asyncio.create_task(self.prefetch_image(self.prefetch_idol))
+
+    def get_prefetched_image(self):
+        """Get the idol and photo that were prefetched for this round.
+
+        A prefetch that is still running (ex: retrying) is cancelled so the round does not wait for it.
+
+        :returns: (idol, image data) or (None, None) if there is no finished prefetch.
+        """
+        task, idol = self.prefetch_task, self.prefetch_idol
+        self.prefetch_task, self.prefetch_idol = None, None
+        if not task:
+            return None, None
+        if not task.done():
+            task.cancel()
+            return None, None
+        if task.cancelled() or task.exception() or not task.result():
+            return None, None
+        return idol, task.result()
+
+    def cancel_prefetch(self):
+        """Cancel the prefetch of the next round."""
+        if self.prefetch_task and not self.prefetch_task.done():
+            self.prefetch_task.cancel()
+        self.prefetch_task, self.prefetch_idol = None, None
+
     async def display_winners(self):
         """Displays the winners and their scores."""
         final_scores = ""
@@ -196,6 +259,7 @@ class GuessingGame(Game_Base):
 
         self.force_ended = True
         self.rounds = self.max_rounds
+        self.cancel_prefetch()
         if not self.host_user.gg_filter:
             # only update scores when there is no group filter on.
             await self.update_scores()
@@ -205,9 +269,7 @@ class GuessingGame(Game_Base):
 
     async def update_scores(self):
         """Updates all player scores"""
-        for user_id in self.players:
-            await self.ex.u_guessinggame.update_user_guessing_game_score(self.difficulty, user_id=user_id,
-                                                                         score=self.players.get(user_id))
+        await self.ex.u_game_results.add_guessing_game_scores(self.difficulty, self.players)
 
     async def print_answer(self, question_skipped=False, dead_link=False):
         """Prints the current round's answer."""
@@ -263,21 +325,12 @@ class GuessingGame(Game_Base):
                 self.correct_answers.append(group.name.lower())
                 for alias in group.aliases:
                     self.correct_answers.append(alias.lower())
+        self.correct_answer_set = set(self.correct_answers)
 
     async def create_idol_pool(self):
         """Create the game's idol pool."""
-        idol_gender_set = self.ex.cache.gender_selection.get(self.gender)
-        idol_difficulty_set = self.ex.cache.difficulty_selection.get(self.difficulty)
-        idol_filtered_set = set()
-        self.ex.cache.idols_female.update({idol for idol in self.ex.cache.idols if idol.gender == 'f'
-                                           and idol.photo_count})
-        if self.host_user.gg_filter:
-            for group in self.host_user.gg_groups:
-                idol_filtered_set.update(
-                    {await self.ex.u_group_members.get_member(idol_id) for idol_id in group.members})
-            self.idol_set = list(idol_gender_set & idol_difficulty_set & idol_filtered_set)
-        else:
-            self.idol_set = list(idol_gender_set & idol_difficulty_set)
+        group_ids = [group.id for group in self.host_user.gg_groups] if self.host_user.gg_filter else None
+        self.idol_set = self.ex.u_group_members.get_idol_index().get_pool(self.gender, self.difficulty, group_ids)
 
     async def process_game(self):
         """Ignores errors and continuously makes new questions until the game should end."""
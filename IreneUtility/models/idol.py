@@ -52,6 +52,9 @@ class Idol:
             file_loc = f"{base_util.ex.keys.idol_avatar_location}{file_name}"
             if base_util.ex.keys.image_host not in self.thumbnail:
                 await base_util.ex.download_image(self.thumbnail, file_loc)
+                # the avatar on disk was replaced, so the resized bias game tiles and playing cards are outdated.
+                base_util.ex.u_bias_game.invalidate_avatar(self.id)
+                await base_util.ex.u_blackjack.remove_lazy_cards(self.id)
                 if base_util.ex.check_file_exists(file_loc):
                     image_url = f"{base_util.ex.keys.image_host}avatar/{file_name}"
                     await base_util.ex.sql.s_groupmembers.set_member_thumbnail(self.id, image_url)
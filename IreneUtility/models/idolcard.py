@@ -17,7 +17,7 @@ class IdolCard:
     async def create_new_idol_card(user, idol=None,
                                    rap_skill=0, vocal_skill=0, dance_skill=0, card_rarity='common'):
         if not idol:
-            idol = base_util.ex.u_group_members.get_random_idol()
+            idol = await base_util.ex.u_group_members.get_random_idol()
         idol_card = base_util.ex.u_objects.IdolCard(idol, user)
         if not rap_skill:
             idol_card.rap_skill = rap_skill
@@ -0,0 +1,125 @@
+from itertools import compress
+from typing import Dict, List, Optional
+
+
+class IdolIndex:
+    """Bitsets of the idol attributes that game pools are filtered by.
+
+    Every idol gets a dense ordinal and every attribute is an int with the bit of that ordinal set for each idol that
+    has the attribute, so a pool is built with a few ANDs instead of intersecting sets of idols.
+    """
+    # difficulty keywords and the difficulties they include. Harder difficulties include the easier idols and
+    # None includes every idol.
+    difficulty_keywords = {
+        'easy': ['easy'],
+        'e': ['easy'],
+        'medium': ['easy', 'medium'],
+        'm': ['easy', 'medium'],
+        'hard': None,
+        'h': None,
+    }
+    # turns the binary string of a bitset into bytes of 0 and 1 that can be used as selectors.
+    binary_to_selectors = bytes.maketrans(b'01', b'\x00\x01')
+
+    def __init__(self, idols: Optional[list] = None):
+        """
+        :param idols: The Idol objects to index.
+        """
+        self.idols: list = []  # Idol objects in the order of their ordinal.
+        self.all = 0  # every idol.
+        self.photos = 0  # idols with photos.
+        self.thumbnails = 0  # idols with a thumbnail.
+        self.genders: Dict[str, int] = {}  # {gender: idols}
+        self.difficulties: Dict[str, int] = {}  # {difficulty: idols}
+        self.groups: Dict[int, int] = {}  # {group_id: idols}
+
+        for idol in idols or []:
+            self.add(idol)
+
+    def __len__(self):
+        return len(self.idols)
+
+    def add(self, idol):
+        """Add an idol to the index.
+
+        :param idol: Idol object.
+        """
+        bit = 1 << len(self.idols)
+        self.idols.append(idol)
+        self.all |= bit
+        if idol.photo_count:
+            self.photos |= bit
+        if idol.thumbnail:
+            self.thumbnails |= bit
+        self.genders[idol.gender] = self.genders.get(idol.gender, 0) | bit
+        self.difficulties[idol.difficulty] = self.difficulties.get(idol.difficulty, 0) | bit
+        for group_id in idol.groups:
+            self.groups[group_id] = self.groups.get(group_id, 0) | bit
+
+    def get_gender_mask(self, gender: str) -> int:
+        """Get the idols of a gender selection.
+
+        :param gender: 'female' or 'male' for the idols of that gender with photos, or 'all' for every idol.
+        :returns: (int) Bitset of the idols.
+        """
+        if gender == 'all':
+            return self.all
+        if gender in ('female', 'male'):
+            return self.genders.get(gender[0], 0) & self.photos
+        return 0
+
+    def get_difficulty_mask(self, difficulty: str) -> int:
+        """Get the idols with photos of a difficulty selection.
+
+        :param difficulty: The difficulty keyword (ex: 'easy' or 'e').
+        :returns: (int) Bitset of the idols.
+        """
+        if difficulty not in self.difficulty_keywords:
+            return 0
+        difficulty_names = self.difficulty_keywords[difficulty]
+        if difficulty_names is None:
+            return self.photos
+
+        mask = 0
+        for difficulty_name in difficulty_names:
+            mask |= self.difficulties.get(difficulty_name, 0)
+        return mask & self.photos
+
+    def get_group_mask(self, group_ids: List[int]) -> int:
+        """Get the idols that are in any of the groups.
+
+        :param group_ids: The group ids.
+        :returns: (int) Bitset of the idols.
+        """
+        mask = 0
+        for group_id in group_ids:
+            mask |= self.groups.get(group_id, 0)
+        return mask
+
+    def get_idols(self, mask: int) -> list:
+        """Get the idols of a bitset.
+
+        :param mask: Bitset of the idols.
+        :returns: (list) Idol objects in the order of their ordinal.
+        """
+        # the lowest bit is the first idol, so the binary string is reversed (without the '0b' prefix).
+        return list(compress(self.idols, bin(mask)[:1:-1].encode().translate(self.binary_to_selectors)))
+
+    def get_pool(self, gender: str = 'all', difficulty: Optional[str] = None, group_ids: Optional[List[int]] = None,
+                 thumbnail: bool = False) -> list:
+        """Get the idols that match a game's settings.
+
+        :param gender: The gender selection ('female', 'male', or 'all').
+        :param difficulty: The difficulty keyword. Any difficulty if None.
+        :param group_ids: Only idols in any of these groups if not None.
+        :param thumbnail: Only idols with a thumbnail.
+        :returns: (list) Idol objects.
+        """
+        mask = self.get_gender_mask(gender)
+        if difficulty is not None:
+            mask &= self.get_difficulty_mask(difficulty)
+        if group_ids is not None:
+            mask &= self.get_group_mask(group_ids)
+        if thumbnail:
+            mask &= self.thumbnails
+        return self.get_idols(mask)
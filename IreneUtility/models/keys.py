@@ -42,6 +42,8 @@ class Keys:
         # amount of idol photos a user can request daily without voting.
         self.idol_no_vote_send_limit: int = self.get_kwarg("idol_no_vote_send_limit")
         self.reminder_limit: int = self.get_kwarg("reminder_limit")  # maximum amount of reminders
+        # seconds between writing the idol call and command counters to the DB. (default 30)
+        self.counter_flush_interval: int = self.get_kwarg("counter_flush_interval")
         # maximum amount of automatic idol photos a non-patron can be sent
         self.idol_send_limit: int = self.get_kwarg("idol_send_limit")
         # twitter account limit for every server (for non-patrons)
@@ -136,6 +138,10 @@ class Keys:
         self.bias_game_location: str = self.get_kwarg("bias_game_location")  # Bias Game Location (slash at end)
         self.idol_photo_location: str = self.get_kwarg("idol_photo_location")  # Idol Photo Location (slash at end)
 
+        """Executors"""
+        self.thread_pool_workers: int = self.get_kwarg("thread_pool_workers")  # Max threads for blocking code
+        self.process_pool_workers: int = self.get_kwarg("process_pool_workers")  # Max processes for CPU-bound code
+
         """Twitch API"""
         self.twitch_client_id: str = self.get_kwarg("twitch_client_id")  # Twitch client id
         self.twitch_client_secret: str = self.get_kwarg("twitch_client_secret")  # Twitch client secret
@@ -0,0 +1,42 @@
+from typing import Dict, List
+import functools
+import re
+
+
+class MessageTemplate:
+    """A message with the positions of its {placeholders} located ahead of time so it can be rendered in one pass."""
+    placeholder_regex = re.compile(r"{([^{}]*)}")
+
+    def __init__(self, text: str):
+        """
+        :param text: The message with placeholders surrounded by curly braces.
+        """
+        self.text: str = text
+        # literal text at even indexes and placeholder names at odd indexes.
+        self.parts: List[str] = self.placeholder_regex.split(text)
+        self.placeholders: List[str] = self.parts[1::2]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def from_text(text: str):
+        """Get the template of a text. Templates are cached so the same text is only parsed once.
+
+        :param text: The message with placeholders surrounded by curly braces.
+        :returns: (MessageTemplate)
+        """
+        return MessageTemplate(text)
+
+    def render(self, inputs: Dict[str, str]) -> str:
+        """Replace the placeholders of the message.
+
+        :param inputs: {placeholder name: content}. Placeholders without content are left as they are.
+        :returns: (str) The rendered message.
+        """
+        if not self.placeholders or not inputs:
+            return self.text
+
+        parts = self.parts.copy()
+        for index in range(1, len(parts), 2):
+            content = inputs.get(parts[index])
+            parts[index] = "{" + parts[index] + "}" if content is None else content
+        return "".join(parts)
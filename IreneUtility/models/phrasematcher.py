@@ -0,0 +1,114 @@
+from typing import Dict, Set, List, Iterator, Tuple
+
+
+class PhraseMatcher:
+    """Finds every phrase that occurs in a text with a single pass over the text (Aho-Corasick).
+
+    Every phrase maps to a set of values (ex: the ids of the idols that are known by that phrase).
+    The automaton is rebuilt lazily on the next search after phrases are added or removed.
+    """
+    def __init__(self):
+        self.phrases: Dict[str, Set] = {}  # {phrase: {values}}
+
+        # automaton states. state 0 is the root.
+        self._transitions: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[str]] = [[]]  # phrases that end at a state, including those of the fail states.
+        self._dirty = False
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def __contains__(self, phrase):
+        return phrase in self.phrases
+
+    def add(self, phrase: str, value):
+        """Add a value to a phrase.
+
+        :param phrase: The phrase to match. Empty phrases are ignored.
+        :param value: The value to return when the phrase matches.
+        """
+        if not phrase:
+            return
+        values = self.phrases.get(phrase)
+        if values is None:
+            self.phrases[phrase] = {value}
+            self._dirty = True
+        else:
+            values.add(value)
+
+    def remove(self, phrase: str, value):
+        """Remove a value from a phrase. The phrase is removed once it no longer has values.
+
+        :param phrase: The phrase that was matched.
+        :param value: The value to remove.
+        """
+        values = self.phrases.get(phrase)
+        if values is None:
+            return
+        values.discard(value)
+        if not values:
+            self.phrases.pop(phrase)
+            self._dirty = True
+
+    def clear(self):
+        """Remove all phrases."""
+        self.phrases.clear()
+        self._dirty = True
+
+    def build(self):
+        """Build the automaton from the current phrases."""
+        transitions: List[Dict[str, int]] = [{}]
+        outputs: List[List[str]] = [[]]
+        for phrase in self.phrases:
+            state = 0
+            for char in phrase:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(transitions)
+                    transitions[state][char] = next_state
+                    transitions.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(phrase)
+
+        # breadth first so that the fail state of a state is always resolved before the state itself.
+        fail = [0] * len(transitions)
+        queue = list(transitions[0].values())
+        for state in queue:
+            for char, next_state in transitions[state].items():
+                fail_state = fail[state]
+                while fail_state and char not in transitions[fail_state]:
+                    fail_state = fail[fail_state]
+                fail[next_state] = transitions[fail_state].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+                queue.append(next_state)
+
+        self._transitions, self._fail, self._outputs = transitions, fail, outputs
+        self._dirty = False
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Iterate over every occurrence of a phrase in a text.
+
+        :param text: The text to search.
+        :returns: (Iterator) (start index, phrase) for every occurrence, ordered by where the occurrence ends.
+        """
+        if self._dirty:
+            self.build()
+
+        transitions, fail, outputs = self._transitions, self._fail, self._outputs
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+            for phrase in outputs[state]:
+                yield index - len(phrase) + 1, phrase
+
+    def search(self, text: str) -> Dict[str, Set]:
+        """Find every phrase that occurs in a text.
+
+        :param text: The text to search.
+        :returns: (dict) {phrase: {values}} of the phrases that were found.
+        """
+        return {phrase: self.phrases[phrase] for _, phrase in self.iter_matches(text)}
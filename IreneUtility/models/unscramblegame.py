@@ -59,15 +59,13 @@ class UnScrambleGame(Game_Base):
 
         def check_correct_answer(message):
             """Check if the user has the correct answer."""
-            if message.channel != self.channel:
-                return False
             msg_lower = message.content.lower()
             if msg_lower == self.correct_answer.lower():
                 return True
             if message.author.id == self.host_id:
                 return (msg_lower in self.ex.cache.stop_phrases) or (msg_lower in self.ex.cache.skip_phrases)
         try:
-            msg = await self.ex.client.wait_for('message', check=check_correct_answer, timeout=self.timeout)
+            msg = await self.ex.u_router.wait_for_message(self.channel.id, check_correct_answer, timeout=self.timeout)
             await msg.add_reaction(self.ex.keys.check_emoji)
             message_lower = msg.content.lower()
             if message_lower == self.correct_answer.lower():
@@ -165,10 +163,7 @@ class UnScrambleGame(Game_Base):
 
     async def update_scores(self):
         """Updates all player scores"""
-        for user_id in self.players:
-            await asyncio.sleep(0)  # bare yield
-            await self.ex.u_unscramblegame.update_user_unscramble_game_score(self.difficulty, user_id=user_id,
-                                                                             score=self.players.get(user_id))
+        await self.ex.u_game_results.add_unscramble_game_scores(self.difficulty, self.players)
 
     async def print_answer(self, skipped=False):
         """Prints the current round's answer."""
@@ -206,11 +201,7 @@ class UnScrambleGame(Game_Base):
 
     async def create_idol_pool(self):
         """Create the game's idol pool."""
-        idol_gender_set = self.ex.cache.gender_selection.get(self.gender)
-        idol_difficulty_set = self.ex.cache.difficulty_selection.get(self.difficulty)
-        self.ex.cache.idols_female.update({idol for idol in self.ex.cache.idols if idol.gender == 'f'
-                                           and idol.photo_count})
-        self.idol_set = list(idol_gender_set & idol_difficulty_set)
+        self.idol_set = self.ex.u_group_members.get_idol_index().get_pool(self.gender, self.difficulty)
 
     async def process_game(self):
         """Ignores errors and continuously makes new questions until the game should end."""
@@ -0,0 +1,64 @@
+from typing import List, Optional
+import random
+
+
+class WeightedSampler:
+    """Draws random items in O(1) with Vose's alias method.
+
+    Every slot holds an item, the probability of keeping it, and an alias item that is drawn otherwise,
+    so a draw never has to be retried no matter how uneven the weights are.
+    """
+    def __init__(self, items: list, weights: Optional[List[float]] = None):
+        """
+        :param items: The items to draw from.
+        :param weights: The weight of each item in the same order as the items. All items are equally likely if None.
+        """
+        self.items: list = list(items)
+        self.weights: Optional[List[float]] = list(weights) if weights is not None else None
+        self._probabilities: List[float] = []
+        self._aliases: List[int] = []
+        if self.weights is not None:
+            self.build()
+
+    def __len__(self):
+        return len(self.items)
+
+    def build(self):
+        """Build the probability and alias tables from the weights."""
+        amount = len(self.items)
+        total = sum(self.weights)
+        if not amount or total <= 0:
+            # nothing to weigh, so every item is equally likely.
+            self.weights = None
+            return
+
+        scaled = [weight * amount / total for weight in self.weights]
+        probabilities = [1.0] * amount
+        aliases = list(range(amount))
+        small = [index for index, weight in enumerate(scaled) if weight < 1]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1]
+        while small and large:
+            small_index, large_index = small.pop(), large.pop()
+            probabilities[small_index] = scaled[small_index]
+            aliases[small_index] = large_index
+            # the large item gives the rest of the small item's slot.
+            scaled[large_index] -= 1 - scaled[small_index]
+            if scaled[large_index] < 1:
+                small.append(large_index)
+            else:
+                large.append(large_index)
+        # whatever is left is 1 within floating point error.
+
+        self._probabilities, self._aliases = probabilities, aliases
+
+    def sample(self):
+        """Draw a random item.
+
+        :returns: A random item or None if there are no items.
+        """
+        if not self.items:
+            return None
+        index = random.randrange(len(self.items))
+        if self.weights is None or random.random() < self._probabilities[index]:
+            return self.items[index]
+        return self.items[self._aliases[index]]
@@ -1,3 +1,5 @@
+from typing import List
+
 from . import self
 
 
@@ -5,3 +7,21 @@ async def fetch_user_wins(user_id: int):
     """Fetch a user's bias game scores with the idol id to the score."""
     return await self.conn.fetch("SELECT idolid, wins FROM biasgame.winners WHERE userid = $1 ORDER BY WINS DESC",
                                  user_id)
+
+
+async def add_wins(user_ids: List[int], idol_ids: List[int], wins: List[int]):
+    """Add to the amount of times several idols won the bias games of users at once. Missing rows are inserted.
+
+    :param user_ids: The user ids.
+    :param idol_ids: The idol ids that won.
+    :param wins: The amount of wins to add to each user and idol.
+    """
+    await self.conn.execute("WITH input AS (SELECT * FROM UNNEST($1::bigint[], $2::int[], $3::int[]) "
+                            "AS t(userid, idolid, wins)), "
+                            "updated AS (UPDATE biasgame.winners w SET wins = COALESCE(w.wins, 0) + input.wins "
+                            "FROM input WHERE w.userid = input.userid AND w.idolid = input.idolid "
+                            "RETURNING w.userid, w.idolid) "
+                            "INSERT INTO biasgame.winners(idolid, userid, wins) "
+                            "SELECT input.idolid, input.userid, input.wins FROM input "
+                            "WHERE (input.userid, input.idolid) NOT IN (SELECT userid, idolid FROM updated)",
+                            user_ids, idol_ids, wins)
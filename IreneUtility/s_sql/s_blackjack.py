@@ -7,6 +7,11 @@ async def fetch_playing_cards():
                                  "blackjack.cardvalues v WHERE c.cardvalueid = v.id")
 
 
+async def fetch_card_values():
+    """Fetch the original playing cards. (id, name, value)"""
+    return await self.conn.fetch("SELECT id, name, value FROM blackjack.cardvalues")
+
+
 async def generate_playing_card(card_value_id, bg_idol_id) -> int:
     """
     Add a playing card and return the custom id.
@@ -29,6 +34,36 @@ async def generate_playing_card(card_value_id, bg_idol_id) -> int:
     return custom_id
 
 
+async def generate_playing_cards(card_value_ids, bg_idol_ids):
+    """
+    Add several playing cards in one query and return their custom ids.
+
+    The ids are taken from the table's sequence in the same statement, so the file name is set on insert instead of
+    with an update per card.
+
+    :param card_value_ids: Numbers from 1 to 52 that represent the custom cards.
+    :param bg_idol_ids: Idol IDs of the backgrounds in the same order as the card value ids.
+    :return: Records of (custom id, card value id, background idol id).
+    """
+    return await self.conn.fetch("INSERT INTO blackjack.playingcards(id, cardvalueid, bgidolid, filename) "
+                                 "SELECT t.id, t.cardvalueid, t.bgidolid, t.id || '.png' FROM "
+                                 "(SELECT nextval(pg_get_serial_sequence('blackjack.playingcards', 'id')) AS id, "
+                                 "input.cardvalueid, input.bgidolid FROM UNNEST($1::int[], $2::int[]) "
+                                 "AS input(cardvalueid, bgidolid)) t RETURNING id, cardvalueid, bgidolid",
+                                 card_value_ids, bg_idol_ids)
+
+
+async def delete_idol_playing_cards(bg_idol_ids):
+    """
+    Delete the custom playing cards of several idols.
+
+    :param bg_idol_ids: Idol IDs of the backgrounds.
+    :return: The file names of the deleted cards.
+    """
+    return [record[0] for record in await self.conn.fetch("DELETE FROM blackjack.playingcards WHERE "
+                                                          "bgidolid = ANY($1::int[]) RETURNING filename", bg_idol_ids)]
+
+
 async def delete_playing_cards():
     """Delete all custom playing cards from table."""
     await self.conn.execute("DELETE FROM blackjack.playingcards")
@@ -56,6 +56,39 @@ async def fetch_aliases(object_id, group=False):
                                  "WHERE objectid = $1 AND isgroup = $2", object_id, int(group))
 
 
+async def fetch_all_aliases(group=False):
+    """Fetch the global and server aliases of every idol or every group.
+
+    :param group: Whether to fetch the aliases of groups instead of idols.
+    """
+    return await self.conn.fetch("SELECT objectid, alias, serverid FROM groupmembers.aliases WHERE isgroup = $1",
+                                 int(group))
+
+
+async def fetch_all_idols_to_groups():
+    """Fetch every idol id with the group id it belongs to."""
+    return await self.conn.fetch("SELECT idolid, groupid FROM groupmembers.idoltogroup")
+
+
+async def fetch_all_idol_called():
+    """Fetch the amount of times every idol has been called."""
+    return await self.conn.fetch("SELECT memberid, count FROM groupmembers.count")
+
+
+async def add_idol_call_counts(idol_ids: List[int], counts: List[int]):
+    """Add to the amount of times several idols have been called at once. Idols without a count are inserted.
+
+    :param idol_ids: The idol ids.
+    :param counts: The amount of times to add to each idol.
+    """
+    await self.conn.execute("WITH input AS (SELECT * FROM UNNEST($1::int[], $2::int[]) AS t(memberid, count)), "
+                            "updated AS (UPDATE groupmembers.count c SET count = c.count + input.count FROM input "
+                            "WHERE c.memberid = input.memberid RETURNING c.memberid) "
+                            "INSERT INTO groupmembers.count(memberid, count) "
+                            "SELECT input.memberid, input.count FROM input "
+                            "WHERE input.memberid NOT IN (SELECT memberid FROM updated)", idol_ids, counts)
+
+
 async def fetch_members_in_group(group_id):
     """Fetches the idol ids in a group.
 
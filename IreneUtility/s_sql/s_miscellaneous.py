@@ -1 +1,34 @@
 from . import self
+
+
+async def fetch_disabled_interactions():
+    """Fetch the disabled interactions of all servers."""
+    return await self.conn.fetch("SELECT serverid, interactions FROM general.disabledinteractions")
+
+
+async def add_disabled_interactions(server_id, interactions):
+    """Add the disabled interactions of a server.
+
+    :param server_id: The server id.
+    :param interactions: Comma separated interactions.
+    """
+    await self.conn.execute("INSERT INTO general.disabledinteractions(serverid, interactions) VALUES ($1, $2)",
+                            server_id, interactions)
+
+
+async def update_disabled_interactions(server_id, interactions):
+    """Update the disabled interactions of a server.
+
+    :param server_id: The server id.
+    :param interactions: Comma separated interactions.
+    """
+    await self.conn.execute("UPDATE general.disabledinteractions SET interactions = $1 WHERE serverid = $2",
+                            interactions, server_id)
+
+
+async def delete_disabled_interactions(server_id):
+    """Delete the disabled interactions of a server.
+
+    :param server_id: The server id.
+    """
+    await self.conn.execute("DELETE FROM general.disabledinteractions WHERE serverid = $1", server_id)
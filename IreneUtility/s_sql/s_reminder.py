@@ -4,3 +4,15 @@ from . import self
 async def fetch_reminders():
     """Fetch all reminders. (id, user id, reason, timestamp)"""
     return await self.conn.fetch("SELECT id, userid, reason, timestamp FROM reminders.reminders")
+
+
+async def add_reminder(user_id, reason, time_stamp):
+    """Add a reminder.
+
+    :param user_id: The user id.
+    :param reason: The reason of the reminder.
+    :param time_stamp: When the reminder is due.
+    :returns: (int) The reminder id.
+    """
+    return await self.conn.fetchval("INSERT INTO reminders.reminders(userid, reason, timestamp) VALUES ($1, $2, $3) "
+                                    "RETURNING id", user_id, reason, time_stamp)
@@ -1,3 +1,5 @@
+from typing import List
+
 from . import self
 
 
@@ -32,4 +34,34 @@ async def fetch_session_id(date):
 
     :param date: Usually datetime.date.today()
     """
-    return await self.conn.fetchrow("SELECT sessionid FROM stats.sessions WHERE date = $1", date)
\ No newline at end of file
+    return await self.conn.fetchrow("SELECT sessionid FROM stats.sessions WHERE date = $1", date)
+
+async def add_command_counts(session_ids: List[int], command_names: List[str], counts: List[int]):
+    """Add to the usage amount of several commands at once. Commands without a row for their session are inserted.
+
+    :param session_ids: The session ids of the commands.
+    :param command_names: The names of the commands.
+    :param counts: The amount of uses to add to each command in the session.
+    """
+    await self.conn.execute("WITH input AS (SELECT * FROM UNNEST($1::int[], $2::text[], $3::int[]) "
+                            "AS t(sessionid, commandname, count)), "
+                            "updated AS (UPDATE stats.commands c SET count = c.count + input.count FROM input "
+                            "WHERE c.sessionid = input.sessionid AND c.commandname = input.commandname "
+                            "RETURNING c.sessionid, c.commandname) "
+                            "INSERT INTO stats.commands(sessionid, commandname, count) "
+                            "SELECT input.sessionid, input.commandname, input.count FROM input "
+                            "WHERE NOT EXISTS (SELECT 1 FROM updated WHERE updated.sessionid = input.sessionid "
+                            "AND updated.commandname = input.commandname)", session_ids, command_names, counts)
+
+
+async def add_session_counts(session_ids: List[int], session_counts: List[int], total_counts: List[int]):
+    """Add to the commands used of several sessions at once.
+
+    :param session_ids: The session ids.
+    :param session_counts: The amount of commands to add to each session.
+    :param total_counts: The amount to add to the total amount of commands used for all sessions of each session.
+    """
+    await self.conn.execute("UPDATE stats.sessions s SET session = s.session + input.session, "
+                            "totalused = s.totalused + input.totalused "
+                            "FROM UNNEST($1::int[], $2::int[], $3::int[]) AS input(sessionid, session, totalused) "
+                            "WHERE s.sessionid = input.sessionid", session_ids, session_counts, total_counts)
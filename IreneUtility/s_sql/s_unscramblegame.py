@@ -1,6 +1,30 @@
+from typing import List, Optional
+
 from . import self
 
 
 async def fetch_us_stats():
     """Fetch the user's id, easy, medium, and hard unscramble game stats"""
     return await self.conn.fetch("SELECT userid, easy, medium, hard FROM stats.unscramblegame")
+
+
+async def add_scores(user_ids: List[int], easy_scores: List[Optional[int]], medium_scores: List[Optional[int]],
+                     hard_scores: List[Optional[int]]):
+    """Add to the unscramble game scores of several users at once. Users without scores are inserted.
+
+    :param user_ids: The user ids.
+    :param easy_scores: The points to add to the easy score of each user. None leaves the score unchanged.
+    :param medium_scores: The points to add to the medium score of each user. None leaves the score unchanged.
+    :param hard_scores: The points to add to the hard score of each user. None leaves the score unchanged.
+    """
+    await self.conn.execute("WITH input AS (SELECT * FROM UNNEST($1::bigint[], $2::int[], $3::int[], $4::int[]) "
+                            "AS t(userid, easy, medium, hard)), "
+                            "updated AS (UPDATE stats.unscramblegame s SET "
+                            "easy = COALESCE(s.easy + input.easy, s.easy, input.easy), "
+                            "medium = COALESCE(s.medium + input.medium, s.medium, input.medium), "
+                            "hard = COALESCE(s.hard + input.hard, s.hard, input.hard) "
+                            "FROM input WHERE s.userid = input.userid RETURNING s.userid) "
+                            "INSERT INTO stats.unscramblegame(userid, easy, medium, hard) "
+                            "SELECT input.userid, input.easy, input.medium, input.hard FROM input "
+                            "WHERE input.userid NOT IN (SELECT userid FROM updated)", user_ids, easy_scores,
+                            medium_scores, hard_scores)
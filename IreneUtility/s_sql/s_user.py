@@ -29,3 +29,32 @@ async def fetch_languages():
 async def fetch_timezones():
     """Fetch all timezones. (user id, timezone)"""
     return await self.conn.fetch("SELECT userid, timezone FROM reminders.timezones")
+
+
+async def fetch_notifications():
+    """Fetch all user notifications. (guild id, user id, phrase)"""
+    return await self.conn.fetch("SELECT guildid, userid, phrase FROM general.notifications")
+
+
+async def add_notification(guild_id: int, user_id: int, phrase: str):
+    """
+    Add a phrase a user should be notified of in a guild.
+
+    :param guild_id:
+    :param user_id:
+    :param phrase:
+    """
+    await self.conn.execute("INSERT INTO general.notifications(guildid, userid, phrase) VALUES ($1, $2, $3)",
+                            guild_id, user_id, phrase)
+
+
+async def delete_notification(guild_id: int, user_id: int, phrase: str):
+    """
+    Delete a phrase a user is notified of in a guild.
+
+    :param guild_id:
+    :param user_id:
+    :param phrase:
+    """
+    await self.conn.execute("DELETE FROM general.notifications WHERE guildid = $1 AND userid = $2 AND phrase = $3",
+                            guild_id, user_id, phrase)
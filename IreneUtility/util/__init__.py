@@ -1,4 +1,5 @@
 from . import u_logger, u_biasgame, u_blackjack, u_cache, u_customcommands, u_database, u_datadog, \
     u_exceptions, u_gacha, u_groupmembers, u_guessinggame, u_lastfm, u_local_cache, u_logging, \
     u_miscellaneous, u_moderator, u_patreon, u_reminder, u_selfassignroles, u_twitch, u_twitter, \
-    u_unscramblegame, u_vlive, u_music
+    u_unscramblegame, u_vlive, u_music, u_counters, u_notifications, u_router, \
+    u_gameresults
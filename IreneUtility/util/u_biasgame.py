@@ -1,86 +1,155 @@
-import asyncio
+from collections import OrderedDict
+from io import BytesIO
+from typing import Dict, Set, Tuple
 
 from PIL import Image
 from ..Base import Base
+import threading
 
 
 class BiasGame(Base):
     def __init__(self, *args):
         super().__init__(*args)
+        # resized idol avatars. {(idol_id, (width, height)): image} ordered from least to most recently used.
+        self.avatar_tiles: OrderedDict = OrderedDict()
+        self.avatar_tile_sizes: Dict[int, Set[Tuple[int, int]]] = {}  # {idol_id: {sizes in cache}}
+        self.avatar_tiles_bytes = 0  # memory used by the avatar tiles.
+        self.max_avatar_tiles_bytes = 64 * 1024 * 1024  # least recently used tiles are evicted above this.
+        self.base_images: Dict[str, Image.Image] = {}  # {file name: decoded image} of versus.png and bracket8.png
+        # images are composed in the thread pool, so the caches are only changed while holding this lock.
+        self.image_lock = threading.Lock()
+
+    @staticmethod
+    def get_image_bytes(image) -> int:
+        """Get the memory a decoded image uses."""
+        return image.width * image.height * len(image.getbands())
+
+    def get_avatar_tile(self, idol_id, size):
+        """Get the avatar of an idol resized to a size. The tile is read from disk only if it is not in the cache.
+
+        :param idol_id: The idol id.
+        :param size: (width, height) of the tile.
+        :returns: (PIL.Image.Image) The tile. It is shared, so it must not be modified.
+        """
+        key = (idol_id, tuple(size))
+        with self.image_lock:
+            tile = self.avatar_tiles.get(key)
+            if tile is not None:
+                self.avatar_tiles.move_to_end(key)
+                return tile
+
+        with Image.open(f'{self.ex.keys.idol_avatar_location}{idol_id}_IDOL.png') as idol_image:
+            tile = idol_image.resize(key[1])
+
+        with self.image_lock:
+            if key not in self.avatar_tiles:
+                self.avatar_tiles[key] = tile
+                self.avatar_tile_sizes.setdefault(idol_id, set()).add(key[1])
+                self.avatar_tiles_bytes += self.get_image_bytes(tile)
+            while self.avatar_tiles_bytes > self.max_avatar_tiles_bytes and len(self.avatar_tiles) > 1:
+                (evicted_id, evicted_size), evicted_tile = self.avatar_tiles.popitem(last=False)
+                self.remove_tile_size(evicted_id, evicted_size, evicted_tile)
+        return tile
+
+    def remove_tile_size(self, idol_id, size, tile):
+        """Remove the bookkeeping of a tile that left the cache. Must be called while holding the image lock."""
+        self.avatar_tiles_bytes -= self.get_image_bytes(tile)
+        sizes = self.avatar_tile_sizes.get(idol_id)
+        if sizes:
+            sizes.discard(size)
+            if not sizes:
+                self.avatar_tile_sizes.pop(idol_id)
+
+    def invalidate_avatar(self, idol_id):
+        """Remove every tile of an idol's avatar from the cache (ex: the avatar was replaced).
+
+        :param idol_id: The idol id.
+        """
+        with self.image_lock:
+            for size in list(self.avatar_tile_sizes.get(idol_id) or []):
+                tile = self.avatar_tiles.pop((idol_id, size), None)
+                if tile is not None:
+                    self.remove_tile_size(idol_id, size, tile)
+
+    def get_base_image(self, file_name):
+        """Get a copy of a bias game base image (versus.png or bracket8.png). It is only decoded once.
+
+        :param file_name: The file name in the bias game location.
+        :returns: (PIL.Image.Image) A copy that can be drawn on.
+        """
+        with self.image_lock:
+            base_image = self.base_images.get(file_name)
+            if base_image is None:
+                with Image.open(f'{self.ex.keys.bias_game_location}{file_name}') as image:
+                    image.load()
+                    base_image = self.base_images[file_name] = image.copy()
+            return base_image.copy()
+
+    @staticmethod
+    def save_to_memory(image) -> BytesIO:
+        """Save an image as a PNG in memory.
+
+        :param image: (PIL.Image.Image) The image to save.
+        :returns: (BytesIO) The PNG at position 0, ready for discord.File.
+        """
+        image_bytes = BytesIO()
+        image.save(image_bytes, format="PNG", compress_level=1)
+        image_bytes.seek(0)
+        return image_bytes
 
     async def create_bias_game_image(self, first_idol_id, second_idol_id):
-        """Uses thread pool to create bias game image to prevent IO blocking."""
-        # (self.ex.thread_pool.submit(self.merge_images, first_idol_id, second_idol_id)).result()
-        await self.ex.run_blocking_code(self.merge_images, first_idol_id, second_idol_id)
-        return f"{ self.ex.keys.bias_game_location}{first_idol_id}_{second_idol_id}.png"
-
-    def merge_images(self, first_idol_id, second_idol_id):
-        """Merge Idol Images if the merge doesn't exist already."""
-        file_name = f"{first_idol_id}_{second_idol_id}.png"
-        if not self.ex.check_file_exists(f"{self.ex.keys.bias_game_location}{file_name}"):
-            # open the images.
-            with Image.open(f'{self.ex.keys.bias_game_location}versus.png') as versus_image, \
-                    Image.open(f'{self.ex.keys.idol_avatar_location}{first_idol_id}_IDOL.png') as first_idol_image, \
-                    Image.open(f'{self.ex.keys.idol_avatar_location}{second_idol_id}_IDOL.png') as second_idol_image:
-
-                # define the dimensions
-                idol_image_width = 150
-                idol_image_height = 150
-                first_image_area = (0, 0)
-                second_image_area = (versus_image.width - idol_image_width, 0)
-                image_size = (idol_image_width, idol_image_height)
-
-                # resize the idol images
-                first_idol_image = first_idol_image.resize(image_size)
-                second_idol_image = second_idol_image.resize(image_size)
-
-                # add the idol images onto the VS image.
-                versus_image.paste(first_idol_image, first_image_area)
-                versus_image.paste(second_idol_image, second_image_area)
-
-                # save the versus image.
-                versus_image.save(f"{self.ex.keys.bias_game_location}{file_name}")
+        """Uses thread pool to create bias game image to prevent IO blocking.
+
+        :returns: (BytesIO) The versus image as a PNG.
+        """
+        result = await self.ex.run_blocking_code(self.merge_images, first_idol_id, second_idol_id)
+        return result[0] if result else None
+
+    def merge_images(self, first_idol_id, second_idol_id) -> BytesIO:
+        """Merge Idol Images onto the versus image in memory."""
+        versus_image = self.get_base_image("versus.png")
+
+        # define the dimensions
+        idol_image_width = 150
+        idol_image_height = 150
+        first_image_area = (0, 0)
+        second_image_area = (versus_image.width - idol_image_width, 0)
+        image_size = (idol_image_width, idol_image_height)
+
+        # add the resized idol images onto the VS image.
+        versus_image.paste(self.get_avatar_tile(first_idol_id, image_size), first_image_area)
+        versus_image.paste(self.get_avatar_tile(second_idol_id, image_size), second_image_area)
+
+        return self.save_to_memory(versus_image)
 
     async def create_bias_game_bracket(self, all_games, user_id, bracket_winner):
-        # (self.ex.thread_pool.submit(self.create_bracket, all_games, user_id, bracket_winner)).result()
-        await self.ex.run_blocking_code(self.create_bracket, all_games, user_id, bracket_winner)
-        return f"{self.ex.keys.bias_game_location}{user_id}.png"
-
-    def create_bracket(self, all_games, user_id, bracket_winner):
-
-        def resize_images(first_img, second_img, first_img_size, second_img_size):
-            return first_img.resize(first_img_size), second_img.resize(second_img_size)
-
-        def paste_image(first_idol_img, second_idol_img, first_img_area, second_img_area):
-            bracket.paste(first_idol_img, first_img_area)
-            bracket.paste(second_idol_img, second_img_area)
-
-        with Image.open(f'{self.ex.keys.bias_game_location}bracket8.png') as bracket:
-            count = 1
-            for c_round in all_games:
-                if len(c_round) > 4:
-                    continue
-                for first_idol, second_idol in c_round:
-                    first_idol_info = self.ex.cache.stored_bracket_positions.get(count)
-                    second_idol_info = self.ex.cache.stored_bracket_positions.get(count + 1)
-
-                    with Image.open(f'{self.ex.keys.idol_avatar_location}{first_idol.id}_IDOL.png') as first_idol_image, \
-                            Image.open(f'{self.ex.keys.idol_avatar_location}{second_idol.id}_IDOL.png') as second_idol_image:
-
-                        # resize images
-                        first_idol_image, second_idol_image = resize_images(first_idol_image, second_idol_image,
-                                                                            first_idol_info.get('img_size'),
-                                                                            second_idol_info.get('img_size'))
-
-                        # paste image to bracket
-                        paste_image(first_idol_image, second_idol_image, first_idol_info.get('pos'),
-                                    second_idol_info.get('pos'))
-
-                        count = count + 2
-
-            # add winner
-            idol_info = self.ex.cache.stored_bracket_positions.get(count)
-            with Image.open(f'{self.ex.keys.idol_avatar_location}{bracket_winner.id}_IDOL.png') as idol_image:
-                idol_image = idol_image.resize(idol_info.get('img_size'))
-                bracket.paste(idol_image, idol_info.get('pos'))
-                bracket.save(f"{self.ex.keys.bias_game_location}{user_id}.png")
+        """Uses thread pool to create the bias game bracket to prevent IO blocking.
+
+        :returns: (BytesIO) The bracket as a PNG.
+        """
+        result = await self.ex.run_blocking_code(self.create_bracket, all_games, user_id, bracket_winner)
+        return result[0] if result else None
+
+    def create_bracket(self, all_games, user_id, bracket_winner) -> BytesIO:
+        """Draw the idols of the last rounds onto the bracket in memory."""
+        bracket = self.get_base_image("bracket8.png")
+        count = 1
+        for c_round in all_games:
+            if len(c_round) > 4:
+                continue
+            for first_idol, second_idol in c_round:
+                first_idol_info = self.ex.cache.stored_bracket_positions.get(count)
+                second_idol_info = self.ex.cache.stored_bracket_positions.get(count + 1)
+
+                # paste resized images to bracket
+                bracket.paste(self.get_avatar_tile(first_idol.id, first_idol_info.get('img_size')),
+                              first_idol_info.get('pos'))
+                bracket.paste(self.get_avatar_tile(second_idol.id, second_idol_info.get('img_size')),
+                              second_idol_info.get('pos'))
+
+                count = count + 2
+
+        # add winner
+        idol_info = self.ex.cache.stored_bracket_positions.get(count)
+        bracket.paste(self.get_avatar_tile(bracket_winner.id, idol_info.get('img_size')), idol_info.get('pos'))
+        return self.save_to_memory(bracket)
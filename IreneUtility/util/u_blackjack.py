@@ -1,16 +1,104 @@
 import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
 from PIL import Image
 from ..Base import Base
-from ..models import BlackJackGame
+from ..models import BlackJackGame, PlayingCard
 from . import u_logger as log
 from discord.ext import commands
-from os import unlink, listdir
+from os import unlink, listdir, replace, scandir, utime
+from os.path import isfile, getsize
+
+
+@lru_cache(maxsize=None)
+def get_card_template(card_file_name) -> Image.Image:
+    """Get a template card as RGBA. It is only decoded once in every process.
+
+    :param card_file_name: A Card's File name & type without the directory.
+    """
+    with Image.open(f"Cards/{card_file_name}") as card_file:
+        return card_file.convert("RGBA")
+
+
+# noinspection PyBroadException
+def render_playing_cards(idol_id, avatar_path, cards: List[Tuple[str, str]]):
+    """
+    Merge the template cards with an idol avatar. This is run in the process pool, so it is defined at the module
+    level and does not use Utility.
+
+    :param idol_id: The idol id of the avatar.
+    :param avatar_path: The full path of the idol avatar.
+    :param cards: [(template card file name, full path of the merged card)]
+    :returns: (idol_id, error) The error is None if every card was saved.
+    """
+    try:
+        # the avatar is decoded once and only resized once for every template size.
+        resized_avatars: Dict[Tuple[int, int], Image.Image] = {}
+        with Image.open(avatar_path) as idol_file:
+            idol_file = idol_file.convert("RGBA")
+
+        for card_file_name, card_path in cards:
+            card_file = get_card_template(card_file_name)
+            resized_avatar = resized_avatars.get(card_file.size)
+            if resized_avatar is None:
+                resized_avatar = resized_avatars[card_file.size] = idol_file.resize(card_file.size)
+
+            # Paste the Card File over the avatar and save this image
+            merged_card = resized_avatar.copy()
+            merged_card.paste(card_file, None, card_file)
+            merged_card.save(card_path)
+        return idol_id, None
+    except Exception as e:
+        return idol_id, f"{e}"
+
+
+def render_playing_card(card_file_name, avatar_path, card_path) -> int:
+    """
+    Merge a template card with an idol avatar. This is run in the process pool for cards rendered on first use.
+
+    :param card_file_name: A Card's File name & type without the directory.
+    :param avatar_path: The full path of the idol avatar.
+    :param card_path: The full path of the merged card.
+    :returns: (int) The size of the merged card in bytes.
+    """
+    card_file = get_card_template(card_file_name)
+    with Image.open(avatar_path) as idol_file:
+        merged_card = idol_file.convert("RGBA").resize(card_file.size)
+    merged_card.paste(card_file, None, card_file)
+    merged_card.save(card_path)
+    return getsize(card_path)
 
 
 # noinspection PyPep8
 class BlackJack(Base):
     def __init__(self, *args):
         super().__init__(*args)
+        self.card_batch_size = 64  # amount of idols that get their cards reserved and rendered at once.
+        self.card_manifest_file_name = "manifest.json"  # {"templates": hash, "avatars": {idol_id: hash}}
+
+        # progress of the playing card generation.
+        self.generating_cards = False
+        self.card_idols_total = 0  # idols that need their cards rendered.
+        self.card_idols_done = 0
+        self.card_idols_failed = 0
+        self.cards_rendered = 0
+        self.card_generation_started = 0.0
+        self.card_generation_seconds = 0.0
+
+        # cards rendered on first use. They are named (card id)_(idol id).png to not collide with generated cards.
+        # {file name: size in bytes} ordered from least to most recently used.
+        self.lazy_cards: OrderedDict = OrderedDict()
+        self.lazy_cards_bytes = 0
+        self.max_lazy_cards_bytes = 256 * 1024 * 1024  # least recently used cards are deleted above this.
+        self.lazy_cards_loaded = False
+        self.lazy_card_renders: Dict[str, asyncio.Future] = {}  # {file name: render in progress}
+        self.lazy_card_attempts = 3  # amount of idols to try before falling back to a generated card.
 
     async def find_game(self, user) -> BlackJackGame:
         """
@@ -20,70 +108,377 @@ class BlackJack(Base):
         :return: BlackJack Game
         """
         if isinstance(user, commands.Context):
-            user = await self.ex.get_user(user.author.id)
+            user_id = user.author.id
         elif isinstance(user, int):
-            # transform into Utility Object
-            user = await self.ex.get_user(user)
-
-        for blackjack_game in self.ex.cache.blackjack_games:
-            player_check_list = [blackjack_game.first_player]
-            if blackjack_game.second_player:
-                player_check_list.append(blackjack_game.second_player)
-            if user in player_check_list:
-                return blackjack_game
-
-    async def generate_playing_cards(self):
-        """Generate custom playing cards with the background as an idol avatar."""
-        # delete all cards to not have duplicates and to properly regenerate avatar changes.
-        await self.ex.sql.s_blackjack.delete_playing_cards()
+            user_id = user
+        else:
+            user_id = user.id
+
+        blackjack_game = self.ex.cache.blackjack_players.get(user_id)
+        if blackjack_game and not blackjack_game.force_ended:
+            return blackjack_game
+
+    def add_game(self, blackjack_game: BlackJackGame):
+        """
+        Add a blackjack game to the cache and index its players. Games add themselves when they are created.
+
+        :param blackjack_game: BlackJack Game
+        """
+        self.ex.cache.blackjack_games.add(blackjack_game)
+        self.ex.cache.blackjack_players[blackjack_game.first_player.id] = blackjack_game
+        if blackjack_game.second_player:
+            self.ex.cache.blackjack_players[blackjack_game.second_player.id] = blackjack_game
+
+    def remove_game(self, blackjack_game: BlackJackGame):
+        """
+        Remove a blackjack game and its players from the cache.
+
+        :param blackjack_game: BlackJack Game
+        """
+        self.ex.cache.blackjack_games.discard(blackjack_game)
+        for player in [blackjack_game.first_player, blackjack_game.second_player]:
+            if player and self.ex.cache.blackjack_players.get(player.id) is blackjack_game:
+                self.ex.cache.blackjack_players.pop(player.id)
+
+    async def generate_playing_cards(self, regenerate_all=False):
+        """Generate custom playing cards with the background as an idol avatar.
+
+        Only the cards of idols whose avatar (or the template cards) changed since the last generation are rendered
+        again. The avatar hashes are kept in a manifest in the playing card location.
+
+        :param regenerate_all: Delete every card and render all of them again.
+        """
+        if self.generating_cards:
+            log.console("Playing cards are already being generated.", method=self.generate_playing_cards)
+            return
+
+        self.generating_cards = True
+        self.card_idols_total = self.card_idols_done = self.card_idols_failed = self.cards_rendered = 0
+        self.card_generation_started = time.time()
+        self.card_generation_seconds = 0.0
         try:
-            # remove all player cards existing on OS.
-            # (self.ex.thread_pool.submit(self.remove_all_card_files)).result()
-            await self.ex.run_blocking_code(self.remove_all_card_files)
+            await self.__generate_playing_cards(regenerate_all)
         except Exception as e:
             log.console(f"{e} (Exception)", method=self.generate_playing_cards)
+        finally:
+            self.generating_cards = False
+            self.card_generation_seconds = time.time() - self.card_generation_started
 
-        for idol in self.ex.cache.idols:
-            try:
-                for i in range(52):
-                    await asyncio.sleep(0)
-                    unique_id = await self.ex.sql.s_blackjack.generate_playing_card(i+1, idol.id)
+        log.console(f"Rendered {self.cards_rendered} playing cards of {self.card_idols_done} idols in "
+                    f"{self.card_generation_seconds:.2f}s ({self.card_idols_failed} idols failed).",
+                    method=self.generate_playing_cards)
+        await self.ex.u_cache.process_cache_time(self.ex.u_cache.create_playing_cards, "Playing Cards")
+
+    async def __generate_playing_cards(self, regenerate_all):
+        """Find the idols with changed avatars and render their cards in batches."""
+        if regenerate_all:
+            # delete all cards to not have duplicates and to properly regenerate avatar changes.
+            await self.ex.sql.s_blackjack.delete_playing_cards()
+            await self.ex.run_blocking_code(self.remove_all_card_files)
+            self.clear_lazy_cards()
+
+        result = await self.ex.run_blocking_code(self.get_card_hashes, [idol.id for idol in self.ex.cache.idols])
+        if not result:
+            return
+        manifest, template_hash, avatar_hashes = result[0]
+        manifest_avatars: Dict[str, str] = manifest.setdefault("avatars", {})
+
+        # idols that were removed or lost their avatar should not keep their cards.
+        # this is found before a template change resets the manifest so that their cards are still deleted.
+        removed_idol_ids = [int(idol_id) for idol_id in manifest_avatars
+                            if not avatar_hashes.get(int(idol_id))]
+        for idol_id in removed_idol_ids:
+            manifest_avatars.pop(str(idol_id), None)
+
+        if manifest.get("templates") != template_hash:
+            # every card has to be rendered again if a template changed.
+            manifest = {"templates": template_hash, "avatars": {}}
+            manifest_avatars = manifest["avatars"]
+
+        changed_idol_ids = [idol_id for idol_id, avatar_hash in avatar_hashes.items()
+                            if avatar_hash and manifest_avatars.get(str(idol_id)) != avatar_hash]
+
+        await self.delete_idol_cards(changed_idol_ids + removed_idol_ids)
+        await self.ex.run_blocking_code(self.save_card_manifest, manifest)
+
+        self.card_idols_total = len(changed_idol_ids)
+        for index in range(0, len(changed_idol_ids), self.card_batch_size):
+            batch_idol_ids = changed_idol_ids[index:index + self.card_batch_size]
+            await self.generate_idol_cards(batch_idol_ids, avatar_hashes, manifest_avatars)
+            # saved after every batch so that an interrupted generation continues where it stopped.
+            await self.ex.run_blocking_code(self.save_card_manifest, manifest)
+            log.useless(f"Playing Cards: {self.get_card_generation_progress()}", method=self.generate_playing_cards)
+
+    async def generate_idol_cards(self, idol_ids, avatar_hashes, manifest_avatars):
+        """Reserve the card ids of idols in one query and render their cards in the process pool.
+
+        :param idol_ids: The idol ids to render the cards of.
+        :param avatar_hashes: {idol_id: avatar hash}
+        :param manifest_avatars: {str(idol_id): avatar hash} of the idols with rendered cards. Updated in place.
+        """
+        card_value_ids = list(range(1, 53)) * len(idol_ids)
+        bg_idol_ids = [idol_id for idol_id in idol_ids for _ in range(52)]
+        idol_cards: Dict[int, List[Tuple[str, str]]] = {idol_id: [] for idol_id in idol_ids}
+        for custom_card_id, card_value_id, bg_idol_id in await self.ex.sql.s_blackjack.generate_playing_cards(
+                card_value_ids, bg_idol_ids):
+            idol_cards[bg_idol_id].append((f"{card_value_id}.png",
+                                           f"{self.ex.keys.playing_card_location}{custom_card_id}.png"))
+
+        renders = [[render_playing_cards, (idol_id, f"{self.ex.keys.idol_avatar_location}{idol_id}_IDOL.png", cards),
+                    {}] for idol_id, cards in idol_cards.items()]
+        results = await self.ex.run_cpu_bound_code(renders)
+        if len(results) != len(renders):
+            # the process pool failed, so none of the cards can be trusted.
+            results = [(idol_id, "Process Pool Error") for idol_id in idol_ids]
 
-                    # (self.ex.thread_pool.submit(self.merge_images, f"{i+1}.png", f"{idol.id}_IDOL.png", unique_id
-                    # )).result()
-                    await self.ex.run_blocking_code(self.merge_images, f"{i+1}.png", f"{idol.id}_IDOL.png", unique_id)
+        failed_idol_ids = []
+        for idol_id, error in results:
+            if error:
+                failed_idol_ids.append(idol_id)
+                log.console(f"{error} (Exception) - Idol {idol_id}", method=self.generate_idol_cards)
+                continue
+            manifest_avatars[str(idol_id)] = avatar_hashes[idol_id]
+            self.cards_rendered += len(idol_cards[idol_id])
 
+        await self.delete_idol_cards(failed_idol_ids)
+        self.card_idols_done += len(idol_ids)
+        self.card_idols_failed += len(failed_idol_ids)
+
+    async def delete_idol_cards(self, idol_ids):
+        """Delete the cards of idols from the database and the OS.
+
+        :param idol_ids: The idol ids to delete the cards of.
+        """
+        if not idol_ids:
+            return
+        file_names = await self.ex.sql.s_blackjack.delete_idol_playing_cards(idol_ids)
+        await self.ex.run_blocking_code(self.remove_card_files, file_names)
+
+    def get_card_generation_progress(self) -> dict:
+        """Get the progress and throughput of the playing card generation."""
+        seconds = (time.time() - self.card_generation_started) if self.generating_cards else \
+            self.card_generation_seconds
+        cards_per_second = self.cards_rendered / seconds if seconds else 0
+        idols_left = self.card_idols_total - self.card_idols_done
+        idols_per_second = self.card_idols_done / seconds if seconds else 0
+        return {
+            'running': self.generating_cards,
+            'idols_total': self.card_idols_total,
+            'idols_done': self.card_idols_done,
+            'idols_failed': self.card_idols_failed,
+            'cards_rendered': self.cards_rendered,
+            'seconds': round(seconds, 2),
+            'cards_per_second': round(cards_per_second, 2),
+            'seconds_left': round(idols_left / idols_per_second, 2) if idols_per_second else None
+        }
+
+    def get_card_hashes(self, idol_ids) -> Tuple[dict, str, Dict[int, Optional[str]]]:
+        """Hash the template cards and idol avatars.
+
+        :param idol_ids: The idol ids to hash the avatars of.
+        :returns: (manifest of the last generation, hash of the templates, {idol_id: avatar hash or None if missing})
+        """
+        manifest = {}
+        manifest_path = f"{self.ex.keys.playing_card_location}{self.card_manifest_file_name}"
+        if isfile(manifest_path):
+            try:
+                with open(manifest_path) as manifest_file:
+                    manifest = json.load(manifest_file)
             except Exception as e:
-                log.console(f"{e} (Exception2)", method=self.generate_playing_cards)
+                log.console(f"{e} (Exception)", method=self.get_card_hashes)
 
-        await self.ex.u_cache.create_playing_cards()  # reset playing card cache.
-        await self.ex.u_cache.process_cache_time(self.ex.u_cache.create_playing_cards, "Playing Cards")
+        template_hash = hashlib.sha1()
+        for i in range(52):
+            template_hash.update(self.get_file_hash(f"Cards/{i+1}.png").encode())
+        avatar_hashes = {idol_id: self.get_file_hash(f"{self.ex.keys.idol_avatar_location}{idol_id}_IDOL.png")
+                         for idol_id in idol_ids}
+        return manifest, template_hash.hexdigest(), avatar_hashes
+
+    @staticmethod
+    def get_file_hash(file_path) -> Optional[str]:
+        """Get the sha1 hash of a file or None if it does not exist."""
+        if not isfile(file_path):
+            return None
+        with open(file_path, 'rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
+
+    def save_card_manifest(self, manifest):
+        """Save the manifest of the rendered cards. It is written to a temporary file first to never be corrupted.
+
+        :param manifest: {"templates": hash, "avatars": {idol_id: hash}}
+        """
+        manifest_path = f"{self.ex.keys.playing_card_location}{self.card_manifest_file_name}"
+        with open(f"{manifest_path}.tmp", 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+        replace(f"{manifest_path}.tmp", manifest_path)
+
+    def remove_card_files(self, file_names):
+        """Remove card files from OS.
+
+        :param file_names: The card file names without the directory.
+        """
+        for file_name in file_names:
+            if not file_name:
+                continue
+            try:
+                unlink(f"{self.ex.keys.playing_card_location}{file_name}")
+            except FileNotFoundError:
+                pass
 
     def remove_all_card_files(self):
-        """Remove all card files from OS."""
-        for file in listdir(self.ex.keys.playing_card_location):
-            unlink(file)
+        """Remove all card files (and the manifest) from OS."""
+        self.remove_card_files(listdir(self.ex.keys.playing_card_location))
+
+    async def get_random_card(self, card_id) -> Optional[PlayingCard]:
+        """Get a custom playing card with a random idol in the background.
+
+        The card is rendered on first use. A generated card is used instead if the card could not be rendered.
+
+        :param card_id: The original card (numbered 1 to 52)
+        :returns: (PlayingCard) The custom card or None if there are no cards.
+        """
+        sampler = self.ex.u_group_members.get_card_idol_sampler()
+        if card_id in self.ex.cache.card_values:
+            for _ in range(self.lazy_card_attempts if sampler else 0):
+                card = await self.get_lazy_card(card_id, sampler.sample())
+                if card:
+                    return card
+
+        generated_cards = self.ex.cache.playing_cards.get(card_id)
+        return random.choice(generated_cards) if generated_cards else None
 
-    def merge_images(self, card_file_name, idol_file_name, unique_id):
+    async def get_lazy_card(self, card_id, idol) -> Optional[PlayingCard]:
+        """Get a custom playing card of an idol and render it if it is not on disk.
+
+        Concurrent requests for the same card wait for the same render.
+
+        :param card_id: The original card (numbered 1 to 52)
+        :param idol: Idol object that is in the background of the card.
+        :returns: (PlayingCard) The custom card or None if it could not be rendered.
         """
-        Merges a template card with an idol avatar.
+        await self.load_lazy_cards()
+        file_name = f"{card_id}_{idol.id}.png"
+        if file_name in self.lazy_cards:
+            # the file's mtime is set to the last use so that the order survives a restart.
+            result = await self.ex.run_blocking_code(self.touch_card_file, file_name)
+            if result and result[0]:
+                self.lazy_cards.move_to_end(file_name)
+            else:
+                # the file was removed from disk, so it is rendered again.
+                self.lazy_cards_bytes -= self.lazy_cards.pop(file_name, 0)
+
+        if file_name not in self.lazy_cards:
+            render = self.lazy_card_renders.get(file_name)
+            if not render:
+                render = self.lazy_card_renders[file_name] = asyncio.ensure_future(
+                    self.render_lazy_card(card_id, idol.id, file_name))
+                render.add_done_callback(lambda _: self.lazy_card_renders.pop(file_name, None))
+            # shielded so that a cancelled game does not cancel the render of another game.
+            if not await asyncio.shield(render):
+                return None
 
-        :param card_file_name: A Card's File name & type without the directory.
-        :param idol_file_name: An Idol's File name & type without the directory.
-        :param unique_id: The unique row id in the database table that will be the merged file name.
+        card_name, value = self.ex.cache.card_values[card_id]
+        return PlayingCard(self.get_lazy_card_id(card_id, idol.id), file_name, f"{self.ex.keys.playing_card_location}{file_name}",
+                           f"{self.ex.keys.image_host}cards/{file_name}", idol, card_id=card_id, card_name=card_name,
+                           value=value)
+
+    @staticmethod
+    def get_lazy_card_id(card_id, idol_id) -> int:
+        """Get the id of a lazy card. It is negative so that it never collides with the ids of generated cards.
+
+        :param card_id: The original card (numbered 1 to 52)
+        :param idol_id: The idol id of the background.
+        :returns: (int) The same id for the same card and idol.
         """
-        # Open Files
-        with Image.open(f"Cards/{card_file_name}") as card_file, \
-                Image.open(f"{self.ex.keys.idol_avatar_location}{idol_file_name}") as idol_file:
-            # Convert images to RGBA
-            card_file = card_file.convert("RGBA")
-            idol_file = idol_file.convert("RGBA")
+        return -(idol_id * 100 + card_id)
+
+    async def render_lazy_card(self, card_id, idol_id, file_name) -> bool:
+        """Render a custom playing card in the process pool and add it to the lazy cards.
+
+        :param card_id: The original card (numbered 1 to 52)
+        :param idol_id: The idol id of the background.
+        :param file_name: The file name of the card.
+        :returns: True if the card was rendered.
+        """
+        result = await self.ex.run_cpu_bound_code(render_playing_card, f"{card_id}.png",
+                                                  f"{self.ex.keys.idol_avatar_location}{idol_id}_IDOL.png",
+                                                  f"{self.ex.keys.playing_card_location}{file_name}")
+        if not result:
+            return False
+        self.add_lazy_card(file_name, result[0])
+        await self.remove_least_used_lazy_cards()
+        return True
+
+    def add_lazy_card(self, file_name, size):
+        """Add a card on disk to the lazy cards as the most recently used.
+
+        :param file_name: The file name of the card.
+        :param size: The size of the card in bytes.
+        """
+        self.lazy_cards_bytes += size - self.lazy_cards.pop(file_name, 0)
+        self.lazy_cards[file_name] = size
+
+    async def remove_least_used_lazy_cards(self):
+        """Delete the least recently used lazy cards until they fit in the max size."""
+        file_names = []
+        while self.lazy_cards_bytes > self.max_lazy_cards_bytes and len(self.lazy_cards) > 1:
+            file_name, size = self.lazy_cards.popitem(last=False)
+            self.lazy_cards_bytes -= size
+            file_names.append(file_name)
+        if file_names:
+            await self.ex.run_blocking_code(self.remove_card_files, file_names)
+
+    async def remove_lazy_cards(self, idol_id):
+        """Delete the lazy cards of an idol (ex: the avatar was replaced).
 
-            # Resize Idol Photo
-            idol_file = idol_file.resize((card_file.width, card_file.height))
+        :param idol_id: The idol id of the background.
+        """
+        file_names = [file_name for file_name in self.lazy_cards if file_name.endswith(f"_{idol_id}.png")]
+        for file_name in file_names:
+            self.lazy_cards_bytes -= self.lazy_cards.pop(file_name)
+        if file_names:
+            await self.ex.run_blocking_code(self.remove_card_files, file_names)
+
+    def clear_lazy_cards(self):
+        """Forget every lazy card (ex: the playing card directory was wiped)."""
+        self.lazy_cards.clear()
+        self.lazy_cards_bytes = 0
 
-            # Paste the Card File at (width, height)
-            idol_file.paste(card_file, None, card_file)
+    def touch_card_file(self, file_name) -> bool:
+        """Set the modification time of a card file to now.
 
-            # Save this image
-            idol_file.save(f"{self.ex.keys.playing_card_location}{unique_id}.png")
+        :param file_name: The card file name without the directory.
+        :returns: False if the file does not exist.
+        """
+        try:
+            utime(f"{self.ex.keys.playing_card_location}{file_name}")
+            return True
+        except FileNotFoundError:
+            return False
+
+    async def load_lazy_cards(self):
+        """Add the lazy cards rendered before a restart, ordered by when they were last used."""
+        if self.lazy_cards_loaded:
+            return
+        self.lazy_cards_loaded = True
+        result = await self.ex.run_blocking_code(self.find_lazy_card_files)
+        for file_name, size in (result[0] if result else []):
+            if file_name not in self.lazy_cards:
+                # the cards were found from the most to least recently used, so each one goes to the front.
+                self.lazy_cards[file_name] = size
+                self.lazy_cards.move_to_end(file_name, last=False)
+                self.lazy_cards_bytes += size
+        await self.remove_least_used_lazy_cards()
+
+    def find_lazy_card_files(self) -> List[Tuple[str, int]]:
+        """Find the lazy cards on disk.
+
+        :returns: [(file name, size in bytes)] ordered from the most to least recently used.
+        """
+        lazy_card_files = []
+        for entry in scandir(self.ex.keys.playing_card_location):
+            if entry.is_file() and entry.name.endswith(".png") and "_" in entry.name:
+                stat = entry.stat()
+                lazy_card_files.append((stat.st_mtime, entry.name, stat.st_size))
+        lazy_card_files.sort(reverse=True)
+        return [(file_name, size) for _, file_name, size in lazy_card_files]
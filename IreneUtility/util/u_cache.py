@@ -19,6 +19,23 @@ class Cache(Base):
         self.base_language_folder = "languages"
         self.language_folders = []  # list of language directories (case-sensitive as directories).
 
+        # max amount of cache loaders running at the same time.
+        # this should not go above the amount of connections the DB pool has.
+        self.max_concurrent_loaders = 5
+
+        # cache loaders that must wait for other cache loaders to finish before starting.
+        # { cache name : [cache names it depends on] }
+        self.cache_dependencies = {
+            "Idol Objects": ["Idol Photo Count"],
+            "Group Objects": ["Group Photo Count"],
+            "Original Commands": ["Language Packs"],
+            "Playing Cards": ["Idol Objects"],
+            "Guessing Game Filter": ["Group Objects"],
+            # idol and group objects overwrite the vlive/twitter channel objects they create.
+            "Vlive Text Channel Followers": ["Idol Objects", "Group Objects"],
+            "Twitter Text Channel Followers": ["Idol Objects", "Group Objects"],
+        }
+
     async def process_cache_time(self, method, name, *args, **kwargs):
         """Process the cache time."""
         past_time = time.time()
@@ -26,7 +43,14 @@ class Cache(Base):
         if kwargs.get("method_type"):
             method_type = kwargs.pop("method_type") or "Cache"
 
-        result = await method(*args, **kwargs)
+        try:
+            result = await method(*args, **kwargs)
+        except Exception as e:
+            failed_time = await self.ex.u_miscellaneous.get_cooldown_time(time.time() - past_time)
+            log.console(f"{e} (Exception) - {method_type} for {name} Failed after {failed_time}.",
+                        method=self.process_cache_time)
+            raise e
+
         if result is None or result:  # expecting False on methods that fail to load, do not simplify None.
             creation_time = await self.ex.u_miscellaneous.get_cooldown_time(time.time() - past_time)
             log.console(f"{method_type} for {name} Created in {creation_time}.", method=self.process_cache_time)
@@ -36,6 +60,9 @@ class Cache(Base):
         """Create the general cache on startup"""
 
         past_time = time.time()
+        # write pending counters and game results first so that the reloaded counts and scores are current.
+        await self.ex.u_counters.flush()
+        await self.ex.u_game_results.flush()
         # reset custom user cache
         self.ex.cache.users = {}
         if not self.ex.cache.maintenance_mode and on_boot_up:
@@ -73,10 +100,12 @@ class Cache(Base):
             [self.create_levels_cache, "Levels"],
             [self.create_language_cache, "User Language"],
             [self.create_playing_cards, "Playing Cards"],
+            [self.create_card_value_cache, "Card Values"],
             [self.create_guild_cache, "DB Guild"],
             [self.create_gg_filter_cache, "Guessing Game Filter"],
             [self.create_welcome_role_cache, "Welcome Roles"],
             [self.create_disabled_games_cache, "Disabled Games In Channels"],
+            [self.create_disabled_interactions_cache, "Disabled Interactions"],
             [self.create_send_idol_photo_cache, "Send Idol Photo"],
             [self.request_support_server_members, "Support Server Member"],
             [self.request_twitter_channel, "Twitter Channel"],
@@ -87,23 +116,56 @@ class Cache(Base):
             # [self.create_image_cache, "Image"],
 
         ]
-        for method, cache_name in cache_info:
+        await self.run_cache_loaders(cache_info, on_boot_up=on_boot_up)
+        creation_time = await self.ex.u_miscellaneous.get_cooldown_time(time.time() - past_time)
+        log.console(f"Cache Completely Created in {creation_time}.", method=self.create_cache)
+        if on_boot_up:
+            self.ex.cache.maintenance_mode = False
+            self.ex.cache.maintenance_reason = None
+        self.ex.irene_cache_loaded = True
+        if not self.ex.u_counters.flush_counters.is_running():
+            if self.ex.keys.counter_flush_interval:
+                self.ex.u_counters.change_flush_interval(self.ex.keys.counter_flush_interval)
+            self.ex.u_counters.flush_counters.start()
+        if not self.ex.u_reminder.reminder_scheduler.is_running():
+            self.ex.u_reminder.reminder_scheduler.start()
+
+    async def run_cache_loaders(self, cache_info, on_boot_up=True):
+        """Run cache loaders concurrently while respecting the dependencies between them.
+
+        A loader only starts after every loader it depends on (see self.cache_dependencies) has finished, regardless
+        of whether the dependency succeeded. No more than self.max_concurrent_loaders run at the same time.
+
+        :param cache_info: A list of lists with the 0th index as the loader and the 1st index as the cache name.
+        :param on_boot_up: Whether the cache is being created on boot up.
+        """
+        loader_semaphore = asyncio.Semaphore(self.max_concurrent_loaders)
+        # { cache name : event that is set once the loader is finished }
+        finished_loaders = {cache_name: asyncio.Event() for _, cache_name in cache_info}
+
+        async def run_loader(method, cache_name):
             try:
+                for dependency in self.cache_dependencies.get(cache_name) or []:
+                    dependency_finished = finished_loaders.get(dependency)
+                    if dependency_finished:
+                        await dependency_finished.wait()
+
                 if cache_name in ["DB Guild", "Patrons"]:
                     # if the discord cache is loaded, make sure to update the patreon cache since our user objects
                     # are reset every time this function is called.
                     if not self.ex.discord_cache_loaded or on_boot_up:
-                        continue
+                        return
 
-                await self.process_cache_time(method, cache_name)
+                async with loader_semaphore:
+                    await self.process_cache_time(method, cache_name)
             except Exception as e:
-                log.console(f"{e} (Exception) - Failed to load Cache for {method} - {cache_name}.")
-        creation_time = await self.ex.u_miscellaneous.get_cooldown_time(time.time() - past_time)
-        log.console(f"Cache Completely Created in {creation_time}.", method=self.create_cache)
-        if on_boot_up:
-            self.ex.cache.maintenance_mode = False
-            self.ex.cache.maintenance_reason = None
-        self.ex.irene_cache_loaded = True
+                # the failure and its time was already logged by process_cache_time.
+                log.useless(f"{e} (Exception) - Failed to load Cache for {method} - {cache_name}.",
+                            method=self.run_cache_loaders)
+            finally:
+                finished_loaders[cache_name].set()
+
+        await asyncio.gather(*[run_loader(method, cache_name) for method, cache_name in cache_info])
 
     async def create_data_mod_cache(self):
         """Create the cache for data mods."""
@@ -243,12 +305,82 @@ class Cache(Base):
             # we will allow either the id or the discord.TextChannel to be in the cache.
             self.ex.cache.send_idol_photos[text_channel] = idol_ids
 
+    @staticmethod
+    def set_feature(features: dict, object_id, feature, enabled=True):
+        """Add or remove a feature from the feature mask of a channel/guild.
+
+        :param features: cache.channel_features or cache.guild_features
+        :param object_id: The channel/guild id.
+        :param feature: (models.ChannelFeature or models.GuildFeature) The feature to add or remove.
+        :param enabled: Whether to add the feature.
+        """
+        mask = features.get(object_id, 0)
+        mask = (mask | feature) if enabled else (mask & ~feature)
+        if mask:
+            features[object_id] = int(mask)
+        else:
+            features.pop(object_id, None)
+
+    def clear_feature(self, features: dict, feature):
+        """Remove a feature from every channel/guild. Used before the feature is reloaded.
+
+        :param features: cache.channel_features or cache.guild_features
+        :param feature: (models.ChannelFeature or models.GuildFeature) The feature to remove.
+        """
+        for object_id in list(features.keys()):
+            self.set_feature(features, object_id, feature, enabled=False)
+
+    def set_channel_feature(self, channel_id, feature, enabled=True):
+        """Add or remove a feature from the feature mask of a text channel.
+
+        :param channel_id: The channel id.
+        :param feature: (models.ChannelFeature) The feature to add or remove.
+        :param enabled: Whether to add the feature.
+        """
+        self.set_feature(self.ex.cache.channel_features, channel_id, feature, enabled)
+
+    def set_guild_feature(self, server_id, feature, enabled=True):
+        """Add or remove a feature from the feature mask of a guild.
+
+        :param server_id: The guild id.
+        :param feature: (models.GuildFeature) The feature to add or remove.
+        :param enabled: Whether to add the feature.
+        """
+        self.set_feature(self.ex.cache.guild_features, server_id, feature, enabled)
+
+    def get_channel_features(self, channel_id) -> int:
+        """Get the feature mask of a text channel. A channel without features has a mask of 0.
+
+        :param channel_id: The channel id.
+        :returns: (int) models.ChannelFeature mask
+        """
+        return self.ex.cache.channel_features.get(channel_id, 0)
+
+    def get_guild_features(self, server_id) -> int:
+        """Get the feature mask of a guild. A guild without features has a mask of 0.
+
+        :param server_id: The guild id.
+        :returns: (int) models.GuildFeature mask
+        """
+        return self.ex.cache.guild_features.get(server_id, 0)
+
     async def create_disabled_games_cache(self):
         """Creates a list of channels with disabled games."""
         self.ex.cache.channels_with_disabled_games = []
+        self.clear_feature(self.ex.cache.channel_features, self.ex.u_objects.ChannelFeature.GAMES_DISABLED)
         for channel_id in await self.ex.sql.s_moderator.fetch_games_disabled():
             await asyncio.sleep(0)  # bare yield
             self.ex.cache.channels_with_disabled_games.append(channel_id[0])
+            self.set_channel_feature(channel_id[0], self.ex.u_objects.ChannelFeature.GAMES_DISABLED)
+
+    async def create_disabled_interactions_cache(self):
+        """Create the cache for interactions disabled in servers."""
+        disabled_interactions = {}
+        for server_id, interactions in await self.ex.sql.s_miscellaneous.fetch_disabled_interactions():
+            await asyncio.sleep(0)  # bare yield
+            if interactions:
+                disabled_interactions[server_id] = frozenset(interactions.split(','))
+        self.ex.cache.disabled_interactions = disabled_interactions
 
     async def create_image_cache(self):
         """Creates Image objects and stores them in local cache.
@@ -315,6 +447,11 @@ class Cache(Base):
             else:
                 self.ex.cache.playing_cards[card_id] = [card]
 
+    async def create_card_value_cache(self):
+        """Create cache for the names and values of the original playing cards."""
+        self.ex.cache.card_values = {card_id: (card_name, value) for card_id, card_name, value in
+                                     await self.ex.sql.s_blackjack.fetch_card_values()}
+
     async def create_language_cache(self):
         """Create cache for user languages."""
         for user_id, language in await self.ex.sql.s_user.fetch_languages():
@@ -325,6 +462,7 @@ class Cache(Base):
         """Create cache for language packs."""
         self.ex.cache.languages = {}
         self.ex.cache.languages_available = []
+        language_templates = {}
 
         async def get_language_module_and_message():
             # get the modules and messages for each language
@@ -350,6 +488,15 @@ class Cache(Base):
             await asyncio.sleep(0)  # bare yield
             module[message_name] = self.apply_bold_to_braces(module[message_name])
 
+        # compile every message so that the placeholders do not need to be searched for on every message sent.
+        for language_name, language in self.ex.cache.languages.items():
+            await asyncio.sleep(0)  # bare yield
+            for module_name, module in language.items():
+                for message_name, message in module.items():
+                    language_templates[(language_name, module_name, message_name)] = \
+                        self.ex.u_objects.MessageTemplate(message)
+        self.ex.cache.language_templates = language_templates
+
     @staticmethod
     def apply_bold_to_braces(text: str) -> str:
         """Applys bold markdown in between braces."""
@@ -443,12 +590,15 @@ class Cache(Base):
 
     async def create_timezone_cache(self):
         """Create cache for timezones"""
+        await self.ex.run_blocking_code([[self.ex.u_reminder.create_timezone_indexes, [], {}],
+                                         [self.ex.u_reminder.create_locale_date_formats, [], {}]])
         for user_id, timezone in await self.ex.sql.s_user.fetch_timezones():
             user = await self.ex.get_user(user_id)
             user.timezone = timezone
 
     async def create_reminder_cache(self):
         """Create cache for reminders"""
+        self.ex.u_reminder.reset_reminder_queue()
         for reason_id, user_id, reason, time_stamp in await self.ex.sql.s_reminder.fetch_reminders():
             user = await self.ex.get_user(user_id)
             reason_list = [reason_id, reason, time_stamp]
@@ -456,13 +606,17 @@ class Cache(Base):
                 user.reminders.append(reason_list)
             else:
                 user.reminders = [reason_list]
+            self.ex.u_reminder.schedule_reminder(reason_id, user_id, time_stamp)
 
     async def create_self_assignable_role_cache(self):
         """Create cache for self assignable roles"""
         self.ex.cache.assignable_roles = {}
+        self.clear_feature(self.ex.cache.channel_features, self.ex.u_objects.ChannelFeature.SELF_ASSIGN_ROLES)
+        self.clear_feature(self.ex.cache.guild_features, self.ex.u_objects.GuildFeature.SELF_ASSIGN_ROLES)
 
         for role_id, role_name, server_id in await self.ex.sql.s_selfassignroles.fetch_all_self_assign_roles():
             await asyncio.sleep(0)  # bare yield
+            self.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.SELF_ASSIGN_ROLES)
             cache_info = self.ex.cache.assignable_roles.get(server_id)
             if not cache_info:
                 self.ex.cache.assignable_roles[server_id] = {}
@@ -474,6 +628,7 @@ class Cache(Base):
 
         for channel_id, server_id in await self.ex.sql.s_selfassignroles.fetch_all_self_assign_channels():
             await asyncio.sleep(0)  # bare yield
+            self.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.SELF_ASSIGN_ROLES)
             cache_info = self.ex.cache.assignable_roles.get(server_id)
             if cache_info:
                 cache_info['channel_id'] = channel_id
@@ -485,26 +640,38 @@ class Cache(Base):
         self.ex.cache.command_counter = {}
         session_id = await self.get_session_id()
 
-        for command_name, count in await self.ex.sql.s_session.fetch_command(session_id):
-            await asyncio.sleep(0)  # bare yield
-            self.ex.cache.command_counter[command_name] = count
+        # uses that are not in the DB yet are added to the DB counts instead of being lost.
+        async with self.ex.u_counters.flush_lock:
+            for command_name, count in await self.ex.sql.s_session.fetch_command(session_id):
+                await asyncio.sleep(0)  # bare yield
+                self.ex.cache.command_counter[command_name] = count
 
-        self.ex.cache.current_session = self.ex.first_result(
-            await self.ex.sql.s_session.fetch_session_usage(datetime.date.today()))
+            for (pending_session_id, command_name), count in self.ex.u_counters.pending_commands.items():
+                if pending_session_id == session_id:
+                    self.ex.cache.command_counter[command_name] = \
+                        (self.ex.cache.command_counter.get(command_name) or 0) + count
+
+            self.ex.cache.current_session = (self.ex.first_result(
+                await self.ex.sql.s_session.fetch_session_usage(datetime.date.today())) or 0) + \
+                self.ex.u_counters.pending_sessions.get(session_id, (0, 0))[0]
 
     async def create_restricted_channel_cache(self):
         """Create restricted idol channel cache"""
         self.ex.cache.restricted_channels = {}
+        self.clear_feature(self.ex.cache.channel_features, self.ex.u_objects.ChannelFeature.RESTRICTED_PHOTOS)
+        self.clear_feature(self.ex.cache.guild_features, self.ex.u_objects.GuildFeature.PHOTO_CHANNEL)
         for channel_id, server_id, send_here in await self.ex.sql.s_groupmembers.fetch_restricted_channels():
             await asyncio.sleep(0)  # bare yield
-            self.ex.cache.restricted_channels[channel_id] = [server_id, send_here]
+            self.ex.u_group_members.add_restricted_channel_to_cache(channel_id, server_id, send_here)
 
     async def create_bot_command_cache(self):
         """Create custom command cache"""
         self.ex.cache.custom_commands = {}
+        self.clear_feature(self.ex.cache.guild_features, self.ex.u_objects.GuildFeature.CUSTOM_COMMANDS)
 
         for server_id, command_name, message in await self.ex.sql.s_customcommands.fetch_custom_commands():
             await asyncio.sleep(0)  # bare yield
+            self.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.CUSTOM_COMMANDS)
             cache_info = self.ex.cache.custom_commands.get(server_id)
             if cache_info:
                 cache_info[command_name] = message
@@ -533,6 +700,12 @@ class Cache(Base):
     async def create_idol_cache(self):
         """Create Idol Objects and store them as cache."""
         self.ex.cache.idols = []
+        self.ex.cache.idols_by_id = {}
+        self.ex.cache.idol_names = {}
+        self.ex.cache.idol_local_names = {}
+        self.ex.cache.idol_matcher = self.ex.u_objects.PhraseMatcher()
+        self.ex.cache.idol_local_matchers = {}
+        self.ex.cache.idol_index = None
         # Clear and update these cache values to prevent breaking the memory reference made by
         # self.ex.cache.difficulty_selection and self.ex.cache.gender_selection
         self.ex.cache.idols_female.clear()
@@ -541,19 +714,44 @@ class Cache(Base):
         self.ex.cache.idols_medium.clear()
         self.ex.cache.idols_hard.clear()
 
-        for idol in await self.ex.sql.s_groupmembers.fetch_all_idols():
-            await asyncio.sleep(0)  # bare yield
-            await self.ex.u_group_members.add_idol_to_cache(**idol)
+        # fetch the information of all idols at once instead of several queries per idol.
+        all_aliases = await self.ex.u_group_members.get_all_db_aliases()
+        idol_to_groups, _ = await self.ex.u_group_members.get_all_db_group_members()
+
+        # the counters are not flushed while the idols are created, so calls that are not in the DB yet are added to
+        # the DB counts instead of being lost.
+        async with self.ex.u_counters.flush_lock:
+            all_called = await self.ex.u_group_members.get_all_db_idol_called()
+            for idol in await self.ex.sql.s_groupmembers.fetch_all_idols():
+                await asyncio.sleep(0)  # bare yield
+                idol_id = idol["id"]
+                called = all_called.get(idol_id, 0) + self.ex.u_counters.pending_idol_calls.get(idol_id, 0)
+                await self.ex.u_group_members.add_idol_to_cache(aliases=all_aliases.get(idol_id) or ([], {}),
+                                                                groups=idol_to_groups.get(idol_id) or [],
+                                                                called=called, **idol)
 
         self.ex.cache.gender_selection['all'] = set(self.ex.cache.idols)
+        self.ex.cache.idol_index = self.ex.u_objects.IdolIndex(self.ex.cache.idols)
+        self.ex.u_group_members.create_idol_samplers()
 
     async def create_group_cache(self):
         """Create Group Objects and store them as cache"""
         self.ex.cache.groups = []
+        self.ex.cache.groups_by_id = {}
+        self.ex.cache.group_names = {}
+        self.ex.cache.group_local_names = {}
+        self.ex.cache.group_matcher = self.ex.u_objects.PhraseMatcher()
+        self.ex.cache.group_local_matchers = {}
+
+        # fetch the information of all groups at once instead of several queries per group.
+        all_aliases = await self.ex.u_group_members.get_all_db_aliases(group=True)
+        _, group_to_idols = await self.ex.u_group_members.get_all_db_group_members()
 
         for group in await self.ex.sql.s_groupmembers.fetch_all_groups():
             await asyncio.sleep(0)  # bare yield
-            await self.ex.u_group_members.add_group_to_cache(**group)
+            group_id = group["groupid"]
+            await self.ex.u_group_members.add_group_to_cache(aliases=all_aliases.get(group_id) or ([], {}),
+                                                             members=group_to_idols.get(group_id) or [], **group)
 
     async def process_session(self):
         """Sets the new session id, total used, and time format for distinguishing days."""
@@ -585,13 +783,11 @@ class Cache(Base):
     async def create_temp_channels(self):
         """Create the cache for temp channels."""
         self.ex.cache.temp_channels = {}
+        self.clear_feature(self.ex.cache.channel_features, self.ex.u_objects.ChannelFeature.TEMP_CHANNEL)
 
         for channel_id, delay in await self.ex.sql.s_general.fetch_temp_channels():
             await asyncio.sleep(0)  # bare yield
-            removal_time = delay
-            if removal_time < 60:
-                removal_time = 60
-            self.ex.cache.temp_channels[channel_id] = removal_time
+            self.ex.u_miscellaneous.add_temp_channel(channel_id, delay)
 
     async def create_welcome_message_cache(self):
         """Create the cache for welcome messages."""
@@ -614,13 +810,17 @@ class Cache(Base):
         """Create the cache for logged servers and channels."""
         self.ex.cache.logged_channels = {}
         self.ex.cache.list_of_logged_channels = []
+        self.clear_feature(self.ex.cache.channel_features, self.ex.u_objects.ChannelFeature.LOGGED)
+        self.clear_feature(self.ex.cache.guild_features, self.ex.u_objects.GuildFeature.LOGGED)
 
         for p_id, server_id, channel_id, send_all in await self.ex.sql.s_logging.fetch_logged_servers():
             await asyncio.sleep(0)  # bare yield
+            self.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.LOGGED)
             channel_ids = []
             for channel in await self.ex.sql.s_logging.fetch_logged_channels(p_id):
                 await asyncio.sleep(0)  # bare yield
                 self.ex.cache.list_of_logged_channels.append(channel[0])
+                self.set_channel_feature(channel[0], self.ex.u_objects.ChannelFeature.LOGGED)
                 channel_ids.append(channel[0])
             self.ex.cache.logged_channels[server_id] = {
                 "send_all": send_all,
@@ -701,11 +901,11 @@ class Cache(Base):
     async def create_user_notifications(self):
         """Set the cache for user phrases"""
         self.ex.cache.user_notifications = []
-        notifications = await self.ex.conn.fetch("SELECT guildid,userid,phrase FROM general.notifications")
-        for guild_id, user_id, phrase in notifications:
-            user = await self.ex.get_user(user_id)
-            user.notifications.append([guild_id, phrase])
-            self.ex.cache.user_notifications.append([guild_id, user_id, phrase])  # full list.
+        self.ex.cache.notification_matchers = {}
+        self.clear_feature(self.ex.cache.guild_features, self.ex.u_objects.GuildFeature.USER_NOTIFICATIONS)
+        for guild_id, user_id, phrase in await self.ex.sql.s_user.fetch_notifications():
+            await asyncio.sleep(0)  # bare yield
+            await self.ex.u_notifications.cache_notification(guild_id, user_id, phrase)
 
     async def create_groups(self):
         """Set cache for group photo count"""
@@ -743,6 +943,7 @@ class Cache(Base):
     async def create_idols(self):
         """Set cache for idol photo count"""
         self.ex.cache.idol_photos = {}
+        self.ex.u_group_members.reset_idol_samplers()
         all_idol_counts = await self.ex.conn.fetch(
             "SELECT memberid, COUNT(link) FROM groupmembers.imagelinks GROUP BY memberid")
         for idol_id, count in all_idol_counts:
@@ -0,0 +1,118 @@
+from typing import Dict, Tuple
+
+from ..Base import Base
+from . import u_logger as log
+from discord.ext import tasks
+import asyncio
+
+
+# noinspection PyBroadException,PyPep8
+class Counters(Base):
+    """Write-behind layer for counters that change on every command/photo.
+
+    The values in cache (Idol.called, cache.command_counter, cache.current_session) are always the current values.
+    Only the amounts added since the last flush are kept here and are added to the DB values, so a failed flush can be
+    retried without counting anything twice, and at most one flush interval of counts can be lost on a crash.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        # amount of pending rows that forces a flush before the interval is reached.
+        self.max_pending = 1000
+        self.flush_lock = asyncio.Lock()
+
+        self.pending_idol_calls: Dict[int, int] = {}  # {idol_id: calls to add}
+        self.pending_commands: Dict[Tuple[int, str], int] = {}  # {(session_id, command_name): uses to add}
+        self.pending_sessions: Dict[int, Tuple[int, int]] = {}  # {session_id: (session uses to add, total to add)}
+
+    def get_pending_count(self) -> int:
+        """Get the amount of rows that are waiting to be written to the DB."""
+        return len(self.pending_idol_calls) + len(self.pending_commands) + len(self.pending_sessions)
+
+    async def add_idol_call(self, idol):
+        """Add 1 to the amount of times an idol has been called.
+
+        :param idol: Idol object.
+        """
+        idol.called = (idol.called or 0) + 1
+        self.pending_idol_calls[idol.id] = self.pending_idol_calls.get(idol.id, 0) + 1
+        await self.check_pending()
+
+    async def add_command_use(self, session_id, command_name):
+        """Add 1 to the amount of times a command was used in a session.
+
+        :param session_id: The session id.
+        :param command_name: The name of the command.
+        """
+        key = (session_id, command_name)
+        self.pending_commands[key] = self.pending_commands.get(key, 0) + 1
+        await self.check_pending()
+
+    async def add_session_use(self, session_id):
+        """Add 1 to the amount of commands used in a session and to the total amount of commands used.
+
+        :param session_id: The session id.
+        """
+        session_count, total_count = self.pending_sessions.get(session_id, (0, 0))
+        self.pending_sessions[session_id] = (session_count + 1, total_count + 1)
+        await self.check_pending()
+
+    async def check_pending(self):
+        """Flush the pending counters if there are too many of them."""
+        if self.get_pending_count() >= self.max_pending and not self.flush_lock.locked():
+            await self.flush()
+
+    async def flush(self):
+        """Write all pending counters to the DB with one query per table.
+
+        Counters that fail to write are added back to the pending counters for the next flush.
+        """
+        async with self.flush_lock:
+            if not self.ex.conn or not self.get_pending_count():
+                return
+
+            idol_calls, self.pending_idol_calls = self.pending_idol_calls, {}
+            commands, self.pending_commands = self.pending_commands, {}
+            sessions, self.pending_sessions = self.pending_sessions, {}
+
+            try:
+                if idol_calls:
+                    await self.ex.sql.s_groupmembers.add_idol_call_counts(list(idol_calls.keys()),
+                                                                          list(idol_calls.values()))
+                    idol_calls = {}
+                if commands:
+                    session_ids, command_names = zip(*commands.keys())
+                    await self.ex.sql.s_session.add_command_counts(list(session_ids), list(command_names),
+                                                                   list(commands.values()))
+                    commands = {}
+                if sessions:
+                    session_counts, total_counts = zip(*sessions.values())
+                    await self.ex.sql.s_session.add_session_counts(list(sessions.keys()), list(session_counts),
+                                                                   list(total_counts))
+                    sessions = {}
+            except Exception as e:
+                log.console(f"{e} (Exception) - Failed to flush counters.", method=self.flush)
+                # the pending counters are amounts to add, so the failed ones are added to anything newer.
+                for failed, pending in [(idol_calls, self.pending_idol_calls), (commands, self.pending_commands)]:
+                    for key, count in failed.items():
+                        pending[key] = pending.get(key, 0) + count
+                for session_id, (session_count, total_count) in sessions.items():
+                    pending_session_count, pending_total_count = self.pending_sessions.get(session_id, (0, 0))
+                    self.pending_sessions[session_id] = (pending_session_count + session_count,
+                                                         pending_total_count + total_count)
+
+    def change_flush_interval(self, seconds):
+        """Change how often the pending counters are flushed.
+
+        :param seconds: The amount of seconds between flushes.
+        """
+        self.flush_counters.change_interval(seconds=seconds)
+
+    @tasks.loop(seconds=30, minutes=0, hours=0, reconnect=True)
+    async def flush_counters(self):
+        """Looped to write the pending counters to the DB."""
+        await self.flush()
+
+    @flush_counters.after_loop
+    async def flush_counters_on_stop(self):
+        """Write the remaining counters to the DB once the loop is stopped (ex: shutting down)."""
+        await self.flush()
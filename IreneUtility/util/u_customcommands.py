@@ -8,7 +8,7 @@ class CustomCommands(Base):
         super().__init__(*args)
 
     async def check_custom_command_name_exists(self, server_id, command_name):
-        if server_id:
+        if server_id and self.ex.u_cache.get_guild_features(server_id) & self.ex.u_objects.GuildFeature.CUSTOM_COMMANDS:
             custom_commands = self.ex.cache.custom_commands.get(server_id)
             if custom_commands:
                 if command_name.lower() in custom_commands:
@@ -22,6 +22,7 @@ class CustomCommands(Base):
             custom_commands[command_name] = message
         else:
             self.ex.cache.custom_commands[server_id] = {command_name: message}
+        self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.CUSTOM_COMMANDS)
 
     async def remove_custom_command(self, server_id, command_name):
         await self.ex.conn.execute("DELETE FROM general.customcommands WHERE serverid = $1 AND commandname = $2", server_id, command_name)
@@ -30,6 +31,9 @@ class CustomCommands(Base):
             custom_commands.pop(command_name)
         except Exception as e:
             log.console(f"{e} (Exception)", method=self.remove_custom_command)
+        if not custom_commands:
+            self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.CUSTOM_COMMANDS,
+                                              enabled=False)
 
     async def get_custom_command(self, server_id, command_name):
         commands = self.ex.cache.custom_commands.get(server_id)
@@ -42,7 +42,8 @@ class DataDog(Base):
         # some values at 0 are important such as active games, this was put in place to make sure they are updated at 0.
         metrics_at_zero = ['bias_games', 'guessing_games', 'commands_per_minute', 'n_words_per_minute',
                            'bot_api_idol_calls', 'bot_api_translation_calls', 'messages_received_per_min',
-                           'errors_per_minute', 'wolfram_per_minute', 'urban_per_minute']
+                           'errors_per_minute', 'wolfram_per_minute', 'urban_per_minute', 'thread_pool_queue',
+                           'process_pool_queue']
         if metric_name in metrics_at_zero and not value:
             value = 0
         else:
@@ -96,7 +97,11 @@ class DataDog(Base):
                 'wolfram_per_minute': self.ex.cache.wolfram_per_minute,
                 'urban_per_minute': self.ex.cache.urban_per_minute,
                 'active_user_reminders': active_user_reminders,
-                'gg_filter_enabled': gg_filtered_enabled
+                'gg_filter_enabled': gg_filtered_enabled,
+                'thread_pool_queue': self.ex.thread_pool_queue,
+                'process_pool_queue': self.ex.process_pool_queue,
+                'playing_cards_rendered': self.ex.u_blackjack.cards_rendered,
+                'playing_cards_per_second': self.ex.u_blackjack.get_card_generation_progress().get('cards_per_second')
             },
             'length_needed': {  # we need the len() of the metrics.
                 'bias_games': self.ex.cache.bias_games,
@@ -0,0 +1,167 @@
+from typing import Dict, Optional, Tuple
+
+from ..Base import Base
+from . import u_logger as log
+import asyncio
+
+
+# noinspection PyBroadException,PyPep8
+class GameResults(Base):
+    """Writes the results of finished guessing, unscramble, and bias games.
+
+    The cached scores (cache.guessing_game_counter, cache.unscramble_game_counter) are updated as soon as a game
+    ends. Only the points added since the last flush are kept here, so the results of every game that finishes
+    within the coalesce time are written with one query per table and a failed flush can be retried without
+    counting anything twice.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        # seconds to wait for other games to finish before writing the results. 0 writes the results right away.
+        self.coalesce_seconds = 1
+        self.max_retry_seconds = 60  # max seconds to wait before writing the results again after a failed flush.
+        self.flush_lock = asyncio.Lock()
+        self.flush_task: Optional[asyncio.Task] = None
+
+        self.pending_guessing_game_scores: Dict[int, Dict[str, int]] = {}  # {user_id: {difficulty: points to add}}
+        self.pending_unscramble_game_scores: Dict[int, Dict[str, int]] = {}  # {user_id: {difficulty: points to add}}
+        self.pending_bias_game_wins: Dict[Tuple[int, int], int] = {}  # {(user_id, idol_id): wins to add}
+
+    def get_pending_count(self) -> int:
+        """Get the amount of rows that are waiting to be written to the DB."""
+        return len(self.pending_guessing_game_scores) + len(self.pending_unscramble_game_scores) + \
+            len(self.pending_bias_game_wins)
+
+    async def add_guessing_game_scores(self, difficulty, players: Dict[int, int]):
+        """Add the scores of a finished guessing game.
+
+        :param difficulty: The difficulty of the game.
+        :param players: {user_id: score}
+        """
+        if self.add_scores(self.ex.cache.guessing_game_counter, self.pending_guessing_game_scores, difficulty,
+                           players):
+            await self.write_results()
+
+    async def add_unscramble_game_scores(self, difficulty, players: Dict[int, int]):
+        """Add the scores of a finished unscramble game.
+
+        :param difficulty: The difficulty of the game.
+        :param players: {user_id: score}
+        """
+        if self.add_scores(self.ex.cache.unscramble_game_counter, self.pending_unscramble_game_scores, difficulty,
+                           players):
+            await self.write_results()
+
+    async def add_bias_game_win(self, user_id, idol_id):
+        """Add a win to the idol that won a user's bias game.
+
+        :param user_id: The user id.
+        :param idol_id: The idol id of the winner.
+        """
+        self.pending_bias_game_wins[(user_id, idol_id)] = self.pending_bias_game_wins.get((user_id, idol_id), 0) + 1
+        await self.write_results()
+
+    def add_scores(self, counter, pending, difficulty, players: Dict[int, int]) -> bool:
+        """Add scores to the cached scores and the pending scores.
+
+        :param counter: The cached scores. {user_id: {difficulty: score}}
+        :param pending: The pending scores. {user_id: {difficulty: points to add}}
+        :param difficulty: The difficulty of the game.
+        :param players: {user_id: score}
+        :returns: True if the scores were added.
+        """
+        # make sure it is actually a difficulty since it is a column name.
+        if difficulty not in self.ex.cache.difficulty_levels:
+            log.console(f"{difficulty} is not a difficulty.", method=self.add_scores)
+            return False
+
+        for user_id, score in players.items():
+            score = score or 0
+            user_scores = counter.get(user_id)
+            if not user_scores:
+                user_scores = counter[user_id] = {"easy": 0, "medium": 0, "hard": 0}
+            user_scores[difficulty] = (user_scores.get(difficulty) or 0) + score
+
+            pending_scores = pending.setdefault(user_id, {})
+            pending_scores[difficulty] = pending_scores.get(difficulty, 0) + score
+        return bool(players)
+
+    async def write_results(self):
+        """Write the pending results now or after the coalesce time."""
+        if not self.coalesce_seconds and await self.flush():
+            return
+        if not self.flush_task or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self.flush_later())
+
+    async def flush_later(self):
+        """Wait for other games to finish and write all of their results together.
+
+        Keeps flushing until nothing is pending, since games that end during a flush do not schedule their own
+        flush and failed results are added back. The wait doubles after every failed flush.
+        """
+        delay = self.coalesce_seconds
+        while self.get_pending_count():
+            await asyncio.sleep(delay)
+            if await self.flush():
+                delay = self.coalesce_seconds
+            else:
+                delay = min(max(delay * 2, 1), self.max_retry_seconds)
+
+    async def shutdown(self):
+        """Stop waiting to flush and write the pending results right away."""
+        if self.flush_task and not self.flush_task.done():
+            self.flush_task.cancel()
+        await self.flush()
+
+    async def flush(self) -> bool:
+        """Write all pending results to the DB with one query per table.
+
+        Results that fail to write are added back to the pending results for the next flush.
+
+        :returns: False if the results could not be written.
+        """
+        async with self.flush_lock:
+            if not self.get_pending_count():
+                return True
+            if not self.ex.conn:
+                return False
+
+            guessing_game_scores, self.pending_guessing_game_scores = self.pending_guessing_game_scores, {}
+            unscramble_game_scores, self.pending_unscramble_game_scores = self.pending_unscramble_game_scores, {}
+            bias_game_wins, self.pending_bias_game_wins = self.pending_bias_game_wins, {}
+
+            try:
+                if guessing_game_scores:
+                    await self.ex.sql.s_guessinggame.add_scores(*self.get_score_columns(guessing_game_scores))
+                    guessing_game_scores = {}
+                if unscramble_game_scores:
+                    await self.ex.sql.s_unscramblegame.add_scores(*self.get_score_columns(unscramble_game_scores))
+                    unscramble_game_scores = {}
+                if bias_game_wins:
+                    user_ids, idol_ids = zip(*bias_game_wins.keys())
+                    await self.ex.sql.s_biasgame.add_wins(list(user_ids), list(idol_ids),
+                                                          list(bias_game_wins.values()))
+                    bias_game_wins = {}
+            except Exception as e:
+                log.console(f"{e} (Exception) - Failed to flush game results.", method=self.flush)
+                # the pending results are points to add, so the failed ones are added to anything newer.
+                for failed, pending in [(guessing_game_scores, self.pending_guessing_game_scores),
+                                        (unscramble_game_scores, self.pending_unscramble_game_scores)]:
+                    for user_id, failed_scores in failed.items():
+                        pending_scores = pending.setdefault(user_id, {})
+                        for difficulty, score in failed_scores.items():
+                            pending_scores[difficulty] = pending_scores.get(difficulty, 0) + score
+                for key, wins in bias_game_wins.items():
+                    self.pending_bias_game_wins[key] = self.pending_bias_game_wins.get(key, 0) + wins
+                return False
+            return True
+
+    @staticmethod
+    def get_score_columns(scores: Dict[int, Dict[str, int]]) -> tuple:
+        """Turn pending scores into the columns of the score tables.
+
+        :param scores: {user_id: {difficulty: points to add}}
+        :returns: (user ids, easy scores, medium scores, hard scores) None where a difficulty was not played.
+        """
+        return (list(scores.keys()), [user_scores.get("easy") for user_scores in scores.values()],
+                [user_scores.get("medium") for user_scores in scores.values()],
+                [user_scores.get("hard") for user_scores in scores.values()])
@@ -58,6 +58,7 @@ class GroupMembers(Base):
         """Set an idol/group alias for the bot."""
         alias = alias.lower()
         obj.aliases.append(alias)
+        self.index_name(obj, alias)
         is_group = int(not self.check_idol_object(obj))
         await self.ex.sql.s_groupmembers.set_global_alias(obj.id, alias, is_group)
 
@@ -69,12 +70,14 @@ class GroupMembers(Base):
             local_aliases.append(alias)
         else:
             obj.local_aliases[server_id] = [alias]
+        self.index_name(obj, alias, server_id)
         is_group = int(not self.check_idol_object(obj))
         await self.ex.sql.s_groupmembers.set_local_alias(obj.id, alias, is_group, server_id)
 
     async def remove_global_alias(self, obj, alias):
         """Remove a global idol/group alias """
         obj.aliases.remove(alias)
+        self.unindex_name(obj, alias)
         is_group = int(not self.check_idol_object(obj))
         await self.ex.sql.s_groupmembers.remove_global_alias(obj.id, alias, is_group)
 
@@ -84,8 +87,170 @@ class GroupMembers(Base):
         local_aliases = obj.local_aliases.get(server_id)
         if local_aliases:
             local_aliases.remove(alias)
+            self.unindex_name(obj, alias, server_id)
         await self.ex.sql.s_groupmembers.remove_local_alias(obj.id, alias, is_group, server_id)
 
+    def get_name_indexes(self, obj):
+        """Get the global name index and the local alias overlay that an idol/group belongs to.
+
+        :param obj: Idol/Group object.
+        :returns: (dict, dict) The global name index and the local alias overlay.
+        """
+        if self.check_idol_object(obj):
+            return self.ex.cache.idol_names, self.ex.cache.idol_local_names
+        return self.ex.cache.group_names, self.ex.cache.group_local_names
+
+    def get_name_matchers(self, obj):
+        """Get the global substring matcher and the local alias matchers that an idol/group belongs to.
+
+        :param obj: Idol/Group object.
+        :returns: (models.PhraseMatcher, dict) The global matcher and the local alias matchers by server id.
+        """
+        if self.check_idol_object(obj):
+            return self.ex.cache.idol_matcher, self.ex.cache.idol_local_matchers
+        return self.ex.cache.group_matcher, self.ex.cache.group_local_matchers
+
+    def get_object_names(self, obj) -> list:
+        """Get every lowercased name that an idol/group can be found by.
+
+        Idols are only found by their full name and stage name if they have both.
+
+        :param obj: Idol/Group object.
+        :returns: (list) [(name, server_id)] where the server id is None for global names.
+        """
+        names = []
+        if self.check_idol_object(obj):
+            if obj.full_name and obj.stage_name:
+                names.append((str(obj.full_name).lower(), None))
+                names.append((str(obj.stage_name).lower(), None))
+        elif obj.name:
+            names.append((str(obj.name).lower(), None))
+        names += [(alias.lower(), None) for alias in obj.aliases]
+        for server_id, local_aliases in obj.local_aliases.items():
+            names += [(alias.lower(), server_id) for alias in local_aliases]
+        return names
+
+    def index_name(self, obj, name, server_id=None):
+        """Add a name of an idol/group to the name index and substring matchers.
+
+        :param obj: Idol/Group object.
+        :param name: The name or alias.
+        :param server_id: The server id if it is a local alias.
+        """
+        name = name.lower()
+        global_names, local_names = self.get_name_indexes(obj)
+        global_matcher, local_matchers = self.get_name_matchers(obj)
+        if server_id:
+            names = local_names.setdefault(server_id, {})
+            matcher = local_matchers.get(server_id)
+            if not matcher:
+                matcher = local_matchers[server_id] = self.ex.u_objects.PhraseMatcher()
+        else:
+            names, matcher = global_names, global_matcher
+        names.setdefault(name, set()).add(obj.id)
+        matcher.add(name, obj.id)
+        self.ex.cache.fuzzy_index = None
+
+    def unindex_name(self, obj, name, server_id=None, check_remaining=True):
+        """Remove a name of an idol/group from the name index and substring matchers.
+
+        :param obj: Idol/Group object.
+        :param name: The name or alias.
+        :param server_id: The server id if it is a local alias.
+        :param check_remaining: Keep the name if the object can still be found by it.
+        """
+        name = name.lower()
+        if check_remaining and (name, server_id) in self.get_object_names(obj):
+            # the object is still known by the same name (ex: an alias that is the same as the stage name).
+            return
+
+        global_names, local_names = self.get_name_indexes(obj)
+        global_matcher, local_matchers = self.get_name_matchers(obj)
+        names = local_names.get(server_id) if server_id else global_names
+        matcher = local_matchers.get(server_id) if server_id else global_matcher
+        if matcher:
+            matcher.remove(name, obj.id)
+        self.ex.cache.fuzzy_index = None
+        if not names or name not in names:
+            return
+        names[name].discard(obj.id)
+        if not names[name]:
+            names.pop(name)
+
+    def index_names(self, obj):
+        """Add all names of an idol/group to the name index and substring matchers.
+
+        :param obj: Idol/Group object.
+        """
+        for name, server_id in self.get_object_names(obj):
+            self.index_name(obj, name, server_id)
+
+    def unindex_names(self, obj):
+        """Remove all names of an idol/group from the name index and substring matchers.
+
+        :param obj: Idol/Group object.
+        """
+        for name, server_id in self.get_object_names(obj):
+            self.unindex_name(obj, name, server_id, check_remaining=False)
+
+    def get_fuzzy_index(self) -> models.FuzzyIndex:
+        """Get the typo tolerant index of all idol/group names. It is rebuilt if the names changed since the last use.
+
+        :returns: (models.FuzzyIndex) The fuzzy index of idol and group objects.
+        """
+        if self.ex.cache.fuzzy_index:
+            return self.ex.cache.fuzzy_index
+
+        fuzzy_index = self.ex.u_objects.FuzzyIndex()
+        for idol in self.ex.cache.idols:
+            for name in [idol.full_name, idol.stage_name, idol.former_full_name, idol.former_stage_name]:
+                if name:
+                    fuzzy_index.add(str(name), idol)
+        for obj in self.ex.cache.idols + self.ex.cache.groups:
+            if not self.check_idol_object(obj) and obj.name:
+                fuzzy_index.add(str(obj.name), obj)
+            for alias in obj.aliases:
+                fuzzy_index.add(alias, obj)
+            for server_id, local_aliases in obj.local_aliases.items():
+                for alias in local_aliases:
+                    fuzzy_index.add(alias, obj, server_id)
+        self.ex.cache.fuzzy_index = fuzzy_index
+        return fuzzy_index
+
+    def get_idol_index(self) -> models.IdolIndex:
+        """Get the bitsets of idol attributes. It is rebuilt if an idol changed since the last use.
+
+        :returns: (models.IdolIndex) The index of all idols.
+        """
+        if not self.ex.cache.idol_index:
+            self.ex.cache.idol_index = self.ex.u_objects.IdolIndex(self.ex.cache.idols)
+        return self.ex.cache.idol_index
+
+    async def search_fuzzy(self, name, limit=5, server_id=None) -> list:
+        """Search for idols and groups with names similar to a (possibly misspelled) name.
+
+        :param name: The name to search for.
+        :param limit: The max amount of idols/groups to return.
+        :param server_id: The server id to also search the local aliases of.
+        :returns: (List[Union[models.Idol, models.Group]]) Idols/Groups ranked from closest to furthest.
+        """
+        return [obj for obj, distance in self.get_fuzzy_index().search(name, limit, server_id)]
+
+    @staticmethod
+    def get_ids_by_name(name, global_names, local_names, server_id=None) -> list:
+        """Get the ids of the idols/groups that exactly match a name.
+
+        :param name: Lowercased name to search for.
+        :param global_names: The global name index.
+        :param local_names: The local alias overlay.
+        :param server_id: The server id to also search the local aliases of.
+        :returns: (list) Sorted object ids.
+        """
+        object_ids = set(global_names.get(name) or ())
+        if server_id and local_names.get(server_id):
+            object_ids.update(local_names[server_id].get(name) or ())
+        return sorted(object_ids)
+
     async def get_member(self, idol_id) -> Optional[models.Idol]:
         """Get a member by the idol id."""
         try:
@@ -94,9 +259,7 @@ class GroupMembers(Base):
             # purposefully create an error if an idol id was not passed in. This is useful to not check for it
             # in other commands.
             return
-        for idol in self.ex.cache.idols:
-            if idol.id == idol_id:
-                return idol
+        return self.ex.cache.idols_by_id.get(idol_id)
 
     async def get_group(self, group_id) -> Optional[models.Group]:
         """Get a group by the group id."""
@@ -106,9 +269,7 @@ class GroupMembers(Base):
             # purposefully create an error if a group id was not passed in. This is useful to not check for it
             # in other commands.
             return
-        for group in self.ex.cache.groups:
-            if group.id == group_id:
-                return group
+        return self.ex.cache.groups_by_id.get(group_id)
 
     async def format_card_fields(self, obj, card_formats):
         """Formats all relevant card fields to be displayed"""
@@ -179,32 +340,64 @@ class GroupMembers(Base):
 
     async def check_channel_sending_photos(self, channel_id):
         """Checks a text channel ID to see if it is restricted from having idol photos sent."""
+        if not self.ex.u_cache.get_channel_features(channel_id) & self.ex.u_objects.ChannelFeature.RESTRICTED_PHOTOS:
+            return True
         channel = self.ex.cache.restricted_channels.get(channel_id)
         if channel:
             if not channel[1]:
                 return False  # returns False if they are restricted.
         return True
 
+    def add_restricted_channel_to_cache(self, channel_id, server_id, send_all):
+        """Adds a restricted channel to cache.
+
+        This and delete_restricted_channel_from_cache are the only writers of cache.restricted_channels so that the
+        RESTRICTED_PHOTOS and PHOTO_CHANNEL features always match it.
+
+        :param channel_id: The channel id.
+        :param server_id: The server id of the channel.
+        :param send_all: 1 if idol photos are only sent to this channel, 0 if idol photos are not sent to it.
+        """
+        self.ex.cache.restricted_channels[channel_id] = [server_id, send_all]
+        self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.RESTRICTED_PHOTOS)
+        if send_all == 1:
+            self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.PHOTO_CHANNEL)
+
     async def delete_restricted_channel_from_cache(self, channel_id, send_all):
         """Deletes restricted channel from cache."""
         r_channel = self.ex.cache.restricted_channels.get(channel_id)
         if r_channel:
             if r_channel[1] == send_all:
                 self.ex.cache.restricted_channels.pop(channel_id)
+                self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.RESTRICTED_PHOTOS,
+                                                    enabled=False)
+                server_id = r_channel[0]
+                if send_all == 1 and self.find_channel_id_sending_photos(server_id) is None:
+                    self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.PHOTO_CHANNEL,
+                                                      enabled=False)
 
     async def check_server_sending_photos(self, server_id):
         """Checks a server to see if it has a specific channel to send idol photos to"""
-        for channel in self.ex.cache.restricted_channels:
-            channel_info = self.ex.cache.restricted_channels.get(channel)
-            if channel_info[0] == server_id and channel_info[1] == 1:
-                return True  # returns True if they are supposed to send it to a specific channel.
+        # returns True if they are supposed to send it to a specific channel.
+        return bool(self.ex.u_cache.get_guild_features(server_id) & self.ex.u_objects.GuildFeature.PHOTO_CHANNEL)
 
     async def get_channel_sending_photos(self, server_id):
         """Returns a text channel from a server that requires idol photos to be sent to a specific text channel."""
-        for channel_id in self.ex.cache.restricted_channels:
-            channel_info = self.ex.cache.restricted_channels.get(channel_id)
+        if not self.ex.u_cache.get_guild_features(server_id) & self.ex.u_objects.GuildFeature.PHOTO_CHANNEL:
+            return
+        channel_id = self.find_channel_id_sending_photos(server_id)
+        if channel_id is not None:
+            return self.ex.client.get_channel(channel_id)
+
+    def find_channel_id_sending_photos(self, server_id):
+        """Search the restricted channels for the channel a server requires idol photos to be sent to.
+
+        :param server_id: The server id.
+        :returns: The channel id or None if the server does not have one.
+        """
+        for channel_id, channel_info in self.ex.cache.restricted_channels.items():
             if channel_info[0] == server_id and channel_info[1] == 1:
-                return self.ex.client.get_channel(channel_id)
+                return channel_id
 
     def log_idol_command(self, message):
         """Log an idol photo that was called."""
@@ -220,12 +413,68 @@ class GroupMembers(Base):
         return self.ex.first_result(
             await self.ex.conn.fetchrow("SELECT Count FROM groupmembers.Count WHERE MemberID = $1", member_id))
 
-    async def get_random_idol(self):
-        """Get a random idol with at least 1 photo."""
-        idol = random.choice(self.ex.cache.idols)
-        if not idol.photo_count:
-            idol = await self.get_random_idol()
-        return idol
+    def reset_idol_samplers(self):
+        """Remove the idol samplers so that they are rebuilt on the next draw.
+
+        The samplers are only rebuilt when they are None, since an empty sampler (no idols to draw) is falsy.
+        """
+        self.ex.cache.idol_sampler = None
+        self.ex.cache.weighted_idol_sampler = None
+        self.ex.cache.group_idol_samplers = {}
+        self.ex.cache.card_idol_sampler = None
+
+    def create_idol_samplers(self):
+        """Create the samplers of all idols with photos and of the members with photos of every group."""
+        idols_with_photos = [idol for idol in self.ex.cache.idols if idol.photo_count]
+        group_members = {}
+        for idol in idols_with_photos:
+            for group_id in idol.groups:
+                group_members.setdefault(group_id, []).append(idol)
+
+        self.ex.cache.idol_sampler = self.ex.u_objects.WeightedSampler(idols_with_photos)
+        self.ex.cache.weighted_idol_sampler = self.ex.u_objects.WeightedSampler(
+            idols_with_photos, [idol.photo_count for idol in idols_with_photos])
+        self.ex.cache.group_idol_samplers = {group_id: self.ex.u_objects.WeightedSampler(members)
+                                             for group_id, members in group_members.items()}
+        self.ex.cache.card_idol_sampler = self.ex.u_objects.WeightedSampler(
+            [idol for idol in self.ex.cache.idols if idol.thumbnail])
+
+    def get_idol_sampler(self, weighted=False) -> models.WeightedSampler:
+        """Get the sampler of all idols with photos.
+
+        :param weighted: Whether idols with more photos are more likely to be drawn.
+        :returns: (models.WeightedSampler)
+        """
+        if self.ex.cache.idol_sampler is None:
+            self.create_idol_samplers()
+        return self.ex.cache.weighted_idol_sampler if weighted else self.ex.cache.idol_sampler
+
+    def get_group_idol_sampler(self, group_id) -> Optional[models.WeightedSampler]:
+        """Get the sampler of the members with photos of a group.
+
+        :param group_id: The group id.
+        :returns: (models.WeightedSampler) or None if none of the members have photos.
+        """
+        if self.ex.cache.idol_sampler is None:
+            self.create_idol_samplers()
+        return self.ex.cache.group_idol_samplers.get(group_id)
+
+    def get_card_idol_sampler(self) -> models.WeightedSampler:
+        """Get the sampler of the idols with an avatar that can be the background of a playing card.
+
+        :returns: (models.WeightedSampler)
+        """
+        if self.ex.cache.idol_sampler is None:
+            self.create_idol_samplers()
+        return self.ex.cache.card_idol_sampler
+
+    async def get_random_idol(self, weighted=False):
+        """Get a random idol with at least 1 photo.
+
+        :param weighted: Whether idols with more photos are more likely to be drawn.
+        :returns: (models.Idol) or None if no idols have photos.
+        """
+        return self.get_idol_sampler(weighted).sample()
 
     @staticmethod
     async def get_all_groups():
@@ -266,6 +515,45 @@ class GroupMembers(Base):
                 global_aliases.append(alias)
         return global_aliases, local_aliases
 
+    async def get_all_db_aliases(self, group=False) -> dict:
+        """Get the aliases of all idols or all groups from the database with a single query.
+
+        :param group: Whether to get the aliases of groups instead of idols.
+        :returns: (dict) {object_id: (global_aliases, local_aliases)} in the same format as get_db_aliases.
+        """
+        all_aliases = {}
+        for object_id, alias, server_id in await self.ex.sql.s_groupmembers.fetch_all_aliases(group):
+            global_aliases, local_aliases = all_aliases.setdefault(object_id, ([], {}))
+            if server_id:
+                server_list = local_aliases.get(server_id)
+                if server_list:
+                    server_list.append(alias)
+                else:
+                    local_aliases[server_id] = [alias]
+            else:
+                global_aliases.append(alias)
+        return all_aliases
+
+    async def get_all_db_group_members(self):
+        """Get the groups of every idol and the members of every group from the database with a single query.
+
+        :returns: (dict, dict) {idol_id: [group ids]} and {group_id: [idol ids]} with duplicates removed.
+        """
+        idol_to_groups = {}
+        group_to_idols = {}
+        for idol_id, group_id in await self.ex.sql.s_groupmembers.fetch_all_idols_to_groups():
+            idol_to_groups.setdefault(idol_id, {})[group_id] = None
+            group_to_idols.setdefault(group_id, {})[idol_id] = None
+        return {idol_id: list(group_ids) for idol_id, group_ids in idol_to_groups.items()}, \
+               {group_id: list(idol_ids) for group_id, idol_ids in group_to_idols.items()}
+
+    async def get_all_db_idol_called(self):
+        """Get the amount of times every idol has been called from the database with a single query.
+
+        :returns: (dict) {idol_id: amount of times called}
+        """
+        return {idol_id: count for idol_id, count in await self.ex.sql.s_groupmembers.fetch_all_idol_called()}
+
     async def get_db_groups_from_member(self, member_id):
         """Return all the group ids an idol is in from the database."""
         groups = await self.ex.sql.s_groupmembers.fetch_db_groups_from_member(member_id)
@@ -280,12 +568,16 @@ class GroupMembers(Base):
 
         if group_id not in member.groups:
             member.groups.append(group_id)
+            self.ex.cache.idol_index = None
+            self.reset_idol_samplers()
 
         await self.ex.sql.s_groupmembers.add_idol_to_group(member_id, group_id)
 
     async def remove_idol_from_group(self, member_id: int, group_id: int):
         (await self.ex.u_group_members.get_group(group_id)).members.remove(member_id)
         (await self.ex.u_group_members.get_member(member_id)).groups.remove(group_id)
+        self.ex.cache.idol_index = None
+        self.reset_idol_samplers()
 
         await self.ex.sql.s_groupmembers.remove_idol_from_group(member_id, group_id)
 
@@ -513,36 +805,27 @@ class GroupMembers(Base):
             log.console(f"{e} (Exception) - Send Dead Image", method=self.send_dead_image)
 
     async def get_idol_where_member_matches_name(self, name, mode=0, server_id=None):
-        """Get idol object if the name matches an idol"""
-        idol_list = []
-        name = name.lower()
-        for idol in self.ex.cache.idols:
-            local_aliases = None
-            if server_id:
-                local_aliases = idol.local_aliases.get(server_id)
-            if not mode:
-                if idol.full_name and idol.stage_name:
-                    if name == idol.full_name.lower() or name == idol.stage_name.lower():
-                        idol_list.append(idol)
-            else:
-                if idol.full_name and idol.stage_name:
-                    if idol.stage_name.lower() in name or idol.full_name.lower() in name:
-                        idol_list.append(idol)
-            for alias in idol.aliases:
-                if not mode:
-                    if alias == name:
-                        idol_list.append(idol)
-                else:
-                    if alias in name:
-                        idol_list.append(idol)
-            if local_aliases:
-                for alias in local_aliases:
-                    if await self.check_to_add_alias_to_list(alias, name, mode):
-                        idol_list.append(idol)
+        """Get idol object if the name matches an idol.
 
-        # remove any duplicates
-        idols = list(dict.fromkeys(idol_list))
-        return idols
+        :param name: The name to search for.
+        :param mode: 0 if the name must exactly match, 1 if the name only has to contain a name/alias.
+        :param server_id: The server id to also search the local aliases of.
+        :returns: (List[models.Idol]) Idols that matched.
+        """
+        name = name.lower()
+        if not mode:
+            idol_ids = self.get_ids_by_name(name, self.ex.cache.idol_names, self.ex.cache.idol_local_names,
+                                            server_id)
+        else:
+            idol_ids = set()
+            for matched_ids in self.ex.cache.idol_matcher.search(name).values():
+                idol_ids.update(matched_ids)
+            local_matcher = self.ex.cache.idol_local_matchers.get(server_id) if server_id else None
+            if local_matcher:
+                for matched_ids in local_matcher.search(name).values():
+                    idol_ids.update(matched_ids)
+            idol_ids = sorted(idol_ids)
+        return [self.ex.cache.idols_by_id[idol_id] for idol_id in idol_ids if idol_id in self.ex.cache.idols_by_id]
 
     @staticmethod
     async def check_to_add_alias_to_list(alias, name, mode=0):
@@ -556,45 +839,41 @@ class GroupMembers(Base):
         return False
 
     async def get_group_where_group_matches_name(self, name, mode=0, server_id=None):
-        """Get group ids for a specific name."""
-        group_list = []
+        """Get group ids for a specific name.
+
+        In substring mode, the group names and aliases that matched are stripped from the name so that the remaining
+        name can be used to search for idols. The longest matches are stripped first.
+
+        :param name: The name to search for.
+        :param mode: 0 if the name must exactly match, 1 if the name only has to contain a name/alias.
+        :param server_id: The server id to also search the local aliases of.
+        :returns: (List[models.Group]) Groups that matched if exact. Otherwise, (List[models.Group], str) with the
+            remaining name.
+        """
         name = name.lower()
-        for group in self.ex.cache.groups:
-            try:
-                aliases = group.aliases
-                local_aliases = None
-                if server_id:
-                    local_aliases = group.local_aliases.get(server_id)
-                if not mode:
-                    if group.name:
-                        if name == group.name.lower():
-                            group_list.append(group)
-                else:
-                    if group.name:
-                        if group.name.lower() in name:
-                            group_list.append(group)
-                            name = (name.lower()).replace(group.name, "")
-                for alias in aliases:
-                    if await self.check_to_add_alias_to_list(alias, name, mode):
-                        group_list.append(group)
-                        if mode:
-                            name = (name.lower()).replace(alias, "")
-                if local_aliases:
-                    for alias in local_aliases:
-                        if await self.check_to_add_alias_to_list(alias, name, mode):
-                            group_list.append(group)
-                            if mode:
-                                name = (name.lower()).replace(alias, "")
-
-            except Exception as e:
-                log.console(f"{e} (Exception)", method=self.get_group_where_group_matches_name)
-        # remove any duplicates
-        group_list = list(dict.fromkeys(group_list))
-        # print(id_list)
         if not mode:
-            return group_list
-        else:
-            return group_list, name
+            group_ids = self.get_ids_by_name(name, self.ex.cache.group_names, self.ex.cache.group_local_names,
+                                             server_id)
+            return [self.ex.cache.groups_by_id[group_id] for group_id in group_ids
+                    if group_id in self.ex.cache.groups_by_id]
+
+        matches = self.ex.cache.group_matcher.search(name)
+        local_matcher = self.ex.cache.group_local_matchers.get(server_id) if server_id else None
+        if local_matcher:
+            for phrase, matched_ids in local_matcher.search(name).items():
+                matches[phrase] = matches[phrase] | matched_ids if phrase in matches else matched_ids
+
+        group_ids = set()
+        for phrase in sorted(matches, key=len, reverse=True):
+            # a shorter match may have been part of a longer match that was already stripped.
+            if phrase not in name:
+                continue
+            group_ids.update(matches[phrase])
+            name = name.replace(phrase, "")
+
+        group_list = [self.ex.cache.groups_by_id[group_id] for group_id in sorted(group_ids)
+                      if group_id in self.ex.cache.groups_by_id]
+        return group_list, name
 
     async def process_names(self, ctx, page_number_or_group, mode):
         """Structures the input for idol names commands and sends information to transfer the names to the channels."""
@@ -617,14 +896,8 @@ class GroupMembers(Base):
         return member_list or None
 
     async def update_member_count(self, idol):
-        """Update the amount of times an idol has been called."""
-        if not idol.called:
-            idol.called = 1
-            await self.ex.conn.execute("INSERT INTO groupmembers.count VALUES($1, $2)", idol.id, 1)
-        else:
-            idol.called += 1
-            await self.ex.conn.execute("UPDATE groupmembers.Count SET Count = $1 WHERE MemberID = $2", idol.called,
-                                       idol.id)
+        """Update the amount of times an idol has been called. The DB is updated in the next counter flush."""
+        await self.ex.u_counters.add_idol_call(idol)
 
     async def set_as_group_photo(self, link):
         """Set a photo as a group photo."""
@@ -666,8 +939,39 @@ class GroupMembers(Base):
             print(f"{e} -> u_groupmembers.__post_msg")
         return message
 
+    async def fetch_idol_image(self, idol, guessing_game=False) -> dict:
+        """Request a photo of an idol from the API without posting it.
+
+        :param idol: (IreneUtility Idol object) Idol to get a photo of.
+        :param guessing_game: (bool) Whether the photo is for a guessing game (no videos and a single face).
+        :returns: (dict) The API response with the status code added as 'status'.
+            Successful responses also contain 'final_image_link', 'location', and 'file_name'.
+        """
+        # params to pass into api endpoint.
+        api_params = {
+            'allow_video': int(not guessing_game),
+            'redirect': 0,  # we do not want the endpoint to redirect us to the image.
+            'min_faces': 1,
+            'max_faces': 1 if guessing_game else 999
+        }
+
+        # increment amount of times we are calling api.
+        self.ex.cache.bot_api_idol_calls += 1
+
+        # endpoint to access.
+        endpoint = f"{self.api_endpoint if self.ex.test_bot else self.local_api_endpoint}{idol.id}"
+
+        # make api request.
+        async with self.ex.session.post(endpoint, headers=self.api_headers, params=api_params) as r:
+            image_data = {}
+            if r.status in self.successful_codes:
+                image_data = await r.json()
+            image_data['status'] = r.status
+            return image_data
+
     async def __get_image_msg(self, channel, idol, group_id=None, photo_link=None, user_id=None, guild_id=None,
-                              special_message=None, guessing_game=False, scores=None, msg_timeout=None):
+                              special_message=None, guessing_game=False, scores=None, msg_timeout=None,
+                              image_data=None):
         """Make an idol photo request to API and post a msg.
 
         :param channel: (discord.Channel) Channel that the embed/image should be posted to.
@@ -680,6 +984,7 @@ class GroupMembers(Base):
         :param guessing_game: (bool) Whether the method is called from a guessing game.
         :param scores: (dict) Any scores that may come with a game. In a format of {user id : score}
         :param msg_timeout: Amount of time before deleting a message.
+        :param image_data: (dict) A response of fetch_idol_image that was prefetched. The API is called if None.
         """
         # args from this method (used for recursive purposes).
         args = {idol, group_id, channel}
@@ -700,54 +1005,42 @@ class GroupMembers(Base):
         embed = None
         msg = None
 
-        # params to pass into api endpoint.
-        api_params = {
-            'allow_video': int(not guessing_game),
-            'redirect': 0,  # we do not want the endpoint to redirect us to the image.
-            'min_faces': 1,
-            'max_faces': 1 if guessing_game else 999
-        }
-
-        # increment amount of times we are calling api.
-        self.ex.cache.bot_api_idol_calls += 1
+        prefetched = image_data is not None
+        if not prefetched:
+            image_data = await self.fetch_idol_image(idol, guessing_game=guessing_game)
+        status = image_data['status']
 
-        # endpoint to access.
-        endpoint = f"{self.api_endpoint if self.ex.test_bot else self.local_api_endpoint}{idol.id}"
-
-        # make api request.
-        async with self.ex.session.post(endpoint, headers=self.api_headers, params=api_params) as r:
-            if r.status in self.successful_codes:
-                # define variables if we had a successful connection.
-                data = await r.json()
-                image_host_url = data.get('final_image_link')
-                file_location = data.get('location')
-                file_name = data.get('file_name')
-
-            if r.status in [200, 301]:
-                if self.ex.upload_from_host:
-                    file = await self.__handle_file(file_location, file_name)
-            elif r.status == 415:  # handle videos
-                # Make sure we do not get videos in a guessing game.
-                # The new api params will make sure that we do not reach this point in a guessing game.
-                # However, just in case the file was not properly scanned (new uploads), this condition will remain.
-                if guessing_game:
-                    return await self.__get_image_msg(*args, **kwargs)
+        # define variables if we had a successful connection.
+        image_host_url = image_data.get('final_image_link')
+        file_location = image_data.get('location')
+        file_name = image_data.get('file_name')
 
+        if status in [200, 301]:
+            if self.ex.upload_from_host:
                 file = await self.__handle_file(file_location, file_name)
-                if not file:
-                    return await self.__get_image_msg(*args, **kwargs)
-            else:
-                # deal with errors.
-                await self.__handle_error(channel, idol.id, r.status)
-                return msg, photo_link
+        elif status == 415:  # handle videos
+            # Make sure we do not get videos in a guessing game.
+            # The new api params will make sure that we do not reach this point in a guessing game.
+            # However, just in case the file was not properly scanned (new uploads), this condition will remain.
+            if guessing_game:
+                return await self.__get_image_msg(*args, **kwargs)
+
+            file = await self.__handle_file(file_location, file_name)
+            if not file:
+                return await self.__get_image_msg(*args, **kwargs)
+        else:
+            # deal with errors.
+            await self.__handle_error(channel, idol.id, status)
+            return msg, photo_link
 
         if guessing_game:
             # discord may have bad image loading time, so we will wait 2 seconds.
             # this is important because we want the guessing time to be matched up to when the photo appears.
-            if not self.ex.upload_from_host:
+            # a prefetched image was created on the host at least a round ago, so it does not need to wait.
+            if not self.ex.upload_from_host and not prefetched:
                 await asyncio.sleep(2)
 
-        if (not file or self.ex.upload_from_host) and r.status != 415:
+        if (not file or self.ex.upload_from_host) and status != 415:
             embed = await self.get_idol_post_embed(group_id, idol, image_host_url, user_id=user_id,
                                                    guild_id=channel.guild.id, guessing_game=guessing_game,
                                                    scores=scores)
@@ -843,6 +1136,7 @@ class GroupMembers(Base):
         :param guessing_game: (bool) Whether the method is called from a guessing game.
         :param scores: (dict) Any scores that may come with a game. In a format of {user id : score}
         :param msg_timeout: Amount of time before deleting a message.
+        :param image_data: (dict) A prefetched response of fetch_idol_image to post instead of calling the API.
         """
         msg, image_host = None, None
 
@@ -974,14 +1268,6 @@ class GroupMembers(Base):
     async def choose_random_member(self, members=None, groups=None):
         """Choose a random member object from a member or group list given."""
 
-        async def check_photo_count(t_member_ids):
-            """chooses a random idol and returns one that has photos."""
-            t_member_id = random.choice(t_member_ids)
-            t_member = await self.get_member(t_member_id)
-            if not t_member.photo_count:
-                t_member = await check_photo_count(t_member_ids)
-            return t_member
-
         idol = None
         group_idol = None
         groups_with_photos = []
@@ -991,8 +1277,9 @@ class GroupMembers(Base):
                 if group.photo_count:
                     groups_with_photos.append(group)
         if groups_with_photos:
-            member_ids = (random.choice(groups_with_photos)).members
-            group_idol = await check_photo_count(member_ids)
+            group_sampler = self.get_group_idol_sampler(random.choice(groups_with_photos).id)
+            if group_sampler:
+                group_idol = group_sampler.sample()
 
         if members:
             new_members = []
@@ -1143,18 +1430,33 @@ class GroupMembers(Base):
             await asyncio.sleep(0)  # bare yield
             await group.send_images_to_host()
 
-    async def add_idol_to_cache(self, **kwargs) -> models.Idol:
+    async def add_idol_to_cache(self, aliases=None, groups=None, called=None, **kwargs) -> models.Idol:
         """Add new idol to Cache.
 
+        The aliases, groups, and called amount are fetched from the database when they are not passed in.
+
+        :param aliases: (tuple) Pre-fetched global aliases and local aliases of the idol.
+        :param groups: (list) Pre-fetched group ids of the idol.
+        :param called: (int) Pre-fetched amount of times the idol has been called.
         :returns: (models.Idol) The Idol object that was created.
         """
         idol_obj = self.ex.u_objects.Idol(**kwargs)
-        idol_obj.aliases, idol_obj.local_aliases = await self.ex.u_group_members.get_db_aliases(idol_obj.id)
+        if aliases is None:
+            aliases = await self.ex.u_group_members.get_db_aliases(idol_obj.id)
+        idol_obj.aliases, idol_obj.local_aliases = aliases
+        if groups is None:
+            groups = await self.ex.u_group_members.get_db_groups_from_member(idol_obj.id)
         # add all group ids and remove potential duplicates
-        idol_obj.groups = list(dict.fromkeys(await self.ex.u_group_members.get_db_groups_from_member(idol_obj.id)))
-        idol_obj.called = await self.ex.u_group_members.get_db_idol_called(idol_obj.id)
+        idol_obj.groups = list(dict.fromkeys(groups))
+        if called is None:
+            called = await self.ex.u_group_members.get_db_idol_called(idol_obj.id)
+        idol_obj.called = called
         idol_obj.photo_count = self.ex.cache.idol_photos.get(idol_obj.id) or 0
         self.ex.cache.idols.append(idol_obj)
+        self.ex.cache.idols_by_id[idol_obj.id] = idol_obj
+        self.index_names(idol_obj)
+        self.ex.cache.idol_index = None
+        self.reset_idol_samplers()
 
         if not idol_obj.photo_count:
             return idol_obj
@@ -1172,19 +1474,28 @@ class GroupMembers(Base):
             self.ex.cache.idols_easy.add(idol_obj)
         return idol_obj
 
-    async def add_group_to_cache(self, **kwargs) -> models.Group:
+    async def add_group_to_cache(self, aliases=None, members=None, **kwargs) -> models.Group:
         """Add new group to Cache.
 
+        The aliases and members are fetched from the database when they are not passed in.
+
+        :param aliases: (tuple) Pre-fetched global aliases and local aliases of the group.
+        :param members: (list) Pre-fetched idol ids in the group.
         :returns: (models.Group) The Group object that was created.
         """
         group_obj = self.ex.u_objects.Group(**kwargs)
-        group_obj.aliases, group_obj.local_aliases = await self.get_db_aliases(group_obj.id, group=True)
+        if aliases is None:
+            aliases = await self.get_db_aliases(group_obj.id, group=True)
+        group_obj.aliases, group_obj.local_aliases = aliases
+        if members is None:
+            members = await self.get_db_members_in_group(group_obj.id)
         # add all idol ids and remove potential duplicates
-        group_obj.members = list(
-            dict.fromkeys(await self.get_db_members_in_group(group_obj.id)))
+        group_obj.members = list(dict.fromkeys(members))
 
         group_obj.photo_count = self.ex.cache.group_photos.get(group_obj.id) or 0
         self.ex.cache.groups.append(group_obj)
+        self.ex.cache.groups_by_id[group_obj.id] = group_obj
+        self.index_names(group_obj)
         return group_obj
 
     async def update_info(self, obj_id, column, content, group=False):
@@ -1218,7 +1529,19 @@ class GroupMembers(Base):
         if not obj:
             raise KeyError
 
+        # the names of the object are re-indexed in case the column changes a name.
+        name_column = column.lower() in ["fullname", "stagename", "groupname"]
+        if column.lower() in ["formerfullname", "formerstagename"]:
+            # former names are only a part of the fuzzy index.
+            self.ex.cache.fuzzy_index = None
+        if name_column:
+            self.unindex_names(obj)
         obj.set_attribute(column, content)
+        if not group:
+            # the gender, difficulty, or thumbnail of the idol may have changed.
+            self.ex.cache.idol_index = None
+        if name_column:
+            self.index_names(obj)
 
         if column.lower() in self.ex.sql.s_groupmembers.IMAGE_COLUMNS:
             await obj.send_images_to_host()
@@ -1,6 +1,6 @@
 from .. import models
 from ..Base import Base
-from typing import List, Dict
+from typing import List, Dict, Set, Optional, Tuple
 import time
 import json
 
@@ -32,6 +32,12 @@ class Cache(Base):
 
         self.channels_with_disabled_games = []
 
+        # features of channels/guilds that need to be checked for every message. Ids without features are not stored.
+        self.channel_features: Dict[int, int] = {}  # {channel_id: models.ChannelFeature mask}
+        self.guild_features: Dict[int, int] = {}  # {server_id: models.GuildFeature mask}
+        # interactions disabled in servers.
+        self.disabled_interactions: Dict[int, frozenset] = {}  # {server_id: frozenset(interactions)}
+
         # Amount of times a command has been used.
         self.command_counter: Dict[str, int] = {}  # { command_name : amount_of_times_used }
         # Photo Count of groups
@@ -78,11 +84,35 @@ class Cache(Base):
         """
         self.temp_channels: Dict[int, int] = {}
 
-        # TODO: convert to dict based on their idol/group id
         # list of idol objects
         self.idols: List[models.Idol] = []
         # list of group objects
         self.groups: List[models.Group] = []
+        # idol objects by their idol id. Must be kept in sync with self.idols
+        self.idols_by_id: Dict[int, models.Idol] = {}
+        # group objects by their group id. Must be kept in sync with self.groups
+        self.groups_by_id: Dict[int, models.Group] = {}
+        # exact match index of idol full names, stage names, and global aliases.
+        self.idol_names: Dict[str, Set[int]] = {}  # {lowercased name: {idol ids}}
+        # exact match index of group names and global aliases.
+        self.group_names: Dict[str, Set[int]] = {}  # {lowercased name: {group ids}}
+        # local alias overlays of the name indexes.
+        self.idol_local_names: Dict[int, Dict[str, Set[int]]] = {}  # {server_id: {lowercased alias: {idol ids}}}
+        self.group_local_names: Dict[int, Dict[str, Set[int]]] = {}  # {server_id: {lowercased alias: {group ids}}}
+        # substring matchers of the same names for finding every idol/group mentioned in a message in one pass.
+        self.idol_matcher: models.PhraseMatcher = models.PhraseMatcher()  # matches to idol ids
+        self.group_matcher: models.PhraseMatcher = models.PhraseMatcher()  # matches to group ids
+        self.idol_local_matchers: Dict[int, models.PhraseMatcher] = {}  # {server_id: matcher of local aliases}
+        self.group_local_matchers: Dict[int, models.PhraseMatcher] = {}  # {server_id: matcher of local aliases}
+        # typo tolerant index of all idol/group names. None until it is (re)built on the next fuzzy search.
+        self.fuzzy_index: Optional[models.FuzzyIndex] = None
+        # bitsets of idol attributes for building game pools. None until it is (re)built on the next use.
+        self.idol_index: Optional[models.IdolIndex] = None
+        # samplers of the idols with photos. None until they are (re)built on the next draw.
+        self.idol_sampler: Optional[models.WeightedSampler] = None  # every idol is equally likely.
+        self.weighted_idol_sampler: Optional[models.WeightedSampler] = None  # weighted by photo count.
+        self.group_idol_samplers: Dict[int, models.WeightedSampler] = {}  # {group_id: sampler of its members}
+        self.card_idol_sampler: Optional[models.WeightedSampler] = None  # idols with an avatar for playing cards.
 
         # dict of restricted idol photo channels
         self.restricted_channels: Dict[int, list] = {}  # {channelid : [server_id, sendall]}
@@ -111,7 +141,9 @@ class Cache(Base):
         # Bias Game Objects
         self.bias_games: Dict[int, models.Game] = {}  # {channelid: Game}
         # BlackJack Game Objects
-        self.blackjack_games: List[models.BlackJackGame] = []
+        self.blackjack_games: Set[models.BlackJackGame] = set()  # games add themselves with u_blackjack.add_game
+        # {user_id: BlackJack Game the user is in}. Filled by u_blackjack.add_game and BlackJackGame.second_player.
+        self.blackjack_players: Dict[int, models.BlackJackGame] = {}
         # UnScramble Game Objects
         self.unscramble_games: Dict[int: models.Game] = {}  # {channelid: Game}
 
@@ -151,6 +183,14 @@ class Cache(Base):
         with open('locale_by_timezone.json') as json_file:
             self.locale_by_timezone = json.load(json_file)
 
+        # common timezones by their current abbreviation and utc offset. Rebuilt after the next DST transition.
+        self.timezones_by_abbreviation: Dict[str, Set[str]] = {}  # {abbreviation: {timezone names}}
+        self.timezones_by_offset: Dict[int, Set[str]] = {}  # {utc offset in seconds: {timezone names}}
+        self.timezone_index_expiry: float = 0  # unix timestamp of the next DST transition of a common timezone.
+        # date format of a locale and the names its directives need. Loaded once so the locale never has to be set
+        # when formatting. {locale: (date format, {directive: [names]})}
+        self.locale_date_formats: Dict[str, Tuple[str, Dict[str, List[str]]]] = {}
+
         # aliases for genders
         self.female_aliases = ['girl', 'girls', 'female', 'woman', 'women', 'girlgroup', 'girlgroups', 'f']
         self.male_aliases = ['male', 'm', 'men', 'boy', 'boys', 'boygroup', 'boygroups']
@@ -199,12 +239,18 @@ class Cache(Base):
         this issue.
         """
         self.user_notifications = []
+        # matchers of the notification phrases in a guild. {guild_id: PhraseMatcher(phrase -> {user_id})}
+        # messages are checked with these (u_notifications.check_message_notifications), not user_notifications.
+        self.notification_matchers: Dict[int, models.PhraseMatcher] = {}
         # mod mail user and channel {user_id: channel_id}
         self.mod_mail = {}
 
         self.languages = {}  # language packs
+        # compiled language pack messages. {(language, module, keyword): template}
+        self.language_templates: Dict[Tuple[str, str, str], models.MessageTemplate] = {}
 
         self.playing_cards = {}  # {card_id: [custom playing card 1, custom playing card 2]}
+        self.card_values: Dict[int, Tuple[str, int]] = {}  # {card_id: (card name, value)}
 
         # used for the loop to send idol photos to a text channel after t time.
         self.send_idol_photos = {}  # (text channel id OR discord.TextChannel) : [list of idol ids]
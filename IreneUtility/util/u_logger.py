@@ -1,20 +1,169 @@
 import logging
 import datetime
-import aiofiles
-import asyncio
+import atexit
+import collections
 import functools
 import inspect
+import queue
+import threading
+
+
+class LogWriter:
+    """Writes log lines in batches from a background thread while keeping one open file per log type.
+
+    Logging never blocks the event loop. If the queue is full, the line is dropped and counted instead.
+    """
+    def __init__(self, directory="Logs", max_queue_size=10000, batch_size=500):
+        """
+        :param directory: The directory of the log files.
+        :param max_queue_size: The max amount of lines waiting to be written.
+        :param batch_size: The max amount of lines written before the files are flushed.
+        """
+        self.directory = directory
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped = 0  # amount of lines dropped because the queue was full.
+        self._reported_dropped = 0
+        self._files = {}  # {log_type: (date, file)}
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def put(self, log_type, line):
+        """Queue a line to be written.
+
+        :param log_type: (str) The end of the file name that differentiates the type of logging it is.
+        :param line: (str) The line to write.
+        """
+        if not self._thread or not self._thread.is_alive():
+            # also restarts the writer if the thread died, otherwise the lines would pile up in the queue.
+            self.start()
+        try:
+            self.queue.put_nowait((log_type, line))
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self):
+        """Start the writer thread if it is not running."""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+            self._thread.start()
+
+    def flush(self):
+        """Wait until every queued line has been written."""
+        if self._thread and self._thread.is_alive():
+            self.queue.join()
+
+    def shutdown(self):
+        """Write the remaining lines, stop the writer thread, and close all files."""
+        if self._thread and self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join()
+        self._thread = None
+        for date, file in self._files.values():
+            file.close()
+        self._files = {}
+
+    def _get_file(self, log_type):
+        """Get the file of a log type and rotate to a new file if the date changed."""
+        today = datetime.date.today()
+        date, file = self._files.get(log_type, (None, None))
+        if date != today:
+            if file:
+                file.close()
+            file = open(f"{self.directory}/{today}-{log_type}.log", "a", encoding="utf-8")
+            self._files[log_type] = (today, file)
+        return file
+
+    def _write_batch(self, batch):
+        """Write a batch of lines and flush the files that were written to."""
+        if self.dropped != self._reported_dropped:
+            batch.append(("console", f"{datetime.datetime.now()} -- {self.dropped - self._reported_dropped} log "
+                                     f"lines were dropped because the log queue was full.\n"))
+            self._reported_dropped = self.dropped
+
+        written_files = set()
+        for log_type, line in batch:
+            try:
+                file = self._get_file(log_type)
+                file.write(line)
+                written_files.add(file)
+            except Exception as e:
+                print(f"{e} (Exception) - Failed to log. - {line} - u_logger.LogWriter")
+        for file in written_files:
+            file.flush()
+
+    def _run(self):
+        """Write lines from the queue until shut down."""
+        running = True
+        while running:
+            items = [self.queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            running = None not in items
+            try:
+                self._write_batch([item for item in items if item is not None])
+            except Exception as e:
+                print(f"{e} (Exception) - Failed to write a log batch. - u_logger.LogWriter")
+            finally:
+                for _ in items:
+                    self.queue.task_done()
+
+
+log_writer = LogWriter()
+atexit.register(log_writer.shutdown)
+
+# {method key: class} ordered from least to most recently used. It is bounded since the keys may be short-lived
+# functions (lambdas, closures) and the cache keeps them alive.
+_class_cache = collections.OrderedDict()
+_class_cache_size = 1024
+_class_cache_lock = threading.Lock()  # lines are also logged from the thread pools.
 
 
 def get_class(method):
     """
-    Returns the class that belongs to the method.
+    Returns the class that belongs to the method. Results are memoized per function and class of the instance.
     :param method: The method that needs to be checked.
-
-    REF -> https://stackoverflow.com/a/25959545/13159093
     """
     if isinstance(method, functools.partial):
         return get_class(method.func)
+
+    owner = getattr(method, '__self__', None)
+    if owner is not None and not inspect.ismodule(owner):
+        key = (getattr(method, '__func__', None) or getattr(method, '__name__', None), owner.__class__)
+    else:
+        key = method
+
+    try:
+        with _class_cache_lock:
+            method_class = _class_cache.get(key)
+            if method_class is not None:
+                _class_cache.move_to_end(key)
+                return method_class
+    except TypeError:
+        # unhashable
+        return find_class(method)
+
+    method_class = find_class(method)
+    with _class_cache_lock:
+        _class_cache[key] = method_class
+        if len(_class_cache) > _class_cache_size:
+            _class_cache.popitem(last=False)
+    return method_class
+
+
+def find_class(method):
+    """
+    Finds the class that belongs to the method.
+    :param method: The method that needs to be checked.
+
+    REF -> https://stackoverflow.com/a/25959545/13159093
+    """
     if inspect.ismethod(method) or (inspect.isbuiltin(method) and getattr(method, '__self__', None) is not None and getattr(method.__self__, '__class__', None)):
         for cls in inspect.getmro(method.__self__.__class__):
             if method.__name__ in cls.__dict__:
@@ -47,23 +196,13 @@ def info():
     logger.addHandler(handler)
 
 
-async def write_to_file(location, body_msg):
-    """Write a line to a file.
-
-    :param location: (str) File Location
-    :param body_msg: (str) Line that should be appended to the file.
-    """
-    async with aiofiles.open(location, "a+", encoding='utf-8') as file:
-        await file.write(body_msg)
-
-
 def manage_log(body_msg, log_type, method=None, event_loop=None):
     """Process the type of logging it is and writes to file.
 
     :param body_msg: (str) Line that should be appended to the file.
     :param log_type: (str) The end of the file name that differentiates the type of logging it is.
     :param method: The function/method that called this function.
-    :param event_loop: An existing event loop.
+    :param event_loop: No longer used since lines are written by the log writer thread. Kept for compatibility.
     """
     try:
         class_name = ""
@@ -76,9 +215,7 @@ def manage_log(body_msg, log_type, method=None, event_loop=None):
                 func_name = f"{method}"
         msg = f"{datetime.datetime.now()} -- {body_msg} " \
               f"{f'--> {class_name}.{func_name}' if method else ''}\n"
-        coroutine = write_to_file(f"Logs/{datetime.date.today()}-{log_type}.log",  msg)
-
-        asyncio.run_coroutine_threadsafe(coroutine, event_loop or asyncio.get_event_loop())
+        log_writer.put(log_type, msg)
     except Exception as e:
         print(f"{e} (Exception) - Failed to log. - {body_msg} - u_logger.manage_log")
 
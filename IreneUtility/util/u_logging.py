@@ -29,7 +29,9 @@ class Logging(Base):
                 self.ex.cache.logged_channels[server_id] = {"send_all": 1, "logging_channel": channel_id, "channels": []}
             else:
                 self.ex.cache.list_of_logged_channels.append(channel_id)
+                self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.LOGGED)
                 server['channels'].append(channel_id)
+            self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.LOGGED)
         else:
             await self.set_logging_status(server_id, 1)
             current_channel_id = self.ex.first_result(
@@ -42,9 +44,9 @@ class Logging(Base):
     async def check_if_logged(self, server_id=None, channel_id=None):  # only one parameter should be passed in
         """Check if a server or channel is being logged."""
         if channel_id:
-            return channel_id in self.ex.cache.list_of_logged_channels
+            return bool(self.ex.u_cache.get_channel_features(channel_id) & self.ex.u_objects.ChannelFeature.LOGGED)
         elif server_id:
-            return server_id in self.ex.cache.logged_channels
+            return bool(self.ex.u_cache.get_guild_features(server_id) & self.ex.u_objects.GuildFeature.LOGGED)
 
     async def get_send_all(self, server_id):
         return (self.ex.cache.logged_channels.get(server_id))['send_all']
@@ -53,13 +55,19 @@ class Logging(Base):
         """Set a server's logging status."""
         await self.ex.conn.execute("UPDATE logging.servers SET status = $1 WHERE serverid = $2", status, server_id)
         if not status:
-            self.ex.cache.logged_channels.pop(server_id, None)
+            server = self.ex.cache.logged_channels.pop(server_id, None)
+            self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.LOGGED, enabled=False)
+            for channel_id in (server or {}).get('channels') or []:
+                self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.LOGGED,
+                                                    enabled=False)
         else:
             logged_server = await self.ex.conn.fetchrow(
                 "SELECT id, serverid, channelid, sendall FROM logging.servers WHERE serverid = $1", server_id)
             channels = await self.ex.conn.fetch("SELECT channelid FROM logging.channels WHERE server = $1", logged_server[0])
             for channel in channels:
                 self.ex.cache.list_of_logged_channels.append(channel[0])
+                self.ex.u_cache.set_channel_feature(channel[0], self.ex.u_objects.ChannelFeature.LOGGED)
+            self.ex.u_cache.set_guild_feature(logged_server[1], self.ex.u_objects.GuildFeature.LOGGED)
             self.ex.cache.logged_channels[logged_server[1]] = {
                 "send_all": logged_server[3],
                 "logging_channel": logged_server[2],
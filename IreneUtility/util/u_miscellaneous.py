@@ -12,7 +12,27 @@ class Miscellaneous(Base):
 
     async def check_if_temp_channel(self, channel_id):
         """Check if a channel is a temp channel"""
-        return self.ex.cache.temp_channels.get(channel_id) is not None  # do not change structure
+        return bool(self.ex.u_cache.get_channel_features(channel_id) & self.ex.u_objects.ChannelFeature.TEMP_CHANNEL)
+
+    def add_temp_channel(self, channel_id, delay):
+        """Add a temp channel to cache.
+
+        This and remove_temp_channel are the only writers of cache.temp_channels so that the TEMP_CHANNEL feature
+        always matches it.
+
+        :param channel_id: The channel id.
+        :param delay: The amount of seconds before a message is deleted. At least 60 seconds.
+        """
+        self.ex.cache.temp_channels[channel_id] = max(delay, 60)
+        self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.TEMP_CHANNEL)
+
+    def remove_temp_channel(self, channel_id):
+        """Remove a temp channel from cache.
+
+        :param channel_id: The channel id.
+        """
+        self.ex.cache.temp_channels.pop(channel_id, None)
+        self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.TEMP_CHANNEL, enabled=False)
 
     async def delete_temp_messages(self, message):
         """Delete messages that are temp channels"""
@@ -20,34 +40,36 @@ class Miscellaneous(Base):
             await message.delete(delay=self.ex.cache.temp_channels.get(message.channel.id))
 
     async def get_disabled_server_interactions(self, server_id):
-        """Get a server's disabled interactions."""
-        interactions = await self.ex.conn.fetchrow("SELECT interactions FROM general.disabledinteractions WHERE serverid = $1", server_id)
-        return self.ex.first_result(interactions)
+        """Get a server's disabled interactions as a comma separated string."""
+        interactions = self.ex.cache.disabled_interactions.get(server_id)
+        return ','.join(sorted(interactions)) if interactions else None
 
     async def disable_interaction(self, server_id, interaction):
         """Disable an interaction (to a specific server)"""
         interaction = interaction.lower()
-        interactions = await self.get_disabled_server_interactions(server_id)
+        interactions = self.ex.cache.disabled_interactions.get(server_id) or frozenset()
+        if interaction in interactions:
+            return
+        new_interactions = interactions | {interaction}
         if not interactions:
-            await self.ex.conn.execute("INSERT INTO general.disabledinteractions(serverid, interactions) VALUES ($1, $2)", server_id, interaction)
+            await self.ex.sql.s_miscellaneous.add_disabled_interactions(server_id, interaction)
         else:
-            interactions = interactions.split(',')
-            interactions.append(interaction)
-            interactions = ','.join(interactions)
-            await self.ex.conn.execute("UPDATE general.disabledinteractions SET interactions = $1 WHERE serverid = $2", interactions, server_id)
+            await self.ex.sql.s_miscellaneous.update_disabled_interactions(server_id,
+                                                                           ','.join(sorted(new_interactions)))
+        self.ex.cache.disabled_interactions[server_id] = new_interactions
 
     async def enable_interaction(self, server_id, interaction):
         """Reenable an interaction that was disabled by a server"""
-        interactions = await self.get_disabled_server_interactions(server_id)
-        if not interactions:
+        interactions = self.ex.cache.disabled_interactions.get(server_id)
+        if not interactions or interaction not in interactions:
             return
-        interactions = interactions.split(',')
-        interactions.remove(interaction)
-        interactions = ','.join(interactions)
-        if not interactions:
-            return await self.ex.conn.execute("DELETE FROM general.disabledinteractions WHERE serverid = $1", server_id)
-        await self.ex.conn.execute("UPDATE general.disabledinteractions SET interactions = $1 WHERE serverid = $2",
-                              interactions, server_id)
+        new_interactions = interactions - {interaction}
+        if not new_interactions:
+            await self.ex.sql.s_miscellaneous.delete_disabled_interactions(server_id)
+            self.ex.cache.disabled_interactions.pop(server_id, None)
+            return
+        await self.ex.sql.s_miscellaneous.update_disabled_interactions(server_id, ','.join(sorted(new_interactions)))
+        self.ex.cache.disabled_interactions[server_id] = new_interactions
 
     async def interact_with_user(self, ctx, user, interaction, interaction_type, self_interaction=False):
         await self.ex.u_patreon.reset_patreon_cooldown(ctx)
@@ -76,23 +98,24 @@ class Miscellaneous(Base):
             return await ctx.send(msg)
 
     async def add_command_count(self, command_name):
-        """Add 1 to the specific command count and to the count of the current minute."""
+        """Add 1 to the specific command count and to the count of the current minute.
+
+        The DB is updated in the next counter flush.
+        """
         self.ex.cache.commands_per_minute += 1
         session_id = await self.ex.u_cache.get_session_id()
-        command_count = self.ex.cache.command_counter.get(command_name)
-        if not command_count:
-            await self.ex.conn.execute("INSERT INTO stats.commands(sessionid, commandname, count) VALUES($1, $2, $3)", session_id, command_name, 1)
-            self.ex.cache.command_counter[command_name] = 1
-        else:
-            await self.ex.conn.execute("UPDATE stats.commands SET count = $1 WHERE commandname = $2 AND sessionid = $3", command_count + 1, command_name, session_id)
-            self.ex.cache.command_counter[command_name] += 1
+        self.ex.cache.command_counter[command_name] = (self.ex.cache.command_counter.get(command_name) or 0) + 1
+        await self.ex.u_counters.add_command_use(session_id, command_name)
 
     async def add_session_count(self):
-        """Adds one to the current session count for commands used and for the total used."""
+        """Adds one to the current session count for commands used and for the total used.
+
+        The DB is updated in the next counter flush.
+        """
         session_id = await self.ex.u_cache.get_session_id()
         self.ex.cache.current_session += 1
         self.ex.cache.total_used += 1
-        await self.ex.conn.execute("UPDATE stats.sessions SET session = $1, totalused = $2 WHERE sessionid = $3", self.ex.cache.current_session, self.ex.cache.total_used, session_id)
+        await self.ex.u_counters.add_session_use(session_id)
 
     async def process_commands(self, message):
         message_sender = message.author
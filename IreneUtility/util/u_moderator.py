@@ -35,11 +35,14 @@ class Moderator(Base):
 
         Will return True if channel has games enabled.
         """
-        if channel_id in self.ex.cache.channels_with_disabled_games:
+        if self.ex.u_cache.get_channel_features(channel_id) & self.ex.u_objects.ChannelFeature.GAMES_DISABLED:
             await self.ex.sql.s_moderator.enable_game_in_channel(channel_id)
             self.ex.cache.channels_with_disabled_games.remove(channel_id)
+            self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.GAMES_DISABLED,
+                                                enabled=False)
             return True
         else:
             await self.ex.sql.s_moderator.disable_game_in_channel(channel_id)
             self.ex.cache.channels_with_disabled_games.append(channel_id)
+            self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.GAMES_DISABLED)
             return False
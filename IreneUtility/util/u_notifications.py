@@ -0,0 +1,148 @@
+from typing import Dict, List, Tuple
+
+from ..Base import Base
+from . import u_logger as log
+
+
+# noinspection PyBroadException,PyPep8
+class Notifications(Base):
+    """Phrases users want to be notified of when they are said in a guild.
+
+    Every guild has its own PhraseMatcher (phrase -> user ids), so a message is scanned once no matter how many
+    phrases the guild has, and adding/removing a phrase only rebuilds the matcher of that guild.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+
+    async def add_notification(self, guild_id, user_id, phrase):
+        """Add a phrase a user should be notified of in a guild.
+
+        :param guild_id: The guild id.
+        :param user_id: The user id.
+        :param phrase: The phrase to be notified of.
+        """
+        phrase = phrase.lower()
+        await self.ex.sql.s_user.add_notification(guild_id, user_id, phrase)
+        await self.cache_notification(guild_id, user_id, phrase)
+
+    async def remove_notification(self, guild_id, user_id, phrase):
+        """Remove a phrase a user is notified of in a guild.
+
+        :param guild_id: The guild id.
+        :param user_id: The user id.
+        :param phrase: The phrase that is no longer needed.
+        """
+        phrase = phrase.lower()
+        await self.ex.sql.s_user.delete_notification(guild_id, user_id, phrase)
+        await self.uncache_notification(guild_id, user_id, phrase)
+
+    async def cache_notification(self, guild_id, user_id, phrase):
+        """Add a user notification to cache.
+
+        :param guild_id: The guild id.
+        :param user_id: The user id.
+        :param phrase: The phrase to be notified of.
+        """
+        phrase = phrase.lower()
+        user = await self.ex.get_user(user_id)
+        user.notifications.append([guild_id, phrase])
+        self.ex.cache.user_notifications.append([guild_id, user_id, phrase])  # full list.
+
+        matcher = self.ex.cache.notification_matchers.get(guild_id)
+        if matcher is None:
+            matcher = self.ex.cache.notification_matchers[guild_id] = self.ex.u_objects.PhraseMatcher()
+        matcher.add(phrase, user_id)
+        self.ex.u_cache.set_guild_feature(guild_id, self.ex.u_objects.GuildFeature.USER_NOTIFICATIONS)
+
+    async def uncache_notification(self, guild_id, user_id, phrase):
+        """Remove a user notification from cache.
+
+        :param guild_id: The guild id.
+        :param user_id: The user id.
+        :param phrase: The phrase that is no longer needed.
+        """
+        phrase = phrase.lower()
+        try:
+            user = await self.ex.get_user(user_id)
+            if [guild_id, phrase] in user.notifications:
+                user.notifications.remove([guild_id, phrase])
+            if [guild_id, user_id, phrase] in self.ex.cache.user_notifications:
+                self.ex.cache.user_notifications.remove([guild_id, user_id, phrase])
+        except Exception as e:
+            log.console(f"{e} (Exception)", method=self.uncache_notification)
+
+        matcher = self.ex.cache.notification_matchers.get(guild_id)
+        if matcher is None:
+            return
+        matcher.remove(phrase, user_id)
+        if not len(matcher):
+            self.ex.cache.notification_matchers.pop(guild_id, None)
+            self.ex.u_cache.set_guild_feature(guild_id, self.ex.u_objects.GuildFeature.USER_NOTIFICATIONS,
+                                              enabled=False)
+
+    @staticmethod
+    def is_word_char(char: str) -> bool:
+        """Check if a character is part of a word (same as a regex word character)."""
+        return char.isalnum() or char == "_"
+
+    def get_notification_hits(self, guild_id, message_content: str) -> List[Tuple[int, str]]:
+        """Get the users that should be notified of a message.
+
+        Phrases only count when they are a whole word/phrase of the message (ex: 'irene' does not match 'irenes').
+
+        :param guild_id: The guild id the message was sent in.
+        :param message_content: The content of the message.
+        :returns: (List[Tuple[int, str]]) [(user_id, phrase)] without duplicates.
+        """
+        matcher = self.ex.cache.notification_matchers.get(guild_id)
+        if matcher is None or not message_content:
+            return []
+
+        content = message_content.lower()
+        hits = []
+        found_phrases = set()
+        for start, phrase in matcher.iter_matches(content):
+            if phrase in found_phrases:
+                continue
+            end = start + len(phrase)
+            if start and self.is_word_char(content[start - 1]) and self.is_word_char(phrase[0]):
+                continue
+            if end < len(content) and self.is_word_char(content[end]) and self.is_word_char(phrase[-1]):
+                continue
+            found_phrases.add(phrase)
+            hits += [(user_id, phrase) for user_id in matcher.phrases[phrase]]
+        return hits
+
+    async def check_message_notifications(self, message):
+        """Main process for notifying users of the phrases said in a message.
+
+        The message is scanned once by the guild's matcher, and users are only notified if they are in the guild,
+        can read the channel, and did not send the message themselves.
+
+        :param message: The discord message.
+        """
+        try:
+            if not message.guild or message.author.bot:
+                return
+            if not self.ex.u_cache.get_guild_features(message.guild.id) & \
+                    self.ex.u_objects.GuildFeature.USER_NOTIFICATIONS:
+                return
+
+            user_phrases: Dict[int, List[str]] = {}
+            for user_id, phrase in self.get_notification_hits(message.guild.id, message.clean_content):
+                if user_id != message.author.id:
+                    user_phrases.setdefault(user_id, []).append(phrase)
+
+            for user_id, phrases in user_phrases.items():
+                member = message.guild.get_member(user_id)
+                if not member or not message.channel.permissions_for(member).read_messages:
+                    continue
+                dm_channel = await self.ex.get_dm_channel(user=member)
+                if not dm_channel:
+                    continue
+                title_desc = f"Phrase: {', '.join(phrases)}\nMessage Author: {message.author}\n\n" \
+                             f"**Message:** {message.clean_content}\n[Click to go to the Message]({message.jump_url})"
+                embed = await self.ex.create_embed(title="Phrase Found", title_desc=title_desc)
+                await dm_channel.send(embed=embed)
+        except Exception as e:
+            log.console(f"{e} (Exception)", method=self.check_message_notifications)
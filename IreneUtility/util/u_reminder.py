@@ -1,5 +1,14 @@
+from typing import Dict, List, Set, Tuple
+
 from ..Base import Base
 from . import u_logger as log
+from discord.ext import tasks
+import asyncio
+import bisect
+import functools
+import heapq
+import threading
+import time
 import re
 import pytz
 import parsedatetime
@@ -10,8 +19,35 @@ import random
 
 # noinspection PyBroadException,PyPep8
 class Reminder(Base):
+    # the locale is process-wide, so it is only ever changed while holding this lock.
+    locale_lock = threading.Lock()
+    # directives of a date format that depend on the locale and the nl_langinfo items they are made of.
+    locale_name_items = {
+        "%a": [f"ABDAY_{day}" for day in range(1, 8)],
+        "%A": [f"DAY_{day}" for day in range(1, 8)],
+        "%b": [f"ABMON_{month}" for month in range(1, 13)],
+        "%B": [f"MON_{month}" for month in range(1, 13)],
+    }
+    locale_directive_regex = re.compile(r"%[aAbBh%]")
+    default_locale = "en_US.utf8"  # locale of timezones without one.
+    # date format used before the locales are loaded. (en_US)
+    fallback_date_format = ("%m/%d/%Y", {
+        "%a": ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"],
+        "%A": ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"],
+        "%b": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
+        "%B": ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October",
+               "November", "December"],
+        "%h": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]})
+
     def __init__(self, *args):
         super().__init__(*args)
+        # min-heap of every scheduled reminder. [(due unix timestamp, remind_id, user_id)]
+        self.reminder_queue: List[Tuple[float, int, int]] = []
+        # ids of the reminders in the heap that were not removed. Removed reminders stay in the heap until they reach
+        # the top and are then skipped.
+        self.scheduled_reminders: Set[int] = set()
+        # set when a reminder is added that is due before the one the scheduler is currently waiting for.
+        self.reminder_added = asyncio.Event()
 
     @staticmethod
     async def determine_time_type(user_input):
@@ -76,7 +112,7 @@ class Reminder(Base):
             raise self.ex.exceptions.NoTimeZone
         cal = parsedatetime.Calendar()
         try:
-            datetime_obj, _ = cal.parseDT(datetimeString=time_input, tzinfo=pytz.timezone(user_timezone))
+            datetime_obj, _ = cal.parseDT(datetimeString=time_input, tzinfo=self.get_timezone(user_timezone))
             reminder_datetime = datetime_obj.astimezone(pytz.utc)
             return reminder_datetime
         except:
@@ -106,11 +142,51 @@ class Reminder(Base):
             pass
 
     @staticmethod
-    async def process_timezone_input(input_timezone, input_country_code=None):
+    @functools.lru_cache(maxsize=None)
+    def get_timezone(timezone_name):
+        """Get a pytz timezone. The timezone objects are cached so the name is only resolved once.
+
+        :param timezone_name: The name of the timezone.
+        :returns: (datetime.tzinfo)
+        """
+        return pytz.timezone(timezone_name)
+
+    def create_timezone_indexes(self):
+        """Index the common timezones by their current abbreviation and utc offset.
+
+        The indexes expire at the next DST transition of any common timezone since the abbreviations and offsets
+        change at that time.
+        """
+        timezones_by_abbreviation = {}
+        timezones_by_offset = {}
+        utc_now = datetime.datetime.now(pytz.utc).replace(tzinfo=None)
+        next_transition = None
+        for timezone_name in pytz.common_timezones:
+            timezone = self.get_timezone(timezone_name)
+            local_now = pytz.utc.localize(utc_now).astimezone(timezone)
+            timezones_by_abbreviation.setdefault(local_now.strftime("%Z"), set()).add(timezone_name)
+            timezones_by_offset.setdefault(int(local_now.utcoffset().total_seconds()), set()).add(timezone_name)
+
+            transition_times = getattr(timezone, '_utc_transition_times', None)
+            if transition_times:
+                index = bisect.bisect_right(transition_times, utc_now)
+                if index < len(transition_times) and (not next_transition or
+                                                      transition_times[index] < next_transition):
+                    next_transition = transition_times[index]
+
+        self.ex.cache.timezones_by_abbreviation = timezones_by_abbreviation
+        self.ex.cache.timezones_by_offset = timezones_by_offset
+        self.ex.cache.timezone_index_expiry = pytz.utc.localize(next_transition).timestamp() \
+            if next_transition else float('inf')
+
+    def check_timezone_indexes(self):
+        """Rebuild the timezone indexes if they were never built or a DST transition has passed."""
+        if time.time() >= self.ex.cache.timezone_index_expiry:
+            self.create_timezone_indexes()
+
+    async def process_timezone_input(self, input_timezone, input_country_code=None):
         """Convert timezone abbreviation and country code to standard timezone name"""
-
-        def now_tz_str(time_zone):
-            return datetime.datetime.now(pytz.timezone(time_zone)).strftime("%Z")
+        self.check_timezone_indexes()
 
         try:
             input_timezone = input_timezone.upper()
@@ -118,26 +194,23 @@ class Reminder(Base):
         except:
             pass
 
+        name_matching_timezones = None
         # Format if user input is in GMT offset format
         if any(char.isdigit() for char in input_timezone):
             try:
                 timezone_offset = (re.findall(r"[+-]\d+", input_timezone))[0]
-                timezone_sign = timezone_offset[0]
-                timezone_value = timezone_offset[1:]
-                # Swap GMT and UTC definitions, which are inverted of each other
-                utc_offset = f"-{timezone_value}" if timezone_sign == "+" else f"+{timezone_value}"
-                input_timezone = 'Etc/GMT' + utc_offset
+                name_matching_timezones = self.ex.cache.timezones_by_offset.get(int(timezone_offset) * 3600)
             except:
                 pass
 
-        try:
-            name_matching_timezones = set(common_tz for common_tz in pytz.common_timezones
-                                          if now_tz_str(common_tz) == now_tz_str(input_timezone))
-        except pytz.exceptions.UnknownTimeZoneError:
-            name_matching_timezones = set(common_tz for common_tz in pytz.common_timezones
-                                          if now_tz_str(common_tz) == input_timezone)
-        except:
-            name_matching_timezones = None
+        if name_matching_timezones is None:
+            try:
+                abbreviation = datetime.datetime.now(self.get_timezone(input_timezone)).strftime("%Z")
+            except pytz.exceptions.UnknownTimeZoneError:
+                abbreviation = input_timezone
+            except:
+                abbreviation = None
+            name_matching_timezones = self.ex.cache.timezones_by_abbreviation.get(abbreviation) or set()
 
         # Find the timezones which share both same timezone input and the same country code
         if input_country_code:
@@ -161,50 +234,115 @@ class Reminder(Base):
     async def format_time(string_format, user_timezone, input_time: datetime.datetime = None):
         """ Format time according to the user timezone"""
         if not input_time:
-            return datetime.datetime.now(pytz.timezone(user_timezone)).strftime(string_format)
+            return datetime.datetime.now(Reminder.get_timezone(user_timezone)).strftime(string_format)
         else:
-            return input_time.astimezone(pytz.timezone(user_timezone)).strftime(string_format)
+            return input_time.astimezone(Reminder.get_timezone(user_timezone)).strftime(string_format)
+
+    @staticmethod
+    def load_locale_date_format(user_locale) -> Tuple[str, Dict[str, List[str]]]:
+        """Read the date format (%x) of a locale and the day/month names it uses.
+
+        The locale is only set for as long as it takes to read it and is then restored.
+
+        :param user_locale: The locale name (ex: ko_KR.utf8). Falls back to en_US and then C if it does not exist.
+        :returns: (Tuple[str, Dict[str, List[str]]]) (date format, {directive: [names]})
+        """
+        with Reminder.locale_lock:
+            previous_locale = locale.setlocale(locale.LC_TIME)
+            try:
+                for locale_name in [user_locale, 'en_US.utf8', 'C']:
+                    try:
+                        locale.setlocale(locale.LC_TIME, locale_name)
+                        break
+                    except locale.Error:
+                        continue
+                date_format = locale.nl_langinfo(locale.D_FMT)
+                names = {directive: [locale.nl_langinfo(getattr(locale, item)) for item in items]
+                         for directive, items in Reminder.locale_name_items.items()}
+                names["%h"] = names["%b"]
+                return date_format, names
+            finally:
+                locale.setlocale(locale.LC_TIME, previous_locale)
+
+    def create_locale_date_formats(self):
+        """Load the date format of every locale a timezone can have.
+
+        This is the only place the locale is changed, and it only happens once (on the first cache load) since the
+        locales of the timezones do not change. Locales are never loaded afterwards because strftime/strptime in
+        other threads would use the locale while it is changed.
+        """
+        if self.ex.cache.locale_date_formats:
+            return
+        user_locales = {self.get_user_locale(user_timezone) for user_timezone in self.ex.cache.locale_by_timezone}
+        user_locales.add(self.default_locale)
+        self.ex.cache.locale_date_formats = {user_locale: self.load_locale_date_format(user_locale)
+                                             for user_locale in user_locales}
+
+    def get_user_locale(self, user_timezone) -> str:
+        """Get the locale name of a timezone.
+
+        :param user_timezone: The name of the timezone.
+        :returns: (str) The locale name (ex: ko_KR.utf8)
+        """
+        user_locale = self.ex.cache.locale_by_timezone.get(user_timezone)
+        return f"{user_locale.replace('-', '_')}.utf8" if user_locale else self.default_locale
+
+    def get_locale_date_format(self, user_locale) -> Tuple[str, Dict[str, List[str]]]:
+        """Get the date format of a locale. Locales that were not loaded use the date format of en_US.
+
+        :param user_locale: The locale name (ex: ko_KR.utf8).
+        :returns: (Tuple[str, Dict[str, List[str]]]) (date format, {directive: [names]})
+        """
+        return self.ex.cache.locale_date_formats.get(user_locale) or \
+            self.ex.cache.locale_date_formats.get(self.default_locale) or self.fallback_date_format
+
+    @staticmethod
+    def format_locale_date(date_time: datetime.datetime, locale_date_format: Tuple[str, Dict[str, List[str]]]) -> str:
+        """Format a date with the date format of a locale without changing the locale.
+
+        :param date_time: The date to format.
+        :param locale_date_format: (date format, {directive: [names]}) from get_locale_date_format
+        :returns: (str) The formatted date.
+        """
+        date_format, names = locale_date_format
+
+        def replace_directive(match):
+            directive = match.group(0)
+            if directive == "%%":
+                return directive
+            # day names start on sunday while datetime weekdays start on monday.
+            index = (date_time.weekday() + 1) % 7 if directive in ("%a", "%A") else date_time.month - 1
+            return names[directive][index].replace("%", "%%")
+
+        return date_time.strftime(Reminder.locale_directive_regex.sub(replace_directive, date_format))
 
     async def get_locale_time(self, m_time, user_timezone=None):
         """ Return a string containing locale date format. For now, enforce all weekdays to be en_US format"""
-        # Set locale to server locale
         weekday_format = '%a'
-        date_format = '%x'
         time_format = '%I:%M:%S%p %Z'
-        locale.setlocale(locale.LC_ALL, '')
 
         if not user_timezone:
-            return m_time.strftime(f"{weekday_format} {date_format} {time_format}")
+            return m_time.strftime(f"{weekday_format} %x {time_format}")
 
-        # Use weekday format of server
-        weekday = await self.format_time(weekday_format, user_timezone, m_time)
+        user_time = m_time.astimezone(self.get_timezone(user_timezone))
 
         # Format date according to the locale of the user
-        user_locale = f"{(self.ex.cache.locale_by_timezone[user_timezone].replace('-', '_'))}.utf8"
-        try:
-            locale.setlocale(locale.LC_ALL, user_locale)  # Set to user locale
-        except:
-            locale.setlocale(locale.LC_ALL, 'en_US.utf8')
-        locale_date = await self.format_time(date_format, user_timezone, m_time)
-        locale.setlocale(locale.LC_ALL, '')  # Reset locale back to server locale
+        locale_date = self.format_locale_date(user_time,
+                                              self.get_locale_date_format(self.get_user_locale(user_timezone)))
 
-        # Use time format of the server
-        local_time = await self.format_time(time_format, user_timezone, m_time)
-        return f"{weekday} {locale_date} {local_time}"
+        # Use weekday and time format of the server
+        return f"{user_time.strftime(weekday_format)} {locale_date} {user_time.strftime(time_format)}"
 
     async def set_reminder(self, remind_reason, remind_time, user_id):
         """Add reminder date to cache and db."""
-        await self.ex.conn.execute("INSERT INTO reminders.reminders(userid, reason, timestamp) VALUES ($1, $2, $3)",
-                              user_id, remind_reason, remind_time)
-        remind_id = self.ex.first_result(await self.ex.conn.fetchrow(
-            "SELECT id FROM reminders.reminders WHERE userid=$1 AND reason=$2 AND timestamp=$3 ORDER BY id DESC",
-            user_id, remind_reason, remind_time))
+        remind_id = await self.ex.sql.s_reminder.add_reminder(user_id, remind_reason, remind_time)
         user = await self.ex.get_user(user_id)
         remind_info = [remind_id, remind_reason, remind_time]
         if user.reminders:
             user.reminders.append(remind_info)
         else:
             user.reminders = [remind_info]
+        self.schedule_reminder(remind_id, user_id, remind_time)
 
     async def get_reminders(self, user_id):
         """Get the reminders of a user"""
@@ -222,7 +360,110 @@ class Reminder(Base):
                         reminders.remove(reminder)
         except Exception as e:
             log.console(f"{e} (Exception)", method=self.remove_user_reminder)
+        self.unschedule_reminder(reminder_id)
         await self.ex.conn.execute("DELETE FROM reminders.reminders WHERE id = $1", reminder_id)
 
+    @staticmethod
+    def get_due_timestamp(remind_time) -> float:
+        """Get the unix timestamp of a reminder time.
+
+        :param remind_time: (datetime.datetime) Naive datetimes are treated as local time.
+        :returns: (float) unix timestamp
+        """
+        return remind_time.timestamp() if isinstance(remind_time, datetime.datetime) else float(remind_time)
+
+    def schedule_reminder(self, remind_id, user_id, remind_time):
+        """Add a reminder to the scheduler.
+
+        :param remind_id: The reminder id.
+        :param user_id: The user id.
+        :param remind_time: (datetime.datetime) When the reminder is due.
+        """
+        entry = (self.get_due_timestamp(remind_time), remind_id, user_id)
+        heapq.heappush(self.reminder_queue, entry)
+        self.scheduled_reminders.add(remind_id)
+        if self.reminder_queue[0] is entry:
+            # wake up the scheduler since it is waiting for a later reminder.
+            self.reminder_added.set()
+
+    def unschedule_reminder(self, remind_id):
+        """Remove a reminder from the scheduler.
+
+        The reminder stays in the heap until it reaches the top, unless the heap is mostly removed reminders.
+
+        :param remind_id: The reminder id.
+        """
+        self.scheduled_reminders.discard(remind_id)
+        if len(self.reminder_queue) > 2 * len(self.scheduled_reminders) + 64:
+            self.reminder_queue = [entry for entry in self.reminder_queue if entry[1] in self.scheduled_reminders]
+            heapq.heapify(self.reminder_queue)
+
+    def reset_reminder_queue(self):
+        """Remove every reminder from the scheduler."""
+        self.reminder_queue = []
+        self.scheduled_reminders = set()
+        self.reminder_added.set()
+
+    def pop_due_reminders(self) -> List[Tuple[float, int, int]]:
+        """Remove and return every reminder that is due.
+
+        :returns: (List[Tuple[float, int, int]]) [(due unix timestamp, remind_id, user_id)]
+        """
+        due_reminders = []
+        current_time = time.time()
+        while self.reminder_queue and self.reminder_queue[0][0] <= current_time:
+            entry = heapq.heappop(self.reminder_queue)
+            if entry[1] not in self.scheduled_reminders:
+                continue
+            self.scheduled_reminders.discard(entry[1])
+            due_reminders.append(entry)
+        return due_reminders
+
+    async def send_reminder(self, user_id, remind_id):
+        """DM a user their reminder and remove it.
+
+        :param user_id: The user id.
+        :param remind_id: The reminder id.
+        """
+        try:
+            reminders = await self.get_reminders(user_id) or []
+            reminder = next((reminder for reminder in reminders if reminder[0] == remind_id), None)
+            if reminder:
+                dm_channel = await self.ex.get_dm_channel(user_id=user_id)
+                if dm_channel:
+                    embed = await self.ex.create_embed(title="Reminder", title_desc=reminder[1])
+                    await dm_channel.send(embed=embed)
+        except Exception as e:
+            log.console(f"{e} (Exception) - Failed to send reminder {remind_id} to {user_id}.",
+                        method=self.send_reminder)
+
+        try:
+            await self.remove_user_reminder(user_id, remind_id)
+        except Exception as e:
+            # the reminder stays in the DB and is scheduled again when the reminder cache is recreated.
+            log.console(f"{e} (Exception) - Failed to remove reminder {remind_id} of {user_id}.",
+                        method=self.send_reminder)
+
+    @tasks.loop(seconds=0, minutes=0, hours=0, reconnect=True)
+    async def reminder_scheduler(self):
+        """Sleeps until the next reminder is due (or an earlier one is added) and sends the due reminders."""
+        while self.reminder_queue and self.reminder_queue[0][1] not in self.scheduled_reminders:
+            heapq.heappop(self.reminder_queue)
+
+        timeout = max(self.reminder_queue[0][0] - time.time(), 0) if self.reminder_queue else None
+        self.reminder_added.clear()
+        if timeout != 0:
+            try:
+                await asyncio.wait_for(self.reminder_added.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        for _, remind_id, user_id in self.pop_due_reminders():
+            # an error must not stop the loop since tasks.loop only restarts on connection errors.
+            try:
+                await self.send_reminder(user_id, remind_id)
+            except Exception as e:
+                log.console(f"{e} (Exception)", method=self.reminder_scheduler)
+
 
 # self.ex.u_reminder = Reminder()
@@ -0,0 +1,81 @@
+from typing import Callable, Dict, List, Tuple
+
+from ..Base import Base
+from . import u_logger as log
+import asyncio
+
+
+# noinspection PyBroadException,PyPep8
+class Router(Base):
+    """Routes messages to the games waiting for a message in a text channel.
+
+    client.wait_for runs the check of every waiting game against every message the bot receives. The router only
+    listens once and looks up the waiters of the message's channel, so a message in a channel without a game costs a
+    single dict lookup no matter how many games are running.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        # {channel_id: [(check, future)]} of the coroutines waiting for a message in a channel.
+        self.waiters: Dict[int, List[Tuple[Callable, asyncio.Future]]] = {}
+        self.listening = False
+
+    def start_listening(self):
+        """Listen to the messages the client receives."""
+        if self.listening:
+            return
+        self.ex.client.add_listener(self.dispatch_message, 'on_message')
+        self.listening = True
+
+    async def wait_for_message(self, channel_id, check, timeout=None):
+        """Wait for a message in a text channel. Used the same way as client.wait_for('message').
+
+        :param channel_id: The text channel id.
+        :param check: Function that is given the message and returns whether it is the message being waited for.
+        :param timeout: The amount of seconds to wait before raising asyncio.TimeoutError.
+        :returns: (discord.Message) The message that passed the check.
+        """
+        self.start_listening()
+        future = asyncio.get_running_loop().create_future()
+        waiter = (check, future)
+        self.waiters.setdefault(channel_id, []).append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self.remove_waiter(channel_id, waiter)
+
+    def remove_waiter(self, channel_id, waiter):
+        """Stop waiting for a message in a text channel.
+
+        :param channel_id: The text channel id.
+        :param waiter: (check, future) that was waiting.
+        """
+        channel_waiters = self.waiters.get(channel_id)
+        if not channel_waiters:
+            return
+        if waiter in channel_waiters:
+            channel_waiters.remove(waiter)
+        if not channel_waiters:
+            self.waiters.pop(channel_id, None)
+
+    async def dispatch_message(self, message):
+        """Give a message to the coroutines waiting for a message in its channel.
+
+        :param message: The discord message that was received.
+        """
+        channel_waiters = self.waiters.get(message.channel.id)
+        if not channel_waiters:
+            return
+
+        for waiter in channel_waiters.copy():
+            check, future = waiter
+            if future.done():
+                continue
+            try:
+                if not check(message):
+                    continue
+            except Exception as e:
+                log.console(f"{e} (Exception)", method=self.dispatch_message)
+                future.set_exception(e)
+            else:
+                future.set_result(message)
+            self.remove_waiter(message.channel.id, waiter)
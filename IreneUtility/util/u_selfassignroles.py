@@ -15,6 +15,7 @@ class SelfAssignRoles(Base):
         role_info = [role_id, role_name]
         await self.ex.conn.execute("INSERT INTO selfassignroles.roles(roleid, rolename, serverid) VALUES ($1, $2, $3)",
                               role_id, role_name, server_id)
+        self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.SELF_ASSIGN_ROLES)
         roles = await self.get_assignable_server_roles(server_id)
         if roles:
             roles.append(role_info)
@@ -60,6 +61,9 @@ class SelfAssignRoles(Base):
                 for role in roles:
                     if role[1].lower() == role_name.lower():
                         roles.remove(role)
+            if not roles:
+                self.ex.u_cache.set_guild_feature(server_id, self.ex.u_objects.GuildFeature.SELF_ASSIGN_ROLES,
+                                                  enabled=False)
 
     async def modify_channel_role(self, channel_id, server_id):
         """Add or Change a server's self-assignable role channel."""
@@ -69,7 +73,12 @@ class SelfAssignRoles(Base):
             if not cache_info:
                 self.ex.cache.assignable_roles[server_id] = {'channel_id': channel_id}
             else:
+                if cache_info.get('channel_id'):
+                    self.ex.u_cache.set_channel_feature(cache_info['channel_id'],
+                                                        self.ex.u_objects.ChannelFeature.SELF_ASSIGN_ROLES,
+                                                        enabled=False)
                 cache_info['channel_id'] = channel_id
+            self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.SELF_ASSIGN_ROLES)
 
         amount_of_results = self.ex.first_result(
             await self.ex.conn.fetchrow("SELECT COUNT(*) FROM selfassignroles.channels WHERE serverid = $1", server_id))
@@ -90,6 +99,8 @@ class SelfAssignRoles(Base):
             raise KeyError
 
         cache_info['channel_id'] = None
+        self.ex.u_cache.set_channel_feature(channel_id, self.ex.u_objects.ChannelFeature.SELF_ASSIGN_ROLES,
+                                            enabled=False)
         return await self.ex.conn.execute("DELETE FROM selfassignroles.channels WHERE serverid = $1", server_id)
 
     async def get_assignable_server_roles(self, server_id):
@@ -118,12 +129,8 @@ class SelfAssignRoles(Base):
     async def check_self_assignable_channel(self, server_id, channel):
         """Check if a channel is a self assignable role channel."""
         if server_id:
-            cache_info = self.ex.cache.assignable_roles.get(server_id)
-            if cache_info:
-                channel_id = cache_info.get('channel_id')
-                if channel_id:
-                    if channel_id == channel.id:
-                        return True
+            return bool(self.ex.u_cache.get_channel_features(channel.id) &
+                        self.ex.u_objects.ChannelFeature.SELF_ASSIGN_ROLES)
 
     @staticmethod
     async def check_member_has_role(member_roles, role_id):
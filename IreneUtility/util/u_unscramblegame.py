@@ -1,5 +1,4 @@
 from ..Base import Base
-from . import u_logger as log
 
 
 class UnScrambleGame(Base):
@@ -8,18 +7,7 @@ class UnScrambleGame(Base):
 
     async def update_user_unscramble_game_score(self, difficulty, user_id, score):
         """Update a user's unscramble game score."""
-        try:
-            user_scores = self.ex.cache.unscramble_game_counter.get(user_id)
-            # if the user does not exist, create them in the db & cache
-            if not user_scores:
-                await self.create_user_in_unscramble_game(user_id)
-                user_scores = {}  # set to default so getting current user score does not error.
-            difficulty_score = user_scores.get(difficulty) or 0
-            # difficulty score will always exist, no need to have a condition.
-            user_scores[difficulty] = difficulty_score + score
-            await self.update_user_score_in_db(difficulty, user_scores[difficulty], user_id)
-        except Exception as e:
-            log.console(f"{e} (Exception)", method=self.update_user_unscramble_game_score)
+        await self.ex.u_game_results.add_unscramble_game_scores(difficulty, {user_id: score})
 
     async def create_user_in_unscramble_game(self, user_id):
         """Inserts a user into the unscramble game db with no scores. This allows for updating scores easier."""
@@ -0,0 +1,79 @@
+"""Benchmark of typo tolerant name search: brute force Levenshtein vs the trigram FuzzyIndex.
+
+Uses a catalog of ~10k names (like the full, stage, and former names of the idols plus the group names and aliases)
+and searches for misspelled names.
+
+Run with IreneUtility installed (pip install -e .): python benchmarks/bench_fuzzy_search.py
+"""
+import random
+import statistics
+import string
+import time
+
+from IreneUtility.models import FuzzyIndex
+
+NAMES = 10000
+SEARCHES = 500
+LIMIT = 5
+
+
+def create_name(generator):
+    """A random romanized name of one to three syllables per word."""
+    syllables = ["ji", "min", "soo", "yeon", "hye", "seul", "gi", "ire", "ne", "wen", "dy", "ye", "ri", "joy", "na",
+                 "yu", "ki", "ha", "eun", "bin", "woo", "jin", "tae", "hyung", "kook", "da", "hyun", "chae", "young"]
+    words = [''.join(generator.choices(syllables, k=generator.randint(1, 3))) for _ in range(generator.randint(1, 2))]
+    return ' '.join(words)
+
+
+def misspell(generator, name):
+    """Replace a random character of a name."""
+    index = generator.randrange(len(name))
+    return name[:index] + generator.choice(string.ascii_lowercase) + name[index + 1:]
+
+
+def brute_force_search(names, name, limit):
+    """Compare the name with every name of the catalog."""
+    max_distance = min(3, max(1, len(name) // 4))
+    results = []
+    for value, catalog_name in enumerate(names):
+        distance = FuzzyIndex.get_distance(name, catalog_name, max_distance)
+        if distance <= max_distance:
+            results.append((value, distance))
+    return sorted(results, key=lambda value_distance: value_distance[1])[:limit]
+
+
+def main():
+    generator = random.Random(0)
+    names = [create_name(generator) for _ in range(NAMES)]
+    searches = [misspell(generator, generator.choice(names)) for _ in range(SEARCHES)]
+
+    start = time.perf_counter()
+    index = FuzzyIndex()
+    for value, name in enumerate(names):
+        index.add(name, value)
+    build_seconds = time.perf_counter() - start
+
+    index_results = []
+    search_seconds = []
+    for name in searches:
+        start = time.perf_counter()
+        index_results.append(index.search(name, LIMIT))
+        search_seconds.append(time.perf_counter() - start)
+    index_seconds = sum(search_seconds)
+
+    start = time.perf_counter()
+    brute_force_results = [brute_force_search(names, name, LIMIT) for name in searches]
+    brute_force_seconds = time.perf_counter() - start
+
+    assert [[distance for _, distance in results] for results in index_results] == \
+        [[distance for _, distance in results] for results in brute_force_results]
+    print(f"{NAMES} names ({len(index)} unique), {SEARCHES} misspelled searches, index built in "
+          f"{build_seconds * 1000:.0f} ms")
+    print(f"brute force Levenshtein: {brute_force_seconds / SEARCHES * 1000:.3f} ms per search")
+    print(f"FuzzyIndex:              {index_seconds / SEARCHES * 1000:.3f} ms per search "
+          f"({brute_force_seconds / index_seconds:.0f}x faster), "
+          f"median {statistics.median(search_seconds) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
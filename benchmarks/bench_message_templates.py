@@ -0,0 +1,71 @@
+"""Microbenchmark of rendering language pack messages: the old Utility.replace loop vs precompiled MessageTemplates.
+
+Run with IreneUtility installed (pip install -e .): python benchmarks/bench_message_templates.py
+"""
+import asyncio
+import time
+
+from IreneUtility.models import MessageTemplate
+
+RENDERS = 100000
+MESSAGES = [
+    ("**{name}** has **{integer}** {currency_name}.", [["name", "Irene"], ["integer", 12345],
+                                                       ["currency_name", "Dollars"]]),
+    ("**{name}**, you are now level **{integer}**.", [["name", "Irene"], ["integer", 5]]),
+    ("Type `{server_prefix}ggfilter` to disable your filter.", [["server_prefix", "%"]]),
+    ("**{name}** won **{integer}** {currency_name} from **{name2}** and now has **{integer2}**.",
+     [["name", "Irene"], ["integer", 50], ["currency_name", "Dollars"], ["name2", "Seulgi"], ["integer2", 100]]),
+]
+
+
+async def replace(text: str, inputs_to_change: list) -> str:
+    """Utility.replace before the templates."""
+    if not isinstance(inputs_to_change[0], list):
+        inputs_to_change = [[inputs_to_change[0], inputs_to_change[1]]]
+
+    for input_list in inputs_to_change:
+        await asyncio.sleep(0)  # bare yield to not block main thread
+        keyword = input_list[0]
+        custom_input = str(input_list[1])
+
+        keyword = keyword.replace("{", "")
+        keyword = keyword.replace("}", "")
+        text = text.replace("{" + keyword + "}", custom_input)
+    return text
+
+
+def get_replacements(inputs_to_change: list) -> dict:
+    """Utility.get_replacements"""
+    replacements = {}
+    for keyword, custom_input in inputs_to_change:
+        keyword = keyword.replace("{", "").replace("}", "")
+        replacements.setdefault(keyword, str(custom_input))
+    return replacements
+
+
+async def main():
+    templates = [(MessageTemplate(text), inputs_to_change) for text, inputs_to_change in MESSAGES]
+    renders = RENDERS // len(MESSAGES)
+
+    start = time.perf_counter()
+    for _ in range(renders):
+        for text, inputs_to_change in MESSAGES:
+            await replace(text, inputs_to_change)
+    replace_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(renders):
+        for template, inputs_to_change in templates:
+            template.render(get_replacements(inputs_to_change))
+    template_seconds = time.perf_counter() - start
+
+    for (text, inputs_to_change), (template, _) in zip(MESSAGES, templates):
+        assert template.render(get_replacements(inputs_to_change)) == await replace(text, inputs_to_change)
+    print(f"{RENDERS} renders")
+    print(f"Utility.replace loop: {replace_seconds / RENDERS * 1000000:.2f} us per message")
+    print(f"MessageTemplate:      {template_seconds / RENDERS * 1000000:.2f} us per message "
+          f"({replace_seconds / template_seconds:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
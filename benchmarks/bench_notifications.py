@@ -0,0 +1,64 @@
+"""Benchmark of user notification phrases: the per-phrase scan of cache.user_notifications vs the guild matchers.
+
+Simulates 100k phrases across 10k guilds and checks messages sent in random guilds.
+
+Run with IreneUtility installed (pip install -e .): python benchmarks/bench_notifications.py
+"""
+from types import SimpleNamespace
+import random
+import re
+import time
+
+from IreneUtility.models import PhraseMatcher
+from IreneUtility.util.u_notifications import Notifications
+
+GUILDS = 10000
+PHRASES = 100000
+MESSAGES = 2000
+WORDS = [f"word{index}" for index in range(20000)]
+
+
+def naive_hits(user_notifications, guild_id, message_content):
+    """The scan the matchers replace. Every phrase of every guild is checked against every message."""
+    content = message_content.lower()
+    hits = []
+    for phrase_guild_id, user_id, phrase in user_notifications:
+        if phrase_guild_id == guild_id and phrase in content and \
+                re.search(rf"(?<!\w){re.escape(phrase)}(?!\w)", content):
+            hits.append((user_id, phrase))
+    return hits
+
+
+def main():
+    generator = random.Random(0)
+    user_notifications = []
+    notification_matchers = {}
+    for _ in range(PHRASES):
+        guild_id = generator.randrange(GUILDS)
+        user_id = generator.randrange(GUILDS * 10)
+        phrase = " ".join(generator.sample(WORDS, generator.randint(1, 2)))
+        user_notifications.append([guild_id, user_id, phrase])
+        notification_matchers.setdefault(guild_id, PhraseMatcher()).add(phrase, user_id)
+    notifications = Notifications(SimpleNamespace(cache=SimpleNamespace(notification_matchers=notification_matchers)))
+
+    messages = [(generator.randrange(GUILDS), " ".join(generator.choices(WORDS, k=20))) for _ in range(MESSAGES)]
+    for matcher in notification_matchers.values():
+        matcher.build()
+
+    start = time.perf_counter()
+    matcher_results = [notifications.get_notification_hits(guild_id, content) for guild_id, content in messages]
+    matcher_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive_results = [naive_hits(user_notifications, guild_id, content) for guild_id, content in messages]
+    naive_seconds = time.perf_counter() - start
+
+    assert [sorted(set(hits)) for hits in matcher_results] == [sorted(set(hits)) for hits in naive_results]
+    print(f"{PHRASES} phrases across {GUILDS} guilds, {MESSAGES} messages")
+    print(f"per-phrase scan: {naive_seconds / MESSAGES * 1000:.3f} ms per message")
+    print(f"guild matchers:  {matcher_seconds / MESSAGES * 1000:.4f} ms per message "
+          f"({naive_seconds / matcher_seconds:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
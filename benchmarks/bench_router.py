@@ -0,0 +1,111 @@
+"""Benchmark of 1,000 concurrent games waiting for answers: client.wait_for vs the per-channel router.
+
+client.wait_for('message') keeps every pending check in one list and runs all of them for every message. The router
+only runs the checks of the games in the message's channel.
+
+Run with IreneUtility installed (pip install -e .): python benchmarks/bench_router.py
+"""
+from types import SimpleNamespace
+import asyncio
+import random
+import time
+
+from IreneUtility.util.u_router import Router
+
+GAMES = 1000
+MESSAGES = 20000
+CHANNELS = 5000  # channels messages are sent in. Games are in the first GAMES channels.
+
+
+class WaitFor:
+    """The way discord.py dispatches to client.wait_for('message') waiters."""
+    def __init__(self):
+        self.listeners = []  # [(future, check)]
+
+    async def wait_for(self, check):
+        future = asyncio.get_running_loop().create_future()
+        self.listeners.append((future, check))
+        return await future
+
+    def dispatch(self, message):
+        removed = []
+        for index, (future, check) in enumerate(self.listeners):
+            if future.cancelled():
+                removed.append(index)
+                continue
+            if check(message):
+                future.set_result(message)
+                removed.append(index)
+        for index in reversed(removed):
+            del self.listeners[index]
+
+
+def create_check(channel_id, answers):
+    """The check of a game. It only accepts answers in its own channel."""
+    def check(message):
+        return message.channel.id == channel_id and message.content.lower() in answers
+    return check
+
+
+def create_messages(generator):
+    """Messages in random channels. Most of them are not answers, like in a real bot."""
+    messages = []
+    for _ in range(MESSAGES):
+        channel_id = generator.randrange(CHANNELS)
+        content = "answer" if generator.random() < 0.01 else f"chatting {generator.random()}"
+        messages.append(SimpleNamespace(channel=SimpleNamespace(id=channel_id), content=content))
+    return messages
+
+
+async def run_games(wait, dispatch, messages):
+    """Start every game, send the messages, and return the seconds it took and the amount of answers received.
+
+    Games that receive an answer wait for the next one, like a new round.
+    """
+    answered = 0
+
+    async def play(channel_id):
+        nonlocal answered
+        check = create_check(channel_id, {"answer"})
+        while True:
+            await wait(channel_id, check)
+            answered += 1
+
+    games = [asyncio.create_task(play(channel_id)) for channel_id in range(GAMES)]
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for message in messages:
+        dispatch(message)
+        await asyncio.sleep(0)  # let the games that were answered wait again.
+    seconds = time.perf_counter() - start
+    for game in games:
+        game.cancel()
+    await asyncio.gather(*games, return_exceptions=True)
+    return seconds, answered
+
+
+async def main():
+    messages = create_messages(random.Random(0))
+
+    wait_for = WaitFor()
+    wait_for_seconds, wait_for_answered = await run_games(lambda channel_id, check: wait_for.wait_for(check),
+                                                          wait_for.dispatch, messages)
+
+    router = Router(SimpleNamespace(client=SimpleNamespace(add_listener=lambda *args: None)))
+    router_messages = []
+
+    def dispatch(message):
+        router_messages.append(asyncio.ensure_future(router.dispatch_message(message)))
+
+    router_seconds, router_answered = await run_games(router.wait_for_message, dispatch, messages)
+    await asyncio.gather(*router_messages)
+
+    assert wait_for_answered == router_answered
+    print(f"{GAMES} games, {MESSAGES} messages, {wait_for_answered} answers")
+    print(f"client.wait_for: {wait_for_seconds / MESSAGES * 1000:.4f} ms per message")
+    print(f"router:          {router_seconds / MESSAGES * 1000:.4f} ms per message "
+          f"({wait_for_seconds / router_seconds:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""Microbenchmark of drawing a random idol with photos: re-drawing until an idol has photos vs the alias samplers.
+
+Run with IreneUtility installed (pip install -e .): python benchmarks/bench_samplers.py
+"""
+from types import SimpleNamespace
+import random
+import time
+
+from IreneUtility.models import WeightedSampler
+
+IDOLS = 10000
+DRAWS = 200000
+WITH_PHOTOS = 0.2  # share of the idols that have photos.
+
+
+def redraw(idols):
+    """get_random_idol before the samplers (without the recursion so that it can not hit the recursion limit)."""
+    idol = random.choice(idols)
+    while not idol.photo_count:
+        idol = random.choice(idols)
+    return idol
+
+
+def main():
+    random.seed(0)
+    idols = [SimpleNamespace(photo_count=random.randint(1, 500) if random.random() < WITH_PHOTOS else 0)
+             for _ in range(IDOLS)]
+    idols_with_photos = [idol for idol in idols if idol.photo_count]
+
+    start = time.perf_counter()
+    for _ in range(DRAWS):
+        redraw(idols)
+    redraw_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    weights = [idol.photo_count for idol in idols_with_photos]
+    for _ in range(DRAWS):
+        random.choices(idols_with_photos, weights)
+    choices_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    uniform_sampler = WeightedSampler(idols_with_photos)
+    weighted_sampler = WeightedSampler(idols_with_photos, weights)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(DRAWS):
+        uniform_sampler.sample()
+    uniform_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(DRAWS):
+        weighted_sampler.sample()
+    weighted_seconds = time.perf_counter() - start
+
+    print(f"{IDOLS} idols ({len(idols_with_photos)} with photos), {DRAWS} draws, samplers built in "
+          f"{build_seconds * 1000:.1f} ms")
+    print(f"re-draw until photos:        {redraw_seconds / DRAWS * 1000000:.2f} us per draw")
+    print(f"random.choices by photos:    {choices_seconds / DRAWS * 1000000:.2f} us per draw")
+    print(f"WeightedSampler (uniform):   {uniform_seconds / DRAWS * 1000000:.2f} us per draw")
+    print(f"WeightedSampler (by photos): {weighted_seconds / DRAWS * 1000000:.2f} us per draw")
+
+
+if __name__ == "__main__":
+    main()
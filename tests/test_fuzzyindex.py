@@ -0,0 +1,122 @@
+import random
+import string
+
+from IreneUtility.models import FuzzyIndex
+
+
+def levenshtein(first, second):
+    """Plain Levenshtein distance without any early exit."""
+    previous_row = list(range(len(second) + 1))
+    for first_index, first_char in enumerate(first, 1):
+        current_row = [first_index]
+        for second_index, second_char in enumerate(second, 1):
+            current_row.append(min(previous_row[second_index] + 1, current_row[second_index - 1] + 1,
+                                   previous_row[second_index - 1] + (first_char != second_char)))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def brute_force_search(entries, name, server_id=None, max_distance=None):
+    """The brute force search that FuzzyIndex replaces. Returns {value: distance} of every close enough value."""
+    name = name.lower()
+    if max_distance is None:
+        max_distance = min(3, max(1, len(name) // 4))
+    best = {}
+    for entry_name, value, entry_server_id in entries:
+        if entry_server_id is not None and entry_server_id != server_id:
+            continue
+        distance = levenshtein(name, entry_name.lower())
+        if distance <= max_distance and distance < best.get(value, max_distance + 1):
+            best[value] = distance
+    return best
+
+
+def misspell(generator, name):
+    """Make up to two random edits to a name."""
+    for _ in range(generator.randint(0, 2)):
+        index = generator.randrange(len(name))
+        edit = generator.choice(["insert", "delete", "replace"])
+        if edit == "insert":
+            name = name[:index] + generator.choice(string.ascii_lowercase) + name[index:]
+        elif edit == "delete" and len(name) > 1:
+            name = name[:index] + name[index + 1:]
+        else:
+            name = name[:index] + generator.choice(string.ascii_lowercase) + name[index + 1:]
+    return name
+
+
+def create_entries(generator, amount):
+    """Random (name, value, server id) entries. Some values have several names and some names are local."""
+    entries = []
+    for value in range(amount):
+        for _ in range(generator.randint(1, 3)):
+            name = "".join(generator.choice("abcdefghij") for _ in range(generator.randint(4, 12)))
+            server_id = generator.choice([None, None, None, 1, 2])
+            entries.append((name, value, server_id))
+    return entries
+
+
+def create_index(entries):
+    index = FuzzyIndex()
+    for name, value, server_id in entries:
+        index.add(name, value, server_id)
+    return index
+
+
+def test_get_distance_equals_levenshtein():
+    generator = random.Random(0)
+    for _ in range(500):
+        first = "".join(generator.choice("abc") for _ in range(generator.randint(0, 8)))
+        second = "".join(generator.choice("abc") for _ in range(generator.randint(0, 8)))
+        assert FuzzyIndex.get_distance(first, second) == levenshtein(first, second)
+        distance = FuzzyIndex.get_distance(first, second, max_distance=2)
+        assert distance == levenshtein(first, second) or distance == 3 < levenshtein(first, second)
+
+
+def test_search_finds_every_close_value():
+    generator = random.Random(1)
+    entries = create_entries(generator, 200)
+    index = create_index(entries)
+    for _ in range(200):
+        query = misspell(generator, generator.choice(entries)[0])
+        server_id = generator.choice([None, 1, 2])
+        expected = brute_force_search(entries, query, server_id)
+        results = index.search(query, limit=len(entries), server_id=server_id)
+        assert {value: distance for value, distance in results} == expected
+
+
+def test_search_limit_keeps_closest_values():
+    generator = random.Random(2)
+    entries = create_entries(generator, 200)
+    index = create_index(entries)
+    for _ in range(200):
+        query = misspell(generator, generator.choice(entries)[0])
+        expected = sorted(brute_force_search(entries, query).values())[:3]
+        results = index.search(query, limit=3)
+        assert [distance for _, distance in results] == expected
+
+
+def test_search_ranks_closest_first():
+    index = FuzzyIndex()
+    index.add("Irene", "irene")
+    index.add("Seulgi", "seulgi")
+    index.add("Yeri", "yeri")
+    assert index.search("irenee")[0] == ("irene", 1)
+    assert index.search("seulgii") == [("seulgi", 1)]
+    assert index.search("wendy") == []
+
+
+def test_short_names_without_shared_trigrams():
+    index = FuzzyIndex()
+    index.add("dy", "dy")
+    index.add("gi", "gi")
+    assert index.search("my") == [("dy", 1)]
+    assert index.search("g") == [("gi", 1)]
+
+
+def test_local_names_only_found_in_their_server():
+    index = FuzzyIndex()
+    index.add("baechu", "irene", server_id=1)
+    assert index.search("baechuu") == []
+    assert index.search("baechuu", server_id=2) == []
+    assert index.search("baechuu", server_id=1) == [("irene", 1)]
@@ -0,0 +1,86 @@
+import random
+
+from IreneUtility.models import IdolIndex
+
+
+class Idol:
+    """The attributes of an Idol that the game pools are filtered by."""
+    def __init__(self, idol_id, gender, difficulty, photo_count, thumbnail, groups):
+        self.id = idol_id
+        self.gender = gender
+        self.difficulty = difficulty
+        self.photo_count = photo_count
+        self.thumbnail = thumbnail
+        self.groups = groups
+
+
+def create_idols(generator, amount):
+    """Random idols with the attributes the game pools are filtered by."""
+    return [Idol(idol_id, generator.choice(['f', 'm', None]), generator.choice(['easy', 'medium', 'hard', None]),
+                 generator.choice([0, 0, 1, 50]), generator.choice([None, "link"]),
+                 generator.sample(range(10), generator.randint(0, 3)))
+            for idol_id in range(amount)]
+
+
+def get_selections(idols):
+    """The gender and difficulty sets the pools were intersected from before the index."""
+    with_photos = {idol for idol in idols if idol.photo_count}
+    idols_medium = {idol for idol in with_photos if idol.difficulty in ['medium', 'easy']}
+    idols_easy = {idol for idol in with_photos if idol.difficulty == 'easy'}
+    gender_selection = {
+        'female': {idol for idol in with_photos if idol.gender == 'f'},
+        'male': {idol for idol in with_photos if idol.gender == 'm'},
+        'all': set(idols)
+    }
+    difficulty_selection = {'easy': idols_easy, 'e': idols_easy, 'medium': idols_medium, 'm': idols_medium,
+                            'hard': with_photos, 'h': with_photos}
+    return gender_selection, difficulty_selection
+
+
+def create_pool(idols, gender, difficulty, group_ids=None, thumbnail=False):
+    """GuessingGame.create_idol_pool before the index."""
+    gender_selection, difficulty_selection = get_selections(idols)
+    pool = gender_selection[gender] & difficulty_selection[difficulty]
+    if group_ids is not None:
+        pool &= {idol for idol in idols if set(idol.groups) & set(group_ids)}
+    if thumbnail:
+        pool = {idol for idol in pool if idol.thumbnail}
+    return pool
+
+
+def test_pools_equal_set_intersections():
+    generator = random.Random(0)
+    idols = create_idols(generator, 500)
+    index = IdolIndex(idols)
+    for gender in ['female', 'male', 'all']:
+        for difficulty in ['easy', 'e', 'medium', 'm', 'hard', 'h']:
+            for _ in range(10):
+                group_ids = generator.choice([None, [], generator.sample(range(12), generator.randint(1, 3))])
+                thumbnail = generator.choice([False, True])
+                pool = index.get_pool(gender, difficulty, group_ids, thumbnail)
+                assert len(pool) == len(set(pool))
+                assert set(pool) == create_pool(idols, gender, difficulty, group_ids, thumbnail)
+
+
+def test_unknown_selections_are_empty():
+    idols = create_idols(random.Random(1), 50)
+    index = IdolIndex(idols)
+    assert index.get_pool('unknown') == []
+    assert index.get_pool('all', 'unknown') == []
+
+
+def test_get_idols_keeps_ordinal_order():
+    idols = create_idols(random.Random(2), 100)
+    index = IdolIndex(idols)
+    assert len(index) == 100
+    assert index.get_idols(index.all) == idols
+    assert index.get_idols(0) == []
+    assert index.get_idols(1 << 99 | 1 << 3 | 1) == [idols[0], idols[3], idols[99]]
+
+
+def test_added_idols_are_in_pools():
+    index = IdolIndex()
+    idol = Idol(1, 'f', 'easy', 3, "link", [7])
+    index.add(idol)
+    assert index.get_pool('female', 'e', [7], thumbnail=True) == [idol]
+    assert index.get_pool('male') == []
@@ -0,0 +1,40 @@
+import random
+
+from IreneUtility.models import MessageTemplate
+
+
+def replace(text, inputs_to_change):
+    """The str.replace loop that MessageTemplate replaces (Utility.replace before the templates)."""
+    for keyword, custom_input in inputs_to_change:
+        keyword = keyword.replace("{", "").replace("}", "")
+        text = text.replace("{" + keyword + "}", str(custom_input))
+    return text
+
+
+def test_render_equals_replace():
+    # the content never forms a new placeholder with the text around it, since replace would also replace that one.
+    generator = random.Random(0)
+    keywords = ["name", "integer", "server_prefix", "a"]
+    for _ in range(2000):
+        pieces = [generator.choice(["Hello ", "{", "}", " ", "**", "!"] + ["{" + keyword + "}" for keyword in keywords])
+                  for _ in range(generator.randint(0, 12))]
+        text = "".join(pieces)
+        inputs_to_change = [[keyword, generator.choice(["Irene", "5", "%prefix", "**bold**"])]
+                            for keyword in generator.sample(keywords, generator.randint(0, len(keywords)))]
+        assert MessageTemplate(text).render(dict(inputs_to_change)) == replace(text, inputs_to_change)
+
+
+def test_placeholders_without_content_are_kept():
+    template = MessageTemplate("**{name}** has **{integer}** points.")
+    assert template.placeholders == ["name", "integer"]
+    assert template.render({"name": "Irene"}) == "**Irene** has **{integer}** points."
+    assert template.render({}) == template.text
+
+
+def test_content_is_not_rendered_again():
+    template = MessageTemplate("{name} {integer}")
+    assert template.render({"name": "{integer}", "integer": "5"}) == "{integer} 5"
+
+
+def test_from_text_reuses_templates():
+    assert MessageTemplate.from_text("{name} joined.") is MessageTemplate.from_text("{name} joined.")
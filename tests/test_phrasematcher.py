@@ -0,0 +1,85 @@
+import random
+
+from IreneUtility.models import PhraseMatcher
+
+
+def find_matches(phrases, text):
+    """The per-phrase scan that PhraseMatcher replaces. Returns every (start index, phrase) occurrence."""
+    matches = []
+    for phrase in phrases:
+        start = text.find(phrase)
+        while start != -1:
+            matches.append((start, phrase))
+            start = text.find(phrase, start + 1)
+    return sorted(matches)
+
+
+def create_phrases(generator, amount, alphabet="abc "):
+    """Create random phrases from a small alphabet so that they overlap and share prefixes/suffixes."""
+    return {"".join(generator.choice(alphabet) for _ in range(generator.randint(1, 5))) for _ in range(amount)}
+
+
+def test_matches_equal_per_phrase_scan():
+    generator = random.Random(0)
+    for _ in range(200):
+        phrases = create_phrases(generator, generator.randint(1, 30))
+        matcher = PhraseMatcher()
+        for phrase in phrases:
+            matcher.add(phrase, phrase)
+        text = "".join(generator.choice("abcd ") for _ in range(generator.randint(0, 60)))
+        assert sorted(matcher.iter_matches(text)) == find_matches(phrases, text)
+
+
+def test_search_returns_values_of_found_phrases():
+    matcher = PhraseMatcher()
+    matcher.add("irene", 1)
+    matcher.add("irene", 2)
+    matcher.add("seulgi", 3)
+    matcher.add("red velvet", 4)
+    assert matcher.search("irene and seulgi") == {"irene": {1, 2}, "seulgi": {3}}
+    assert matcher.search("red velvet") == {"red velvet": {4}}
+    assert matcher.search("wendy") == {}
+
+
+def test_overlapping_phrases():
+    matcher = PhraseMatcher()
+    for phrase in ["he", "she", "his", "hers"]:
+        matcher.add(phrase, phrase)
+    assert sorted(matcher.iter_matches("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_add_and_remove_rebuild_matcher():
+    generator = random.Random(1)
+    phrases = sorted(create_phrases(generator, 40))
+    matcher = PhraseMatcher()
+    current = set()
+    for _ in range(300):
+        phrase = generator.choice(phrases)
+        if phrase in current:
+            matcher.remove(phrase, 0)
+            current.discard(phrase)
+        else:
+            matcher.add(phrase, 0)
+            current.add(phrase)
+        text = "".join(generator.choice("abc ") for _ in range(30))
+        assert sorted(matcher.iter_matches(text)) == find_matches(current, text)
+        assert len(matcher) == len(current)
+
+
+def test_phrase_is_removed_with_its_last_value():
+    matcher = PhraseMatcher()
+    matcher.add("joy", 1)
+    matcher.add("joy", 2)
+    matcher.remove("joy", 1)
+    assert "joy" in matcher
+    assert matcher.search("joy") == {"joy": {2}}
+    matcher.remove("joy", 2)
+    assert "joy" not in matcher
+    assert matcher.search("joy") == {}
+
+
+def test_empty_phrases_are_ignored():
+    matcher = PhraseMatcher()
+    matcher.add("", 1)
+    assert not len(matcher)
+    assert list(matcher.iter_matches("anything")) == []
@@ -0,0 +1,63 @@
+from collections import Counter
+import random
+
+import pytest
+
+from IreneUtility.models import WeightedSampler
+
+
+def get_probabilities(sampler):
+    """The exact probability of drawing every item from the probability and alias tables."""
+    amount = len(sampler.items)
+    probabilities = [0.0] * amount
+    for index in range(amount):
+        if sampler.weights is None:
+            probabilities[index] += 1 / amount
+            continue
+        probabilities[index] += sampler._probabilities[index] / amount
+        probabilities[sampler._aliases[index]] += (1 - sampler._probabilities[index]) / amount
+    return probabilities
+
+
+def test_probabilities_equal_weights():
+    generator = random.Random(0)
+    for _ in range(200):
+        weights = [generator.choice([0, 1, 2, 5, 100, generator.random()]) for _ in range(generator.randint(1, 50))]
+        if not sum(weights):
+            continue
+        sampler = WeightedSampler(list(range(len(weights))), weights)
+        for probability, weight in zip(get_probabilities(sampler), weights):
+            assert probability == pytest.approx(weight / sum(weights), abs=1e-9)
+
+
+def test_items_without_weight_are_never_drawn():
+    random.seed(0)
+    sampler = WeightedSampler(["irene", "seulgi", "wendy"], [0, 3, 0])
+    assert {sampler.sample() for _ in range(1000)} == {"seulgi"}
+
+
+def test_draws_follow_weights():
+    # random.choices is the draw the sampler replaces.
+    random.seed(0)
+    items, weights = ["irene", "seulgi", "wendy", "joy", "yeri"], [10, 1, 5, 0, 4]
+    sampler = WeightedSampler(items, weights)
+    draws = 100000
+    sampled = Counter(sampler.sample() for _ in range(draws))
+    chosen = Counter(random.choices(items, weights, k=draws))
+    for item in items:
+        assert sampled[item] / draws == pytest.approx(chosen[item] / draws, abs=0.01)
+
+
+def test_items_are_equally_likely_without_weights():
+    sampler = WeightedSampler(["irene", "seulgi"])
+    assert get_probabilities(sampler) == [0.5, 0.5]
+    sampler = WeightedSampler(["irene", "seulgi"], [0, 0])
+    assert sampler.weights is None
+    assert get_probabilities(sampler) == [0.5, 0.5]
+
+
+def test_empty_sampler():
+    sampler = WeightedSampler([])
+    assert not len(sampler)
+    assert sampler.sample() is None
+    assert WeightedSampler([], []).sample() is None